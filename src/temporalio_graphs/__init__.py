@@ -92,6 +92,20 @@ def _validate_context(context: GraphBuildingContext) -> None:
         )
 
 
+def _write_output(result: str, output_file: Path | str) -> None:
+    """Write rendered output to disk, creating parent directories as needed.
+
+    Args:
+        result: Rendered output returned by the analyze_* entry point.
+        output_file: Destination file; an existing file is overwritten.
+    """
+    output_path = Path(output_file)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Encode once and write bytes directly, skipping the TextIOWrapper layer.
+    # Newlines are written as-is ("\n") on every platform.
+    output_path.write_bytes(result.encode("utf-8"))
+
+
 def analyze_workflow(
     workflow_file: Path | str,
     context: GraphBuildingContext | None = None,
@@ -234,9 +248,7 @@ def analyze_workflow(
 
     # Write to file if configured
     if context.graph_output_file is not None:
-        output_path = Path(context.graph_output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(result, encoding="utf-8")
+        _write_output(result, context.graph_output_file)
 
     return result
 
@@ -527,8 +539,6 @@ def analyze_workflow_graph(
 
     # Write to file if configured
     if context.graph_output_file is not None:
-        output_path = Path(context.graph_output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(result, encoding="utf-8")
+        _write_output(result, context.graph_output_file)
 
     return result
@@ -5,6 +5,7 @@ workflow graphs. These models are not part of the public API and should not be
 imported directly by library users.
 """
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -35,7 +36,34 @@ class NodeType(Enum):
     EXTERNAL_SIGNAL = "external_signal"
 
 
-@dataclass
+# Mermaid shape delimiters (opening, closing) for each node type, so rendering a
+# node is one dict lookup instead of a per-node dispatch on node_type.
+_NODE_BRACKETS: dict[NodeType, tuple[str, str]] = {
+    NodeType.START: ("((", "))"),
+    NodeType.END: ("((", "))"),
+    NodeType.ACTIVITY: ("[", "]"),
+    NodeType.DECISION: ("{", "}"),
+    NodeType.SIGNAL: ("{{", "}}"),
+    # Child workflow nodes render with double brackets (subroutine notation)
+    NodeType.CHILD_WORKFLOW: ("[[", "]]"),
+    # External signal nodes render with trapezoid (forward/backslash)
+    NodeType.EXTERNAL_SIGNAL: ("[/", "\\]"),
+}
+
+
+@functools.lru_cache(maxsize=4096)
+def _render_node(node_id: str, node_type: NodeType, display_name: str) -> str:
+    """Render a node definition once per distinct (id, type, label) triple.
+
+    The same node is emitted on every render of a workflow (and on every
+    regeneration of it), so the formatted fragment is memoized rather than
+    rebuilt from the bracket table each time.
+    """
+    opening, closing = _NODE_BRACKETS[node_type]
+    return f"{node_id}{opening}{display_name}{closing}"
+
+
+@dataclass(slots=True)
 class GraphNode:
     """Represents a single node in the workflow graph.
 
@@ -44,7 +72,8 @@ class GraphNode:
 
     The to_mermaid() method generates the correct Mermaid syntax for the node,
     following the .NET Temporalio.Graphs format for compatibility with regression
-    tests.
+    tests. The rendered fragment is memoized per (node_id, node_type,
+    display_name), so it is formatted once however many times it is emitted.
 
     Args:
         node_id: Unique identifier for this node in the graph. For activities,
@@ -105,21 +134,7 @@ class GraphNode:
             >>> GraphNode("1", NodeType.ACTIVITY, "ProcessOrder").to_mermaid()
             '1[ProcessOrder]'
         """
-        match self.node_type:
-            case NodeType.START | NodeType.END:
-                return f"{self.node_id}(({self.display_name}))"
-            case NodeType.ACTIVITY:
-                return f"{self.node_id}[{self.display_name}]"
-            case NodeType.DECISION:
-                return f"{self.node_id}{{{self.display_name}}}"
-            case NodeType.SIGNAL:
-                return f"{self.node_id}{{{{{self.display_name}}}}}"
-            case NodeType.CHILD_WORKFLOW:
-                # Child workflow nodes render with double brackets (subroutine notation)
-                return f"{self.node_id}[[{self.display_name}]]"
-            case NodeType.EXTERNAL_SIGNAL:
-                # External signal nodes render with trapezoid (forward/backslash)
-                return f"{self.node_id}[/{self.display_name}\\]"
+        return _render_node(self.node_id, self.node_type, self.display_name)
 
 
 @dataclass
@@ -215,7 +230,7 @@ class GraphEdge:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Activity:
     """Represents an activity invocation in a workflow.
 
@@ -248,7 +263,7 @@ class Activity:
     line_num: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecisionPoint:
     """Represents a decision point (branch) in a workflow.
 
@@ -297,7 +312,7 @@ class DecisionPoint:
     false_branch_activities: tuple[int, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalPoint:
     """Represents a signal/wait condition point in a workflow.
 
@@ -338,7 +353,7 @@ class SignalPoint:
     timeout_branch_activities: tuple[int, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ChildWorkflowCall:
     """Represents a child workflow execution call in a parent workflow.
 
@@ -378,7 +393,7 @@ class ChildWorkflowCall:
     parent_workflow: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExternalSignalCall:
     """Represents a peer-to-peer signal sent to an external workflow.
 
@@ -421,7 +436,7 @@ class ExternalSignalCall:
     source_workflow: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalConnection:
     """Represents a signal flow between two workflows.
 
@@ -458,7 +473,7 @@ class SignalConnection:
     receiver_node_id: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignalHandler:
     """Represents a @workflow.signal decorated method in a workflow class.
 
@@ -623,7 +638,7 @@ class WorkflowMetadata:
         return result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MultiWorkflowPath:
     """Represents a complete end-to-end execution path across multiple workflows.
 
@@ -633,7 +648,9 @@ class MultiWorkflowPath:
     to include all child workflow steps.
 
     The frozen=True attribute ensures MultiWorkflowPath instances are immutable,
-    preventing accidental modifications to path structure once created.
+    preventing accidental modifications to path structure once created. Inline
+    expansion can create up to max_paths instances, so the class uses slots to
+    avoid a per-instance __dict__.
 
     Args:
         path_id: Unique identifier for this end-to-end path (e.g., "mwpath_0", "mwpath_1").
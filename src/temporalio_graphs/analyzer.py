@@ -20,17 +20,17 @@ Example:
 """
 
 import ast
+import functools
 import logging
+import os
 import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 from temporalio_graphs._internal.graph_models import Activity, WorkflowMetadata
 from temporalio_graphs.detector import (
-    ChildWorkflowDetector,
-    DecisionDetector,
+    CompositeDetector,
     ExternalSignalDetector,
-    SignalDetector,
     SignalHandlerDetector,
 )
 from temporalio_graphs.exceptions import WorkflowParseError
@@ -40,6 +40,47 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Activity names longer than this emit a rendering-quality warning
+_MAX_ACTIVITY_NAME_LENGTH = 100
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_source(path: str, mtime_ns: int, size: int) -> ast.Module:
+    """Read and parse a workflow source file, memoized on its stat signature.
+
+    The modification time and size are part of the cache key only so that an
+    edited file produces a fresh entry; they are not otherwise used. Parsed
+    trees are shared between callers and must be treated as read-only.
+
+    Args:
+        path: Resolved path of the workflow source file.
+        mtime_ns: File modification time in nanoseconds (os.stat_result.st_mtime_ns).
+        size: File size in bytes.
+
+    Returns:
+        Parsed module AST of the file.
+
+    Raises:
+        PermissionError: If the file cannot be read.
+        SyntaxError: If the file is not valid Python.
+    """
+    # Parse the raw bytes: the parser decodes them itself (honouring a BOM or
+    # PEP 263 coding cookie), so no intermediate str copy is made.
+    return ast.parse(Path(path).read_bytes(), filename=path)
+
+
+class AnalyzerDebugInfo(NamedTuple):
+    """Source-location details recorded by the most recent WorkflowAnalyzer run.
+
+    Attributes:
+        line_numbers: Mapping of element names ("workflow_class",
+            "workflow_run_method") to their source line numbers.
+        activities: Detected activities in source order, with line numbers.
+    """
+
+    line_numbers: dict[str, int]
+    activities: list[Activity]
+
 
 class WorkflowAnalyzer(ast.NodeVisitor):
     """AST-based analyzer for extracting Temporal workflow structure.
@@ -58,6 +99,7 @@ class WorkflowAnalyzer(ast.NodeVisitor):
         _line_numbers: Dictionary mapping element names to source line numbers.
         _activities: List of tuples (activity_name, line_number) for detected activities.
         _activity_name_cache: Cache mapping AST node IDs to extracted activity names.
+        _resolved_paths: Cache mapping absolute input path strings to resolved Paths.
 
     Example:
         >>> analyzer = WorkflowAnalyzer()
@@ -76,6 +118,7 @@ class WorkflowAnalyzer(ast.NodeVisitor):
         self._inside_workflow_class: bool = False
         self._activities: list[Activity] = []
         self._activity_name_cache: dict[int, str] = {}
+        self._resolved_paths: dict[str, Path] = {}
 
     def analyze(
         self, workflow_file: Path | str, context: "GraphBuildingContext | None" = None
@@ -127,15 +170,10 @@ class WorkflowAnalyzer(ast.NodeVisitor):
             context = GraphBuildingContext()
 
         # Reset state for new analysis
-        self._workflow_class = None
-        self._workflow_run_method = None
-        self._line_numbers = {}
-        self._inside_workflow_class = False
-        self._activities = []
-        self._activity_name_cache = {}
+        self._reset_state()
 
         # Convert to absolute path
-        path = Path(workflow_file).resolve()
+        path = self._resolve_path(workflow_file)
         self._source_file = path
 
         # Validate file exists
@@ -147,17 +185,6 @@ class WorkflowAnalyzer(ast.NodeVisitor):
                 suggestion="Verify file path is correct and file exists",
             ) from FileNotFoundError(f"File not found: {path}")
 
-        # Validate file is readable
-        try:
-            source = path.read_text(encoding="utf-8")
-        except PermissionError as e:
-            raise WorkflowParseError(
-                file_path=path,
-                line=0,
-                message="Cannot read file (permission denied)",
-                suggestion="Check file permissions and ensure file is readable",
-            ) from e
-
         # Warn if file extension is not .py
         if path.suffix != ".py":
             logger.warning(
@@ -165,9 +192,18 @@ class WorkflowAnalyzer(ast.NodeVisitor):
                 f"Analysis may fail if file is not valid Python code."
             )
 
-        # Parse AST
+        # Read and parse the file. Parsed trees are cached per (path, mtime, size),
+        # so re-analyzing an unchanged file skips both I/O and ast.parse.
         try:
-            tree = ast.parse(source, filename=str(path))
+            stat = path.stat()
+            tree = _parse_source(str(path), stat.st_mtime_ns, stat.st_size)
+        except PermissionError as e:
+            raise WorkflowParseError(
+                file_path=path,
+                line=0,
+                message="Cannot read file (permission denied)",
+                suggestion="Check file permissions and ensure file is readable",
+            ) from e
         except SyntaxError as e:
             raise WorkflowParseError(
                 file_path=path,
@@ -176,6 +212,80 @@ class WorkflowAnalyzer(ast.NodeVisitor):
                 suggestion="Check workflow file for syntax errors",
             ) from e
 
+        return self._extract_metadata(tree, path, context)
+
+    def analyze_tree(
+        self,
+        tree: ast.Module,
+        workflow_file: Path | str,
+        context: "GraphBuildingContext | None" = None,
+    ) -> WorkflowMetadata:
+        """Extract workflow metadata from an already-parsed workflow module.
+
+        This is the post-parse half of analyze(). Callers that analyze the same
+        source repeatedly can parse it once (e.g. with ast.parse or
+        compile(..., flags=ast.PyCF_ONLY_AST)) and reuse the tree, skipping file
+        I/O and parsing on every call. The tree is only read, never modified.
+
+        Args:
+            tree: Parsed module AST of the workflow source file.
+            workflow_file: Path of the source file the tree was parsed from. Used
+                for metadata and error reporting; the file is not read.
+            context: Optional GraphBuildingContext with configuration options. If
+                None, uses default configuration (suppress_validation=False).
+
+        Returns:
+            WorkflowMetadata object with the same contents analyze() would return
+            for the source file.
+
+        Raises:
+            WorkflowParseError: If no @workflow.defn class or @workflow.run method
+                is found in the tree.
+
+        Example:
+            >>> import ast
+            >>> source = Path("workflows/my_workflow.py").read_text()
+            >>> tree = ast.parse(source)
+            >>> metadata = WorkflowAnalyzer().analyze_tree(tree, "workflows/my_workflow.py")
+            >>> print(metadata.workflow_class)
+            MyWorkflow
+        """
+        if context is None:
+            from temporalio_graphs.context import GraphBuildingContext
+
+            context = GraphBuildingContext()
+
+        self._reset_state()
+        path = self._resolve_path(workflow_file)
+        self._source_file = path
+
+        return self._extract_metadata(tree, path, context)
+
+    def _reset_state(self) -> None:
+        """Reset per-analysis state before a new workflow is analyzed."""
+        self._workflow_class = None
+        self._workflow_run_method = None
+        self._line_numbers = {}
+        self._inside_workflow_class = False
+        self._activities = []
+        self._activity_name_cache = {}
+
+    def _extract_metadata(
+        self, tree: ast.Module, path: Path, context: "GraphBuildingContext"
+    ) -> WorkflowMetadata:
+        """Traverse a parsed workflow module and build its WorkflowMetadata.
+
+        Args:
+            tree: Parsed module AST of the workflow source file.
+            path: Resolved path of the workflow source file.
+            context: GraphBuildingContext controlling validation warnings.
+
+        Returns:
+            WorkflowMetadata extracted from the tree.
+
+        Raises:
+            WorkflowParseError: If the workflow class or run method is missing.
+        """
         # Traverse AST to find workflow elements
         self.visit(tree)
 
@@ -201,21 +311,14 @@ class WorkflowAnalyzer(ast.NodeVisitor):
         # Activities are already Activity objects with line numbers
         activities = self._activities
 
-        # Detect decision points using DecisionDetector
-        decision_detector = DecisionDetector()
-        decision_detector.visit(tree)
-        decision_points = decision_detector.decisions
-
-        # Detect signal points using SignalDetector
-        signal_detector = SignalDetector()
-        signal_detector.visit(tree)
-        signal_points = signal_detector.signals
-
-        # Detect child workflow calls using ChildWorkflowDetector
-        child_workflow_detector = ChildWorkflowDetector()
-        child_workflow_detector.set_parent_workflow(self._workflow_class)
-        child_workflow_detector.visit(tree)
-        child_workflow_calls = child_workflow_detector.child_calls
+        # Detect decision points, signal points, and child workflow calls in a
+        # single traversal using CompositeDetector
+        composite_detector = CompositeDetector()
+        composite_detector.set_parent_workflow(self._workflow_class)
+        composite_detector.visit(tree)
+        decision_points = composite_detector.decisions
+        signal_points = composite_detector.signals
+        child_workflow_calls = composite_detector.child_calls
 
         # Detect external signal calls using ExternalSignalDetector
         external_signal_detector = ExternalSignalDetector()
@@ -240,13 +343,13 @@ class WorkflowAnalyzer(ast.NodeVisitor):
                     f"Consider adding execute_activity() calls or suppress this warning "
                     f"with context.suppress_validation=True.",
                     UserWarning,
-                    stacklevel=2,
+                    stacklevel=3,
                 )
 
-            # Warn about very long activity names that may render poorly
-            for activity in activities:
-                activity_name = activity.name
-                if len(activity_name) > 100:
+            # Warn about very long activity names that may render poorly. An
+            # activity called from several places is checked (and reported) once.
+            for activity_name in dict.fromkeys(activity.name for activity in activities):
+                if len(activity_name) > _MAX_ACTIVITY_NAME_LENGTH:
                     warnings.warn(
                         f"Activity name '{activity_name[:50]}...' is very long "
                         f"({len(activity_name)} chars). "
@@ -254,7 +357,7 @@ class WorkflowAnalyzer(ast.NodeVisitor):
                         f"Consider using shorter, descriptive names or suppress this warning "
                         f"with context.suppress_validation=True.",
                         UserWarning,
-                        stacklevel=2,
+                        stacklevel=3,
                     )
 
         # Calculate total paths from decisions + signals
@@ -275,6 +378,40 @@ class WorkflowAnalyzer(ast.NodeVisitor):
             total_paths=total_paths,
         )
 
+    @property
+    def debug_info(self) -> AnalyzerDebugInfo:
+        """Source-location details from the most recent analysis.
+
+        Returns:
+            AnalyzerDebugInfo with the line numbers and activities recorded by the
+            last analyze() or analyze_tree() call (empty before the first call).
+        """
+        return AnalyzerDebugInfo(self._line_numbers, self._activities)
+
+    def _resolve_path(self, workflow_file: Path | str) -> Path:
+        """Resolve a workflow file path, reusing earlier results for absolute inputs.
+
+        Path.resolve() walks every path component with lstat calls. Analyzers are
+        often reused on the same files, so resolved absolute inputs are cached per
+        instance. Relative inputs depend on the current working directory and are
+        always resolved afresh.
+
+        Args:
+            workflow_file: Path to workflow source file (relative or absolute).
+
+        Returns:
+            Absolute, resolved Path for the workflow file.
+        """
+        key = str(workflow_file)
+        cached = self._resolved_paths.get(key)
+        if cached is not None:
+            return cached
+
+        path = Path(workflow_file).resolve()
+        if os.path.isabs(key):
+            self._resolved_paths[key] = path
+        return path
+
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """Visit class definition nodes to find @workflow.defn decorated classes.
 
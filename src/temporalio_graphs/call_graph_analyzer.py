@@ -27,7 +27,7 @@ from temporalio_graphs._internal.graph_models import (
     WorkflowCallGraph,
     WorkflowMetadata,
 )
-from temporalio_graphs.analyzer import WorkflowAnalyzer
+from temporalio_graphs.analyzer import WorkflowAnalyzer, _parse_source
 from temporalio_graphs.context import GraphBuildingContext
 from temporalio_graphs.exceptions import ChildWorkflowNotFoundError, CircularWorkflowError
 
@@ -52,8 +52,17 @@ class WorkflowCallGraphAnalyzer:
 
     Attributes:
         _context: GraphBuildingContext with configuration including max_expansion_depth.
-        _visited_workflows: Set of workflow names in current analysis chain for cycle detection.
+        _visited_workflows: Workflow names on the current analysis chain, in call order,
+            for cycle detection. An insertion-ordered dict gives O(1) membership checks
+            while still yielding the chain for error messages.
         _current_depth: Current recursion depth (0 = entry workflow).
+        _ast_cache: Parsed module ASTs keyed by resolved file path, so each workflow
+            file is read and parsed at most once per analyze() call.
+        _resolved_paths: Resolved paths keyed by absolute input path, reset per
+            analyze() call.
+        _search_path_files: Python files found under each resolved search path,
+            reset per analyze() call.
+        _import_maps: Import maps keyed by resolved file path, reset per analyze() call.
 
     Example:
         >>> context = GraphBuildingContext(max_expansion_depth=2)
@@ -76,8 +85,12 @@ class WorkflowCallGraphAnalyzer:
                 limit for controlling recursion depth.
         """
         self._context = context
-        self._visited_workflows: set[str] = set()
+        self._visited_workflows: dict[str, None] = {}
         self._current_depth: int = 0
+        self._ast_cache: dict[Path, ast.Module] = {}
+        self._resolved_paths: dict[Path, Path] = {}
+        self._search_path_files: dict[Path, list[Path]] = {}
+        self._import_maps: dict[Path, dict[str, str]] = {}
 
     def analyze(
         self, entry_workflow: Path, search_paths: list[Path] | None = None
@@ -121,78 +134,85 @@ class WorkflowCallGraphAnalyzer:
             search_paths = [entry_workflow.parent]
 
         # Resolve entry workflow to absolute path for security (NFR-SEC-Epic6-1)
-        entry_workflow = entry_workflow.resolve()
+        entry_workflow = self._resolve_path(entry_workflow)
 
         # Reset state for new analysis
-        self._visited_workflows = set()
+        self._visited_workflows = {}
         self._current_depth = 0
 
-        # Analyze entry workflow to get root metadata
-        # First, check how many @workflow.defn classes are in the file
-        source = entry_workflow.read_text(encoding="utf-8")
-        tree = ast.parse(source, filename=str(entry_workflow))
-
-        workflow_classes = []
-        for node in tree.body:
-            if isinstance(node, ast.ClassDef):
-                # Check if decorated with @workflow.defn
-                for decorator in node.decorator_list:
-                    if (
-                        isinstance(decorator, ast.Attribute)
-                        and isinstance(decorator.value, ast.Name)
-                        and decorator.value.id == "workflow"
-                        and decorator.attr == "defn"
-                    ):
-                        workflow_classes.append(node.name)
-
-        # If multiple workflows in file, use the last one (convention) but isolate it
-        if len(workflow_classes) > 1:
-            target_workflow = workflow_classes[-1]
-            root_metadata = self._analyze_workflow_from_file(target_workflow, entry_workflow)
-        else:
-            # Single workflow, safe to analyze directly
-            analyzer = WorkflowAnalyzer()
-            root_metadata = analyzer.analyze(entry_workflow, self._context)
-
-        logger.info(
-            f"Starting multi-workflow analysis from entry workflow: "
-            f"{root_metadata.workflow_class}"
-        )
-        logger.debug(
-            f"Entry workflow has {len(root_metadata.child_workflow_calls)} child calls"
-        )
-
-        # Initialize call graph structures
-        child_workflows: dict[str, WorkflowMetadata] = {}
-        call_relationships: list[tuple[str, str]] = []
-        all_child_calls: list[ChildWorkflowCall] = []
+        try:
+            # Analyze entry workflow to get root metadata
+            # First, check how many @workflow.defn classes are in the file
+            tree = self._parse_file(entry_workflow)
+
+            workflow_classes = []
+            for node in tree.body:
+                if isinstance(node, ast.ClassDef):
+                    # Check if decorated with @workflow.defn
+                    for decorator in node.decorator_list:
+                        if (
+                            isinstance(decorator, ast.Attribute)
+                            and isinstance(decorator.value, ast.Name)
+                            and decorator.value.id == "workflow"
+                            and decorator.attr == "defn"
+                        ):
+                            workflow_classes.append(node.name)
+
+            # If multiple workflows in file, use the last one (convention) but isolate it
+            if len(workflow_classes) > 1:
+                target_workflow = workflow_classes[-1]
+                root_metadata = self._analyze_workflow_from_file(target_workflow, entry_workflow)
+            else:
+                # Single workflow, safe to analyze directly (reusing the parsed tree)
+                analyzer = WorkflowAnalyzer()
+                root_metadata = analyzer.analyze_tree(tree, entry_workflow, self._context)
 
-        # Collect child calls from root
-        all_child_calls.extend(root_metadata.child_workflow_calls)
+            logger.info(
+                f"Starting multi-workflow analysis from entry workflow: "
+                f"{root_metadata.workflow_class}"
+            )
+            logger.debug(
+                f"Entry workflow has {len(root_metadata.child_workflow_calls)} child calls"
+            )
 
-        # Recursively analyze child workflows
-        self._analyze_children(
-            parent_metadata=root_metadata,
-            parent_file=entry_workflow,
-            search_paths=search_paths,
-            child_workflows=child_workflows,
-            call_relationships=call_relationships,
-            all_child_calls=all_child_calls,
-        )
+            # Initialize call graph structures
+            child_workflows: dict[str, WorkflowMetadata] = {}
+            call_relationships: list[tuple[str, str]] = []
+            all_child_calls: list[ChildWorkflowCall] = []
+
+            # Collect child calls from root
+            all_child_calls.extend(root_metadata.child_workflow_calls)
+
+            # Recursively analyze child workflows
+            self._analyze_children(
+                parent_metadata=root_metadata,
+                parent_file=entry_workflow,
+                search_paths=search_paths,
+                child_workflows=child_workflows,
+                call_relationships=call_relationships,
+                all_child_calls=all_child_calls,
+            )
 
-        total_workflows = 1 + len(child_workflows)
+            total_workflows = 1 + len(child_workflows)
 
-        logger.info(
-            f"Multi-workflow analysis complete: {total_workflows} workflows discovered"
-        )
+            logger.info(
+                f"Multi-workflow analysis complete: {total_workflows} workflows discovered"
+            )
 
-        return WorkflowCallGraph(
-            root_workflow=root_metadata,
-            child_workflows=child_workflows,
-            call_relationships=call_relationships,
-            all_child_calls=all_child_calls,
-            total_workflows=total_workflows,
-        )
+            return WorkflowCallGraph(
+                root_workflow=root_metadata,
+                child_workflows=child_workflows,
+                call_relationships=call_relationships,
+                all_child_calls=all_child_calls,
+                total_workflows=total_workflows,
+            )
+        finally:
+            # File caches live for a single analysis: files may be edited, added
+            # or moved between calls on a reused analyzer.
+            self._ast_cache.clear()
+            self._import_maps.clear()
+            self._search_path_files.clear()
+            self._resolved_paths.clear()
 
     def _analyze_children(
         self,
@@ -228,7 +248,7 @@ class WorkflowCallGraphAnalyzer:
         # CRITICAL-2 FIX: Add parent to visited set for circular detection
         # This ensures children can detect if they try to call back to parent
         parent_workflow_name = parent_metadata.workflow_class
-        self._visited_workflows.add(parent_workflow_name)
+        self._visited_workflows[parent_workflow_name] = None
 
         # CRITICAL-1 FIX: Increment depth BEFORE processing children
         # Entry=0, Direct children=1, Grandchildren=2
@@ -240,9 +260,11 @@ class WorkflowCallGraphAnalyzer:
                 workflow_name = child_call.workflow_name
 
                 # Check for circular dependency (AC3)
+                # A name already on the current chain closes a cycle
                 if workflow_name in self._visited_workflows:
-                    # Build complete workflow chain for error message
-                    workflow_chain = list(self._visited_workflows) + [workflow_name]
+                    # Build the cycle from the first occurrence back to the repeated call
+                    chain = list(self._visited_workflows)
+                    workflow_chain = chain[chain.index(workflow_name) :] + [workflow_name]
                     logger.error(
                         f"Circular workflow reference detected: {' → '.join(workflow_chain)}"
                     )
@@ -259,8 +281,8 @@ class WorkflowCallGraphAnalyzer:
                     )
                     continue
 
-                # Add to visited set for cycle detection
-                self._visited_workflows.add(workflow_name)
+                # Add to current chain for cycle detection
+                self._visited_workflows[workflow_name] = None
 
                 try:
                     # Resolve child workflow file (AC2)
@@ -308,13 +330,13 @@ class WorkflowCallGraphAnalyzer:
                 finally:
                     # Backtracking: Remove from visited set after analysis completes (AC3)
                     # This allows same workflow called from different branches (DAG structure)
-                    self._visited_workflows.discard(workflow_name)
+                    self._visited_workflows.pop(workflow_name, None)
 
         finally:
             # CRITICAL-1 FIX: Decrement depth after processing all children
             self._current_depth -= 1
             # CRITICAL-2 FIX: Remove parent from visited set (backtracking)
-            self._visited_workflows.discard(parent_workflow_name)
+            self._visited_workflows.pop(parent_workflow_name, None)
 
     def _resolve_child_workflow_file(
         self,
@@ -354,7 +376,7 @@ class WorkflowCallGraphAnalyzer:
             logger.debug(
                 f"Child workflow {workflow_name} found in same file as parent: {parent_file}"
             )
-            return parent_file.resolve()
+            return self._resolve_path(parent_file)
 
         # Priority 2: Track imports and resolve via import statements
         import_map = self._build_import_map(parent_file)
@@ -386,6 +408,75 @@ class WorkflowCallGraphAnalyzer:
             parent_workflow=parent_file.stem,
         )
 
+    def _parse_file(self, file_path: Path) -> ast.Module:
+        """Parse a workflow file, reusing the cached AST if it was parsed before.
+
+        The same files are consulted repeatedly during one analysis (entry
+        workflow, same-file checks, import maps and search path scans), so each
+        file is read and parsed once and the tree is shared afterwards. Parsing
+        goes through the analyzer's module-level parse cache, so a file already
+        parsed by WorkflowAnalyzer (or by another call graph analysis) is not
+        read again while unchanged. Cached trees must be treated as read-only.
+
+        Args:
+            file_path: Path to Python file to parse.
+
+        Returns:
+            Parsed module AST.
+
+        Raises:
+            OSError: If the file cannot be read.
+            SyntaxError: If the file is not valid Python.
+        """
+        resolved = self._resolve_path(file_path)
+        tree = self._ast_cache.get(resolved)
+        if tree is None:
+            stat = resolved.stat()
+            tree = _parse_source(str(resolved), stat.st_mtime_ns, stat.st_size)
+            self._ast_cache[resolved] = tree
+        return tree
+
+    def _resolve_path(self, path: Path) -> Path:
+        """Resolve a path, reusing earlier results for absolute inputs.
+
+        Path.resolve() walks every path component with lstat calls, and the same
+        files and directories are resolved for every child workflow lookup
+        within one analysis. Relative inputs depend on the current working
+        directory and are always resolved afresh.
+
+        Args:
+            path: Path to resolve.
+
+        Returns:
+            Absolute, resolved Path.
+        """
+        cached = self._resolved_paths.get(path)
+        if cached is not None:
+            return cached
+
+        resolved = path.resolve()
+        if path.is_absolute():
+            self._resolved_paths[path] = resolved
+        return resolved
+
+    def _list_python_files(self, search_path: Path) -> list[Path]:
+        """List all .py files under a resolved search path, recursively.
+
+        The listing is taken once per search path and reused for every child
+        workflow resolved during the current analyze() call.
+
+        Args:
+            search_path: Resolved directory to list.
+
+        Returns:
+            Paths of all .py files under search_path, in rglob order.
+        """
+        files = self._search_path_files.get(search_path)
+        if files is None:
+            files = list(search_path.rglob("*.py"))
+            self._search_path_files[search_path] = files
+        return files
+
     def _is_workflow_in_file(self, workflow_name: str, file_path: Path) -> bool:
         """Check if workflow class is defined in the given file.
 
@@ -397,8 +488,7 @@ class WorkflowCallGraphAnalyzer:
             True if workflow class with @workflow.defn decorator found in file.
         """
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = self._parse_file(file_path)
 
             for node in ast.walk(tree):
                 if isinstance(node, ast.ClassDef) and node.name == workflow_name:
@@ -417,8 +507,10 @@ class WorkflowCallGraphAnalyzer:
         """Analyze a specific workflow class from a file that may contain multiple workflows.
 
         When multiple workflows are defined in the same file, we need to extract
-        just the target workflow. This method creates a temporary file with only
-        the target workflow class to ensure WorkflowAnalyzer processes the correct one.
+        just the target workflow. This method builds an in-memory module with only
+        the file's imports and the target workflow class, and hands it to
+        WorkflowAnalyzer.analyze_tree so the correct class is processed. Line
+        numbers in the result refer to the original file.
 
         Args:
             workflow_name: Name of the workflow class to analyze.
@@ -427,12 +519,9 @@ class WorkflowCallGraphAnalyzer:
         Returns:
             WorkflowMetadata for the specified workflow class.
         """
-        import tempfile
-
         try:
             # Read and parse the file
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = self._parse_file(file_path)
 
             # Find the target workflow class
             target_class = None
@@ -448,7 +537,7 @@ class WorkflowCallGraphAnalyzer:
                     parent_workflow=file_path.stem,
                 )
 
-            # Create a temporary file with just the target workflow class and necessary imports
+            # Build a module with just the target workflow class and necessary imports
             # Extract imports from original file
             imports = [
                 node
@@ -459,33 +548,20 @@ class WorkflowCallGraphAnalyzer:
             # Build new module with imports + target class
             new_tree = ast.Module(body=imports + [target_class], type_ignores=[])
 
-            # Write to temporary file
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".py", delete=False, dir=file_path.parent
-            ) as f:
-                f.write(ast.unparse(new_tree))
-                temp_file = Path(f.name)
-
-            try:
-                # Analyze the temporary file
-                analyzer = WorkflowAnalyzer()
-                metadata = analyzer.analyze(temp_file, self._context)
-
-                # Update source_file to point to original file (not temp)
-                # Create new metadata with correct source file
-                return WorkflowMetadata(
-                    workflow_class=metadata.workflow_class,
-                    workflow_run_method=metadata.workflow_run_method,
-                    activities=metadata.activities,
-                    decision_points=metadata.decision_points,
-                    signal_points=metadata.signal_points,
-                    child_workflow_calls=metadata.child_workflow_calls,
-                    source_file=file_path,  # Use original file path
-                    total_paths=metadata.total_paths,
-                )
-            finally:
-                # Clean up temporary file
-                temp_file.unlink()
+            # Analyze the isolated module in memory (no temporary file round-trip)
+            analyzer = WorkflowAnalyzer()
+            metadata = analyzer.analyze_tree(new_tree, file_path, self._context)
+
+            return WorkflowMetadata(
+                workflow_class=metadata.workflow_class,
+                workflow_run_method=metadata.workflow_run_method,
+                activities=metadata.activities,
+                decision_points=metadata.decision_points,
+                signal_points=metadata.signal_points,
+                child_workflow_calls=metadata.child_workflow_calls,
+                source_file=file_path,  # Use original file path
+                total_paths=metadata.total_paths,
+            )
 
         except Exception as e:
             logger.error(f"Error analyzing workflow {workflow_name} from {file_path}: {e}")
@@ -516,6 +592,8 @@ class WorkflowCallGraphAnalyzer:
 
         Parses parent file's AST for Import and ImportFrom nodes and builds
         a dictionary mapping imported class names to their module paths.
+        The map is built once per file per analyze() call and the same dict is
+        returned on later calls; callers must not modify it.
 
         Args:
             file_path: Path to parent workflow file.
@@ -529,11 +607,17 @@ class WorkflowCallGraphAnalyzer:
             >>> import_map = analyzer._build_import_map(Path("checkout.py"))
             >>> assert import_map["PaymentWorkflow"] == "workflows.payment"
         """
+        # Import maps are built once per file per analysis and shared by every child lookup
+        resolved = self._resolve_path(file_path)
+        cached = self._import_maps.get(resolved)
+        if cached is not None:
+            return cached
+
         import_map: dict[str, str] = {}
+        self._import_maps[resolved] = import_map
 
         try:
-            source = file_path.read_text(encoding="utf-8")
-            tree = ast.parse(source, filename=str(file_path))
+            tree = self._parse_file(resolved)
 
             for node in ast.walk(tree):
                 # Handle: from module import ClassName
@@ -557,7 +641,8 @@ class WorkflowCallGraphAnalyzer:
 
         except Exception as e:
             logger.warning(f"Error building import map from {file_path}: {e}")
-            return {}
+            import_map.clear()
+            return import_map
 
     def _resolve_module_to_file(
         self, module_path: str, parent_file: Path
@@ -620,10 +705,10 @@ class WorkflowCallGraphAnalyzer:
         """
         try:
             # Resolve search path for security (NFR-SEC-Epic6-1)
-            search_path = search_path.resolve()
+            search_path = self._resolve_path(search_path)
 
             # Recursively find all .py files in search path
-            for py_file in search_path.rglob("*.py"):
+            for py_file in self._list_python_files(search_path):
                 if self._is_workflow_in_file(workflow_name, py_file):
                     return py_file
 
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Literal
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GraphBuildingContext:
     r"""Configuration context for workflow graph generation.
 
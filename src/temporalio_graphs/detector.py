@@ -25,6 +25,8 @@ Example:
 
 import ast
 import logging
+import re
+import sys
 from pathlib import Path
 
 from temporalio_graphs._internal.graph_models import (
@@ -38,6 +40,79 @@ from temporalio_graphs.exceptions import InvalidSignalError, WorkflowParseError
 
 logger = logging.getLogger(__name__)
 
+# Callee names of awaited calls that count as activity invocations in a branch
+_ACTIVITY_CALL_NAMES = ("execute_activity", "execute_activity_method")
+
+# Textual wait_condition( call sites, for SignalDetector.count_candidates()
+_WAIT_CONDITION_CALL_RE = re.compile(r"\bwait_condition\s*\(")
+
+# Callee name marking a decision point. Identifier literals are interned, as are
+# Name.id / Attribute.attr strings produced by the parser, so the equality
+# checks against it resolve on the identity fast path.
+_TO_DECISION = "to_decision"
+
+# AST node types with no Call, If or Await descendants; the iterative walks never push them
+_LEAF_NODE_TYPES = (ast.expr_context, ast.Name, ast.Constant)
+
+
+def _push_children(stack: list[object], node: ast.AST) -> None:
+    """Push a node's children onto a traversal stack so they pop in source order.
+
+    An inlined ast.iter_child_nodes shared by the detectors' iterative walks.
+    Leaf nodes that can never contain a call, await or if statement (names,
+    constants, expression contexts) are not pushed. List fields are pushed
+    whole, so non-node entries (Global.names strings, Dict.keys None) reach
+    the stack and must be skipped by the caller.
+
+    Args:
+        stack: Traversal stack; the last element is visited next.
+        node: Node whose children should be visited next.
+    """
+    children: list[object] = []
+    for field in node._fields:
+        value = getattr(node, field, None)
+        if isinstance(value, list):
+            children.extend(value)
+        elif isinstance(value, ast.AST) and not isinstance(value, _LEAF_NODE_TYPES):
+            children.append(value)
+    children.reverse()
+    stack.extend(children)
+
+
+def _collect_activity_lines(nodes: list[ast.stmt]) -> list[int]:
+    """Collect line numbers of all execute_activity calls in a block.
+
+    Shared by DecisionDetector and SignalDetector to attribute activities to
+    the branches of an if statement. Walks the block with an explicit stack
+    in source order, so deeply nested expressions in a branch cannot exhaust
+    the interpreter stack.
+
+    Args:
+        nodes: List of AST statement nodes to search.
+
+    Returns:
+        List of line numbers where execute_activity is called.
+    """
+    activity_lines: list[int] = []
+    stack: list[object] = list(reversed(nodes))
+    while stack:
+        current = stack.pop()
+        if isinstance(current, ast.Await):
+            call = current.value
+            if isinstance(call, ast.Call):
+                # Check for workflow.execute_activity, execute_activity_method, or standalone
+                if isinstance(call.func, ast.Attribute):
+                    if call.func.attr in _ACTIVITY_CALL_NAMES:
+                        activity_lines.append(current.lineno)
+                elif isinstance(call.func, ast.Name):
+                    if call.func.id in _ACTIVITY_CALL_NAMES:
+                        activity_lines.append(current.lineno)
+        elif not isinstance(current, ast.AST):
+            # Non-node list entries (Global.names strings, Dict.keys None)
+            continue
+        _push_children(stack, current)
+    return activity_lines
+
 
 class DecisionDetector(ast.NodeVisitor):
     """Detects to_decision() helper calls in workflow AST.
@@ -71,6 +146,91 @@ class DecisionDetector(ast.NodeVisitor):
         # Map from decision line number to (true_branch_lines, false_branch_lines)
         self._decision_branches: dict[int, tuple[list[int], list[int]]] = {}
 
+    def visit(self, node: ast.AST) -> None:
+        """Traverse a tree iteratively, handling only If and Call nodes.
+
+        Overrides ast.NodeVisitor.visit so the per-node getattr dispatch and
+        recursive generic_visit are skipped for the vast majority of nodes,
+        which are irrelevant to decision detection. The arguments of a matched
+        to_decision() call are not descended into. Children are pushed in
+        reverse so nodes are handled in the same pre-order (source order) as
+        the recursive visitor, which keeps decision IDs sequential by position
+        and guarantees an If's branch activities are recorded before its
+        to_decision() call is processed.
+
+        Args:
+            node: Root AST node to traverse (typically an ast.Module).
+        """
+        stack: list[object] = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ast.Call):
+                # Classify inline so only actual to_decision() calls pay for
+                # a method call; every other Call is just traversed.
+                func = current.func
+                if (type(func) is ast.Name and func.id == _TO_DECISION) or (
+                    type(func) is ast.Attribute and func.attr == _TO_DECISION
+                ):
+                    self._process_call(current)
+                    # The arguments are the decision's own condition and name;
+                    # they hold no further decision points or If statements, so
+                    # the subtree is pruned rather than walked.
+                    continue
+            elif isinstance(current, ast.If):
+                self._record_decision_branches(current)
+            elif not isinstance(current, ast.AST):
+                # Non-node list entries (Global.names strings, Dict.keys None)
+                continue
+            _push_children(stack, current)
+
+    def clear(self) -> None:
+        """Reset detection state so the detector can analyze another tree.
+
+        Clears detected decisions and recorded branch activities in place and
+        restarts decision ID numbering at d0.
+        """
+        self._decisions.clear()
+        self._decision_branches.clear()
+        self._decision_counter = 0
+
+    @staticmethod
+    def quick_reject(source: str) -> bool:
+        """Return True if the source cannot contain a to_decision() call.
+
+        A substring check over the raw text: a True result means the source
+        never mentions to_decision, so parsing and traversal can be skipped.
+        False only means a decision point is possible.
+
+        Args:
+            source: Python source code of the workflow module.
+
+        Returns:
+            True if the source can be skipped without parsing.
+        """
+        return _TO_DECISION not in source
+
+    def detect_from_source(self, source: str) -> list[DecisionPoint]:
+        """Detect decision points directly from workflow source text.
+
+        Source that never mentions to_decision cannot contain a decision point,
+        so it is rejected with a substring check before any parsing or tree
+        traversal takes place.
+
+        Args:
+            source: Python source code of the workflow module.
+
+        Returns:
+            List of detected DecisionPoint objects (empty if none found).
+
+        Raises:
+            SyntaxError: If the source mentions to_decision but is not valid Python.
+            WorkflowParseError: If a to_decision() call is malformed.
+        """
+        if self.quick_reject(source):
+            return self.decisions
+        self.visit(ast.parse(source))
+        return self.decisions
+
     def visit_Call(self, node: ast.Call) -> None:
         """Visit Call nodes to identify to_decision() function calls.
 
@@ -78,6 +238,17 @@ class DecisionDetector(ast.NodeVisitor):
         if the call is to the to_decision() function and extracts decision metadata
         if found.
 
+        Args:
+            node: AST node representing a function call.
+        """
+        self._process_call(node)
+
+        # Continue traversal to find nested calls
+        self.generic_visit(node)
+
+    def _process_call(self, node: ast.Call) -> None:
+        """Record a DecisionPoint if the call is to to_decision().
+
         Args:
             node: AST node representing a function call.
         """
@@ -115,38 +286,6 @@ class DecisionDetector(ast.NodeVisitor):
                 # Re-raise parse errors with full context
                 raise e
 
-        # Continue traversal to find nested calls
-        self.generic_visit(node)
-
-    def _collect_activity_lines(self, nodes: list[ast.stmt]) -> list[int]:
-        """Collect line numbers of all execute_activity calls in a block.
-
-        Args:
-            nodes: List of AST statement nodes to search.
-
-        Returns:
-            List of line numbers where execute_activity is called.
-        """
-        activity_lines = []
-
-        class ActivityCollector(ast.NodeVisitor):
-            def visit_Await(self, node: ast.Await) -> None:
-                if isinstance(node.value, ast.Call):
-                    call = node.value
-                    # Check for workflow.execute_activity, execute_activity_method, or standalone
-                    if isinstance(call.func, ast.Attribute):
-                        if call.func.attr in ("execute_activity", "execute_activity_method"):
-                            activity_lines.append(node.lineno)
-                    elif isinstance(call.func, ast.Name):
-                        if call.func.id in ("execute_activity", "execute_activity_method"):
-                            activity_lines.append(node.lineno)
-                self.generic_visit(node)
-
-        collector = ActivityCollector()
-        for stmt in nodes:
-            collector.visit(stmt)
-        return activity_lines
-
     def visit_If(self, node: ast.If) -> None:
         """Visit If nodes to detect elif chains as separate decisions.
 
@@ -156,6 +295,26 @@ class DecisionDetector(ast.NodeVisitor):
 
         Also tracks which activities are in the true/false branches for control flow.
 
+        Args:
+            node: AST node representing an if/elif/else structure.
+        """
+        self._record_decision_branches(node)
+
+        # Process the if condition
+        self.visit(node.test) if hasattr(node, "test") else None
+
+        # Visit the body
+        for child in node.body:
+            self.visit(child)
+
+        # Handle elif chains (orelse contains another If)
+        if node.orelse:
+            for child in node.orelse:
+                self.visit(child)
+
+    def _record_decision_branches(self, node: ast.If) -> None:
+        """Record branch activity lines when an If test is a to_decision() call.
+
         Args:
             node: AST node representing an if/elif/else structure.
         """
@@ -171,25 +330,13 @@ class DecisionDetector(ast.NodeVisitor):
 
         # If this is a decision block, collect branch activities
         if decision_call:
-            true_activities = self._collect_activity_lines(node.body)
-            false_activities = self._collect_activity_lines(node.orelse)
+            true_activities = _collect_activity_lines(node.body)
+            false_activities = _collect_activity_lines(node.orelse)
 
             # Store branch info keyed by decision line number
             # This will be looked up when creating the DecisionPoint
             self._decision_branches[decision_call.lineno] = (true_activities, false_activities)
 
-        # Process the if condition
-        self.visit(node.test) if hasattr(node, "test") else None
-
-        # Visit the body
-        for child in node.body:
-            self.visit(child)
-
-        # Handle elif chains (orelse contains another If)
-        if node.orelse:
-            for child in node.orelse:
-                self.visit(child)
-
     def _is_to_decision_call(self, node: ast.Call) -> bool:
         """Check if a Call node is a to_decision() function call.
 
@@ -205,11 +352,11 @@ class DecisionDetector(ast.NodeVisitor):
         """
         # Check for simple name: to_decision(...)
         if isinstance(node.func, ast.Name):
-            return node.func.id == "to_decision"
+            return node.func.id == _TO_DECISION
 
         # Check for attribute access: something.to_decision(...)
         if isinstance(node.func, ast.Attribute):
-            return node.func.attr == "to_decision"
+            return node.func.attr == _TO_DECISION
 
         return False
 
@@ -315,6 +462,33 @@ class DecisionDetector(ast.NodeVisitor):
         """
         return self._decisions
 
+    @property
+    def names(self) -> list[str]:
+        """Names of the detected decision points, in detection order.
+
+        Returns:
+            List of decision names parallel to ``decisions``.
+        """
+        return [decision.name for decision in self._decisions]
+
+    @property
+    def ids(self) -> list[str]:
+        """IDs of the detected decision points, in detection order.
+
+        Returns:
+            List of decision IDs parallel to ``decisions``.
+        """
+        return [decision.id for decision in self._decisions]
+
+    @property
+    def line_numbers(self) -> list[int]:
+        """Source line numbers of the detected decision points, in detection order.
+
+        Returns:
+            List of line numbers parallel to ``decisions``.
+        """
+        return [decision.line_number for decision in self._decisions]
+
 
 class SignalDetector(ast.NodeVisitor):
     """Detects wait_condition() helper calls in workflow AST.
@@ -349,6 +523,72 @@ class SignalDetector(ast.NodeVisitor):
         # {signal_line: (signaled_activities, timeout_activities)}
         self._signal_branches: dict[int, tuple[list[int], list[int]]] = {}
 
+    def clear(self) -> None:
+        """Reset detection state so the detector can analyze another tree.
+
+        Clears detected signals and recorded branch activities in place and
+        restarts the signal counter.
+        """
+        self._signals.clear()
+        self._signal_branches.clear()
+        self._signal_counter = 0
+
+    @staticmethod
+    def quick_reject(source: str) -> bool:
+        """Return True if the source cannot contain a wait_condition() call.
+
+        A substring check over the raw text: a True result means the source
+        never mentions wait_condition, so parsing and traversal can be skipped.
+        False only means a signal point is possible.
+
+        Args:
+            source: Python source code of the workflow module.
+
+        Returns:
+            True if the source can be skipped without parsing.
+        """
+        return "wait_condition" not in source
+
+    @staticmethod
+    def count_candidates(source: str) -> int:
+        """Count wait_condition( call sites in raw source text without parsing.
+
+        A regex scan that is an upper bound on the signal points visit() would
+        detect: it also counts Temporal's built-in one-argument
+        workflow.wait_condition() and occurrences inside comments or strings.
+        Zero therefore means no signal points; use visit() for exact results.
+
+        Args:
+            source: Python source code of the workflow module.
+
+        Returns:
+            Number of textual wait_condition( call sites.
+        """
+        return len(_WAIT_CONDITION_CALL_RE.findall(source))
+
+    def visit(self, node: ast.AST) -> None:
+        """Traverse a tree iteratively, handling only If and Call nodes.
+
+        Overrides ast.NodeVisitor.visit with the same explicit-stack, pre-order
+        walk DecisionDetector uses: no per-node method dispatch, no recursion
+        limit on deep trees, and an If's branch activities are recorded before
+        the wait_condition() call in its test is processed.
+
+        Args:
+            node: Root AST node to traverse (typically an ast.Module).
+        """
+        stack: list[object] = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ast.Call):
+                self._process_call(current)
+            elif isinstance(current, ast.If):
+                self._record_signal_branches(current)
+            elif not isinstance(current, ast.AST):
+                # Non-node list entries (Global.names strings, Dict.keys None)
+                continue
+            _push_children(stack, current)
+
     def visit_Call(self, node: ast.Call) -> None:
         """Visit Call nodes to identify wait_condition() function calls.
 
@@ -356,6 +596,17 @@ class SignalDetector(ast.NodeVisitor):
         if the call is to the wait_condition() function and extracts signal metadata
         if found.
 
+        Args:
+            node: AST node representing a function call.
+        """
+        self._process_call(node)
+
+        # Continue traversal to find nested calls
+        self.generic_visit(node)
+
+    def _process_call(self, node: ast.Call) -> None:
+        """Record a SignalPoint if the call is to the wait_condition() helper.
+
         Args:
             node: AST node representing a function call.
         """
@@ -371,9 +622,6 @@ class SignalDetector(ast.NodeVisitor):
                 # Re-raise signal errors with full context
                 raise e
 
-        # Continue traversal to find nested calls
-        self.generic_visit(node)
-
     def visit_If(self, node: ast.If) -> None:
         """Visit If nodes to track signal branch activities.
 
@@ -384,23 +632,7 @@ class SignalDetector(ast.NodeVisitor):
         Args:
             node: AST node representing an if/elif/else structure.
         """
-        # Check if this If node's test contains a wait_condition() call
-        signal_call = None
-        if isinstance(node.test, ast.Await) and isinstance(node.test.value, ast.Call):
-            if self._is_wait_condition_call(node.test.value):
-                signal_call = node.test.value
-        elif isinstance(node.test, ast.Name):
-            # Pattern: result = await wait_condition(...); if result:
-            # We need to find the assignment, but for now we skip this pattern
-            pass
-
-        # If this is a signal-conditional block, collect branch activities
-        if signal_call:
-            signaled_activities = self._collect_activity_lines(node.body)
-            timeout_activities = self._collect_activity_lines(node.orelse)
-
-            # Store branch info keyed by signal line number
-            self._signal_branches[signal_call.lineno] = (signaled_activities, timeout_activities)
+        self._record_signal_branches(node)
 
         # Continue visiting child nodes
         if hasattr(node, "test"):
@@ -413,34 +645,29 @@ class SignalDetector(ast.NodeVisitor):
             for child in node.orelse:
                 self.visit(child)
 
-    def _collect_activity_lines(self, nodes: list[ast.stmt]) -> list[int]:
-        """Collect line numbers of all execute_activity calls in a block.
+    def _record_signal_branches(self, node: ast.If) -> None:
+        """Record branch activity lines when an If test awaits wait_condition().
 
         Args:
-            nodes: List of AST statement nodes to search.
-
-        Returns:
-            List of line numbers where execute_activity is called.
+            node: AST node representing an if/elif/else structure.
         """
-        activity_lines = []
-
-        class ActivityCollector(ast.NodeVisitor):
-            def visit_Await(self, node: ast.Await) -> None:
-                if isinstance(node.value, ast.Call):
-                    call = node.value
-                    # Check for workflow.execute_activity, execute_activity_method, or standalone
-                    if isinstance(call.func, ast.Attribute):
-                        if call.func.attr in ("execute_activity", "execute_activity_method"):
-                            activity_lines.append(node.lineno)
-                    elif isinstance(call.func, ast.Name):
-                        if call.func.id in ("execute_activity", "execute_activity_method"):
-                            activity_lines.append(node.lineno)
-                self.generic_visit(node)
-
-        collector = ActivityCollector()
-        for stmt in nodes:
-            collector.visit(stmt)
-        return activity_lines
+        # Check if this If node's test contains a wait_condition() call
+        signal_call = None
+        if isinstance(node.test, ast.Await) and isinstance(node.test.value, ast.Call):
+            if self._is_wait_condition_call(node.test.value):
+                signal_call = node.test.value
+        elif isinstance(node.test, ast.Name):
+            # Pattern: result = await wait_condition(...); if result:
+            # We need to find the assignment, but for now we skip this pattern
+            pass
+
+        # If this is a signal-conditional block, collect branch activities
+        if signal_call:
+            signaled_activities = _collect_activity_lines(node.body)
+            timeout_activities = _collect_activity_lines(node.orelse)
+
+            # Store branch info keyed by signal line number
+            self._signal_branches[signal_call.lineno] = (signaled_activities, timeout_activities)
 
     def _is_wait_condition_call(self, node: ast.Call) -> bool:
         """Check if a Call node is a wait_condition() function call.
@@ -551,9 +778,10 @@ class SignalDetector(ast.NodeVisitor):
         Returns:
             Deterministic signal node ID in format: sig_{name}_{line}
         """
-        # Use name + line for uniqueness and determinism
+        # Use name + line for uniqueness and determinism. Interned because the
+        # ID is used as a dict key by path generation and rendering.
         safe_name = name.replace(" ", "_").lower()
-        return f"sig_{safe_name}_{line}"
+        return sys.intern(f"sig_{safe_name}_{line}")
 
     @property
     def signals(self) -> list[SignalPoint]:
@@ -597,6 +825,13 @@ class ChildWorkflowDetector(ast.NodeVisitor):
         self._child_calls: list[ChildWorkflowCall] = []
         self._parent_workflow: str = ""
 
+    def clear(self) -> None:
+        """Reset detected child workflow calls so the detector can analyze another tree.
+
+        The parent workflow context set via set_parent_workflow() is kept.
+        """
+        self._child_calls.clear()
+
     def set_parent_workflow(self, parent_workflow: str) -> None:
         """Set the parent workflow name for context.
 
@@ -605,6 +840,42 @@ class ChildWorkflowDetector(ast.NodeVisitor):
         """
         self._parent_workflow = parent_workflow
 
+    @staticmethod
+    def quick_reject(source: str) -> bool:
+        """Return True if the source cannot contain an execute_child_workflow() call.
+
+        A substring check over the raw text: a True result means the source
+        never mentions execute_child_workflow, so parsing and traversal can be
+        skipped. False only means a child workflow call is possible.
+
+        Args:
+            source: Python source code of the workflow module.
+
+        Returns:
+            True if the source can be skipped without parsing.
+        """
+        return "execute_child_workflow" not in source
+
+    def visit(self, node: ast.AST) -> None:
+        """Traverse a tree iteratively in source order, handling only Call nodes.
+
+        Overrides ast.NodeVisitor.visit with the explicit-stack walk shared by
+        the other detectors, avoiding per-node method dispatch and the
+        recursion limit on deep trees.
+
+        Args:
+            node: Root AST node to traverse (typically an ast.Module).
+        """
+        stack: list[object] = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ast.Call):
+                self._process_call(current)
+            elif not isinstance(current, ast.AST):
+                # Non-node list entries (Global.names strings, Dict.keys None)
+                continue
+            _push_children(stack, current)
+
     def visit_Call(self, node: ast.Call) -> None:
         """Visit Call nodes to identify execute_child_workflow() function calls.
 
@@ -612,6 +883,17 @@ class ChildWorkflowDetector(ast.NodeVisitor):
         if the call is to workflow.execute_child_workflow() and extracts child
         workflow metadata if found.
 
+        Args:
+            node: AST node representing a function call.
+        """
+        self._process_call(node)
+
+        # Continue traversal to find nested calls
+        self.generic_visit(node)
+
+    def _process_call(self, node: ast.Call) -> None:
+        """Record a ChildWorkflowCall if the call is workflow.execute_child_workflow().
+
         Args:
             node: AST node representing a function call.
         """
@@ -635,9 +917,6 @@ class ChildWorkflowDetector(ast.NodeVisitor):
                 # Re-raise parse errors with full context
                 raise e
 
-        # Continue traversal to find nested calls
-        self.generic_visit(node)
-
     def _is_execute_child_workflow_call(self, node: ast.Call) -> bool:
         """Check if a Call node is an execute_child_workflow() call.
 
@@ -750,9 +1029,9 @@ class ChildWorkflowDetector(ast.NodeVisitor):
         Returns:
             Deterministic call ID in format: child_{workflow_name}_{line}
         """
-        # Use name + line for uniqueness and determinism
+        # Use name + line for uniqueness and determinism; interned like signal IDs
         safe_name = workflow_name.replace(" ", "_").lower()
-        return f"child_{safe_name}_{line}"
+        return sys.intern(f"child_{safe_name}_{line}")
 
     @property
     def child_calls(self) -> list[ChildWorkflowCall]:
@@ -764,6 +1043,136 @@ class ChildWorkflowDetector(ast.NodeVisitor):
         return self._child_calls
 
 
+class CompositeDetector:
+    """Runs decision, signal, and child workflow detection in a single traversal.
+
+    Each of DecisionDetector, SignalDetector, and ChildWorkflowDetector walks
+    the whole tree looking at the same If and Call nodes. This detector owns
+    one instance of each and delegates to their per-node handlers from one
+    explicit-stack walk, so the tree is traversed once instead of three times.
+    Results are identical to running the three detectors separately, except
+    that when a tree holds both a malformed to_decision() and a malformed
+    wait_condition() call, the error raised is the one that comes first in
+    source order.
+
+    Example:
+        >>> detector = CompositeDetector()
+        >>> detector.set_parent_workflow("ParentWorkflow")
+        >>> detector.visit(ast.parse(workflow_source))
+        >>> detector.decisions, detector.signals, detector.child_calls
+    """
+
+    __slots__ = ("_decision_detector", "_signal_detector", "_child_workflow_detector")
+
+    def __init__(self) -> None:
+        """Initialize the composite detector with empty component detectors."""
+        self._decision_detector = DecisionDetector()
+        self._signal_detector = SignalDetector()
+        self._child_workflow_detector = ChildWorkflowDetector()
+
+    def set_parent_workflow(self, parent_workflow: str) -> None:
+        """Set the parent workflow name used for detected child workflow calls.
+
+        Args:
+            parent_workflow: Name of the parent workflow class.
+        """
+        self._child_workflow_detector.set_parent_workflow(parent_workflow)
+
+    def clear(self) -> None:
+        """Reset all component detectors so another tree can be analyzed.
+
+        The parent workflow context set via set_parent_workflow() is kept.
+        """
+        self._decision_detector.clear()
+        self._signal_detector.clear()
+        self._child_workflow_detector.clear()
+
+    def visit(self, node: ast.AST) -> None:
+        """Traverse a tree once in source order, feeding every component detector.
+
+        Uses the same pre-order walk as the individual detectors. The arguments
+        of a matched to_decision() call are walked immediately, in place, with
+        decision handling switched off, mirroring DecisionDetector's pruning
+        while still letting signal and child workflow calls be found there.
+
+        Args:
+            node: Root AST node to traverse (typically an ast.Module).
+        """
+        decisions = self._decision_detector
+        signals = self._signal_detector
+        children = self._child_workflow_detector
+        stack: list[object] = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ast.Call):
+                func = current.func
+                if (type(func) is ast.Name and func.id == _TO_DECISION) or (
+                    type(func) is ast.Attribute and func.attr == _TO_DECISION
+                ):
+                    decisions._process_call(current)
+                    signals._process_call(current)
+                    children._process_call(current)
+                    self._visit_decision_arguments(current)
+                    continue
+                signals._process_call(current)
+                children._process_call(current)
+            elif isinstance(current, ast.If):
+                decisions._record_decision_branches(current)
+                signals._record_signal_branches(current)
+            elif not isinstance(current, ast.AST):
+                # Non-node list entries (Global.names strings, Dict.keys None)
+                continue
+            _push_children(stack, current)
+
+    def _visit_decision_arguments(self, call: ast.Call) -> None:
+        """Walk the children of a to_decision() call for signal and child detection.
+
+        Args:
+            call: The matched to_decision() call whose subtree DecisionDetector prunes.
+        """
+        signals = self._signal_detector
+        children = self._child_workflow_detector
+        stack: list[object] = []
+        _push_children(stack, call)
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ast.Call):
+                signals._process_call(current)
+                children._process_call(current)
+            elif isinstance(current, ast.If):
+                signals._record_signal_branches(current)
+            elif not isinstance(current, ast.AST):
+                continue
+            _push_children(stack, current)
+
+    @property
+    def decisions(self) -> list[DecisionPoint]:
+        """Decision points detected by the decision component.
+
+        Returns:
+            List of DecisionPoint objects extracted during AST traversal.
+        """
+        return self._decision_detector.decisions
+
+    @property
+    def signals(self) -> list[SignalPoint]:
+        """Signal points detected by the signal component.
+
+        Returns:
+            List of SignalPoint objects extracted during AST traversal.
+        """
+        return self._signal_detector.signals
+
+    @property
+    def child_calls(self) -> list[ChildWorkflowCall]:
+        """Child workflow calls detected by the child workflow component.
+
+        Returns:
+            List of ChildWorkflowCall objects extracted during AST traversal.
+        """
+        return self._child_workflow_detector.child_calls
+
+
 class ExternalSignalDetector(ast.NodeVisitor):
     """AST visitor to detect external workflow signal calls.
 
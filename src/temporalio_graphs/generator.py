@@ -28,6 +28,21 @@ from temporalio_graphs.path import GraphPath
 logger = logging.getLogger(__name__)
 
 
+def _count_paths(metadata: WorkflowMetadata) -> int:
+    """Return how many paths generate_paths() produces for a workflow.
+
+    Every decision and signal point doubles the path count, so the count is
+    known from the metadata alone without enumerating any permutation.
+
+    Args:
+        metadata: Workflow metadata from WorkflowAnalyzer.
+
+    Returns:
+        2^(decisions + signals), or 1 for a linear workflow.
+    """
+    return 1 << (len(metadata.decision_points) + len(metadata.signal_points))
+
+
 class PathPermutationGenerator:
     """Generates execution paths from workflow metadata.
 
@@ -176,7 +191,7 @@ class PathPermutationGenerator:
         num_decisions = len(metadata.decision_points)
         num_signals = len(metadata.signal_points)
         total_branch_points = num_decisions + num_signals
-        paths_count = 2**total_branch_points if total_branch_points > 0 else 1
+        paths_count = _count_paths(metadata)
 
         # Validate explosion limit (decisions + signals combined)
         if total_branch_points > context.max_decision_points:
@@ -419,171 +434,105 @@ class PathPermutationGenerator:
         # Sort by line number to get execution order
         execution_order.sort(key=lambda x: x[2])
 
+        # Map each branch point to its slot in the permutation tuple: decisions
+        # first, then signals. Duplicate IDs resolve to the last slot, matching
+        # the previous per-permutation dict construction.
+        decision_slot = {decision.id: i for i, decision in enumerate(decisions)}
+        signal_slot = {signal.node_id: num_decisions + i for i, signal in enumerate(signals)}
+
+        # Precompute, once per workflow, which branch values each linear node
+        # requires in order to execute, as a (mask, expected) bit pair over the
+        # permutation index. itertools.product yields combinations in binary
+        # counting order, so slot i of branch_values is bit (n - 1 - i) of the
+        # permutation index. Only branch points that precede the node in
+        # execution order constrain it. The per-permutation loop below then
+        # reduces to one integer comparison per node instead of re-scanning
+        # every decision/signal branch set for every path.
+        step_plan: list[
+            tuple[
+                str,
+                Activity | DecisionPoint | SignalPoint | ChildWorkflowCall | ExternalSignalCall,
+                int,
+                int,
+            ]
+        ] = []
+        decisions_encountered: list[DecisionPoint] = []
+        signals_encountered: list[SignalPoint] = []
+        for node_type, node, _ in execution_order:
+            if node_type == "decision":
+                assert isinstance(node, DecisionPoint)
+                step_plan.append((node_type, node, 0, 0))
+                decisions_encountered.append(node)
+                continue
+            if node_type == "signal":
+                assert isinstance(node, SignalPoint)
+                step_plan.append((node_type, node, 0, 0))
+                signals_encountered.append(node)
+                continue
+
+            if isinstance(node, Activity):
+                node_line = node.line_num
+            elif isinstance(node, ChildWorkflowCall):
+                node_line = node.call_site_line
+            else:
+                assert isinstance(node, ExternalSignalCall)
+                node_line = node.source_line
+
+            mask = expected = 0
+            for decision in decisions_encountered:
+                bit = 1 << (total_branches - 1 - decision_slot[decision.id])
+                if node_line in decision.true_branch_activities:
+                    mask |= bit
+                    expected |= bit
+                elif node_line in decision.false_branch_activities:
+                    mask |= bit
+            for signal in signals_encountered:
+                bit = 1 << (total_branches - 1 - signal_slot[signal.node_id])
+                if node_line in signal.signaled_branch_activities:
+                    mask |= bit
+                    expected |= bit
+                elif node_line in signal.timeout_branch_activities:
+                    mask |= bit
+            step_plan.append((node_type, node, mask, expected))
+
+        success_label = context.signal_success_label
+        timeout_label = context.signal_timeout_label
+
         # Generate all 2^n boolean combinations using itertools.product
-        for path_index, branch_values in enumerate(product([False, True], repeat=total_branches)):
+        for path_index, branch_values in enumerate(product((False, True), repeat=total_branches)):
             # Create path ID in binary format for clarity
             # path_0b00, path_0b01, path_0b10, path_0b11, etc.
-            binary_str = "".join(str(int(v)) for v in branch_values)
-            path_id = f"path_0b{binary_str}"
-
-            # Create new path for this permutation
-            path = GraphPath(path_id=path_id)
-
-            # Build decision and signal value lookup dictionaries for this permutation
-            decision_value_map = {}
-            signal_value_map = {}
-
-            # Assign values to decisions first, then signals
-            branch_index = 0
-            for decision in decisions:
-                decision_value_map[decision.id] = branch_values[branch_index]
-                branch_index += 1
-            for signal in signals:
-                signal_value_map[signal.node_id] = branch_values[branch_index]
-                branch_index += 1
-
-            # Track decisions and signals encountered so far in this path (for control flow)
-            decisions_encountered: list[DecisionPoint] = []
-            signals_encountered: list[SignalPoint] = []
-
-            # Add nodes in correct interleaved order based on source line numbers
-            # Only include activities that match the decision/signal path (control flow aware)
-            for node_type, node, line_num in execution_order:
-                if node_type == "activity":
-                    # node is Activity object
-                    assert isinstance(node, Activity)
-                    activity_name = node.name
-                    activity_line = node.line_num
-
-                    # Check if this activity is conditional on any decision or signal
-                    should_include_activity = True
-
-                    for decision in decisions_encountered:
-                        # Check if activity is in this decision's true branch
-                        if activity_line in decision.true_branch_activities:
-                            # Activity is conditional on decision being True
-                            if not decision_value_map[decision.id]:
-                                should_include_activity = False
-                                break
-                        # Check if activity is in this decision's false branch
-                        elif activity_line in decision.false_branch_activities:
-                            # Activity is conditional on decision being False
-                            if decision_value_map[decision.id]:
-                                should_include_activity = False
-                                break
-                        # If not in either branch, activity is unconditional
-                        # relative to this decision
-
-                    # Check if this activity is conditional on any signal
-                    for signal in signals_encountered:
-                        # Check if activity is in this signal's signaled branch
-                        if activity_line in signal.signaled_branch_activities:
-                            # Activity is conditional on signal being Signaled (True)
-                            if not signal_value_map[signal.node_id]:
-                                should_include_activity = False
-                                break
-                        # Check if activity is in this signal's timeout branch
-                        elif activity_line in signal.timeout_branch_activities:
-                            # Activity is conditional on signal being Timeout (False)
-                            if signal_value_map[signal.node_id]:
-                                should_include_activity = False
-                                break
-                        # If not in either branch, activity is unconditional
-                        # relative to this signal
-
-                    # Only add activity if it should execute in this path
-                    if should_include_activity:
-                        path.add_activity(activity_name)
-
-                elif node_type == "decision":
-                    # node is DecisionPoint object
+            binary_str = "".join("1" if v else "0" for v in branch_values)
+            path = GraphPath(path_id=f"path_0b{binary_str}")
+
+            # Add nodes in correct interleaved order based on source line numbers.
+            # Linear nodes are only included when every branch they sit inside
+            # took the matching value in this permutation (control flow aware).
+            for node_type, node, mask, expected in step_plan:
+                if node_type == "decision":
                     assert isinstance(node, DecisionPoint)
-                    value = decision_value_map[node.id]
-                    path.add_decision(node.id, value, node.name)
-                    # Track this decision for checking future activities
-                    decisions_encountered.append(node)
-
+                    path.add_decision(node.id, branch_values[decision_slot[node.id]], node.name)
                 elif node_type == "signal":
-                    # node is SignalPoint object
                     assert isinstance(node, SignalPoint)
-                    value = signal_value_map[node.node_id]
                     # True = Signaled, False = Timeout
-                    outcome = (
-                        context.signal_success_label if value else context.signal_timeout_label
-                    )
-                    path.add_signal(node.name, outcome)
-                    # Track this signal for checking future activities
-                    signals_encountered.append(node)
-
+                    signaled = branch_values[signal_slot[node.node_id]]
+                    path.add_signal(node.name, success_label if signaled else timeout_label)
+                elif path_index & mask != expected:
+                    # Node sits inside a branch this permutation did not take
+                    continue
+                elif node_type == "activity":
+                    assert isinstance(node, Activity)
+                    path.add_activity(node.name)
                 elif node_type == "child_workflow":
-                    # node is ChildWorkflowCall object
-                    assert isinstance(node, ChildWorkflowCall)
                     # Child workflows are treated like activities (linear, no branching)
-                    # Add them unconditionally unless they're in a conditional branch
-                    child_workflow_line = node.call_site_line
-                    should_include_child_workflow = True
-
-                    # Check if this child workflow is conditional on any decision
-                    for decision in decisions_encountered:
-                        if child_workflow_line in decision.true_branch_activities:
-                            if not decision_value_map[decision.id]:
-                                should_include_child_workflow = False
-                                break
-                        elif child_workflow_line in decision.false_branch_activities:
-                            if decision_value_map[decision.id]:
-                                should_include_child_workflow = False
-                                break
-
-                    # Check if this child workflow is conditional on any signal
-                    for signal in signals_encountered:
-                        if child_workflow_line in signal.signaled_branch_activities:
-                            if not signal_value_map[signal.node_id]:
-                                should_include_child_workflow = False
-                                break
-                        elif child_workflow_line in signal.timeout_branch_activities:
-                            if signal_value_map[signal.node_id]:
-                                should_include_child_workflow = False
-                                break
-
-                    # Only add child workflow if it should execute in this path
-                    if should_include_child_workflow:
-                        path.add_child_workflow(node.workflow_name, node.call_site_line)
-
+                    assert isinstance(node, ChildWorkflowCall)
+                    path.add_child_workflow(node.workflow_name, node.call_site_line)
                 elif node_type == "external_signal":
-                    # node is ExternalSignalCall object
-                    assert isinstance(node, ExternalSignalCall)
                     # External signals are treated like activities (linear, no branching)
-                    # Add them unconditionally unless they're in a conditional branch
-                    external_signal_line = node.source_line
-                    should_include_external_signal = True
-
-                    # Check if this external signal is conditional on any decision
-                    for decision in decisions_encountered:
-                        if external_signal_line in decision.true_branch_activities:
-                            if not decision_value_map[decision.id]:
-                                should_include_external_signal = False
-                                break
-                        elif external_signal_line in decision.false_branch_activities:
-                            if decision_value_map[decision.id]:
-                                should_include_external_signal = False
-                                break
-
-                    # Check if this external signal is conditional on any signal
-                    for signal in signals_encountered:
-                        if external_signal_line in signal.signaled_branch_activities:
-                            if not signal_value_map[signal.node_id]:
-                                should_include_external_signal = False
-                                break
-                        elif external_signal_line in signal.timeout_branch_activities:
-                            if signal_value_map[signal.node_id]:
-                                should_include_external_signal = False
-                                break
-
-                    # Only add external signal if it should execute in this path
-                    if should_include_external_signal:
-                        path.add_external_signal(
-                            node.signal_name, node.target_workflow_pattern, node.source_line
-                        )
+                    assert isinstance(node, ExternalSignalCall)
+                    path.add_external_signal(
+                        node.signal_name, node.target_workflow_pattern, node.source_line
+                    )
 
             paths.append(path)
 
@@ -719,26 +668,25 @@ class PathPermutationGenerator:
         Raises:
             GraphGenerationError: If total paths exceed context.max_paths limit.
         """
-        # Generate parent workflow paths
-        parent_paths = self.generate_paths(call_graph.root_workflow, context)
-
         # If no child workflows, return reference mode paths
         if not call_graph.child_workflows:
             logger.debug("Inline mode: No child workflows, using reference mode")
             return self._generate_reference_mode_paths(call_graph, context)
 
-        # Calculate total paths BEFORE generation (path explosion safeguard)
-        total_paths = len(parent_paths)
+        # Calculate total paths BEFORE generation (path explosion safeguard).
+        # Path counts follow from the metadata alone, so an exploding expansion
+        # is rejected without enumerating any parent or child permutation.
+        parent_path_count = _count_paths(call_graph.root_workflow)
+        total_paths = parent_path_count
         child_path_counts: dict[str, int] = {}
         for child_name, child_metadata in call_graph.child_workflows.items():
-            child_paths = self.generate_paths(child_metadata, context)
-            child_path_counts[child_name] = len(child_paths)
-            total_paths *= len(child_paths)
+            child_path_counts[child_name] = _count_paths(child_metadata)
+            total_paths *= child_path_counts[child_name]
 
         # Check path explosion limit
         if total_paths > context.max_paths:
             # Build detailed error message
-            breakdown = f"Parent ({len(parent_paths)} paths)"
+            breakdown = f"Parent ({parent_path_count} paths)"
             for child_name, count in child_path_counts.items():
                 breakdown += f" × {child_name} ({count} paths)"
             breakdown += f" = {total_paths} total paths"
@@ -750,7 +698,7 @@ class PathPermutationGenerator:
                     f"Use 'reference' mode or increase max_paths."
                 ),
                 context={
-                    "parent_paths": len(parent_paths),
+                    "parent_paths": parent_path_count,
                     "child_path_counts": child_path_counts,
                     "total_paths": total_paths,
                     "limit": context.max_paths,
@@ -758,115 +706,108 @@ class PathPermutationGenerator:
                 },
             )
 
-        # Generate child workflow paths for all children
-        child_paths_map: dict[str, list[GraphPath]] = {}
-        for child_name, child_metadata in call_graph.child_workflows.items():
-            child_paths_map[child_name] = self.generate_paths(child_metadata, context)
+        # Generate parent and child workflow paths, once per workflow
+        parent_paths = self.generate_paths(call_graph.root_workflow, context)
+        child_paths_map: dict[str, list[GraphPath]] = {
+            child_name: self.generate_paths(child_metadata, context)
+            for child_name, child_metadata in call_graph.child_workflows.items()
+        }
+
+        # Reduce each child path to what expansion actually uses, once per child
+        # path rather than once per combination it appears in:
+        # (step names, decision count)
+        child_segments: dict[str, list[tuple[list[str], int]]] = {
+            child_name: [
+                ([step.name for step in child_path.steps], len(child_path.decisions))
+                for child_path in child_paths
+            ]
+            for child_name, child_paths in child_paths_map.items()
+        }
+        root_class = call_graph.root_workflow.workflow_class
 
         # Expand parent paths with child workflow paths
         mw_paths: list[MultiWorkflowPath] = []
         mw_path_id = 0
 
         for parent_path in parent_paths:
-            # Find child workflow call sites in this parent path
-            child_call_sites: list[
-                tuple[int, str, int]
-            ] = []  # (step_index, workflow_name, line_number)
-            for step_index, step in enumerate(parent_path.steps):
-                if step.node_type == "child_workflow":
-                    child_call_sites.append((step_index, step.name, step.line_number or 0))
+            parent_steps = parent_path.steps
+            parent_decisions = len(parent_path.decisions)
+
+            # Find child workflow call sites in this parent path: (step_index, workflow_name)
+            child_call_sites = [
+                (step_index, step.name)
+                for step_index, step in enumerate(parent_steps)
+                if step.node_type == "child_workflow"
+            ]
 
             # If no child calls in this path, create simple MultiWorkflowPath
             if not child_call_sites:
-                step_names = [step.name for step in parent_path.steps]
-                mw_path = MultiWorkflowPath(
-                    path_id=f"mwpath_{mw_path_id}",
-                    workflows=[call_graph.root_workflow.workflow_class],
-                    steps=step_names,
-                    workflow_transitions=[],
-                    total_decisions=len(parent_path.decisions),
+                mw_paths.append(
+                    MultiWorkflowPath(
+                        path_id=f"mwpath_{mw_path_id}",
+                        workflows=[root_class],
+                        steps=[step.name for step in parent_steps],
+                        workflow_transitions=[],
+                        total_decisions=parent_decisions,
+                    )
                 )
-                mw_paths.append(mw_path)
                 mw_path_id += 1
                 continue
 
-            # Expand this parent path with all child path combinations
-            # For each child call site, get all possible child paths
-            child_call_path_options: list[list[GraphPath]] = []
-            for _, child_name, _ in child_call_sites:
-                if child_name in child_paths_map:
-                    child_call_path_options.append(child_paths_map[child_name])
-                else:
-                    # Child workflow not found in call graph, skip expansion
-                    child_call_path_options.append([])
+            # Everything below depends only on the parent path, not on which child
+            # paths are chosen, so compute it once per parent path:
+            # - the parent step names before the first call site and after each one
+            # - the workflows traversed, in first-call order
+            # - the child path options for each call site
+            # Child workflows not found in the call graph have no options, which
+            # skips expansion of this parent path.
+            call_indices = [step_index for step_index, _ in child_call_sites]
+            bounds = call_indices[1:] + [len(parent_steps)]
+            leading_steps = [step.name for step in parent_steps[: call_indices[0]]]
+            trailing_steps = [
+                [step.name for step in parent_steps[start + 1 : end]]
+                for start, end in zip(call_indices, bounds)
+            ]
+            workflows_traversed = list(
+                dict.fromkeys([root_class] + [name for _, name in child_call_sites])
+            )
+            child_call_path_options = [
+                child_segments.get(child_name, []) for _, child_name in child_call_sites
+            ]
 
             # Generate cross-product of child path combinations
-            if all(child_call_path_options):
-                for child_path_combo in product(*child_call_path_options):
-                    # Build end-to-end path by injecting child paths at call sites
-                    end_to_end_steps: list[str] = []
-                    workflows_traversed: list[str] = [call_graph.root_workflow.workflow_class]
-                    transitions: list[tuple[int, str, str]] = []
-                    total_decisions_count = len(parent_path.decisions)
-
-                    current_step_index = 0
-
-                    # Add parent steps before first child call
-                    first_child_index = child_call_sites[0][0]
-                    for i in range(first_child_index):
-                        end_to_end_steps.append(parent_path.steps[i].name)
-                        current_step_index += 1
-
-                    # Inject each child workflow paths
-                    for child_idx, (child_step_idx, child_name, _) in enumerate(child_call_sites):
-                        child_path = child_path_combo[child_idx]
-
-                        # Record transition from parent to child
-                        transitions.append(
-                            (
-                                current_step_index,
-                                call_graph.root_workflow.workflow_class,
-                                child_name,
-                            )
-                        )
-                        if child_name not in workflows_traversed:
-                            workflows_traversed.append(child_name)
-
-                        # Add child workflow steps
-                        for child_step in child_path.steps:
-                            end_to_end_steps.append(child_step.name)
-                            current_step_index += 1
-                        total_decisions_count += len(child_path.decisions)
-
-                        # Record transition from child back to parent
-                        transitions.append(
-                            (
-                                current_step_index,
-                                child_name,
-                                call_graph.root_workflow.workflow_class,
-                            )
-                        )
-
-                        # Add parent steps between this child call and next (or end)
-                        next_child_index = (
-                            child_call_sites[child_idx + 1][0]
-                            if child_idx + 1 < len(child_call_sites)
-                            else len(parent_path.steps)
-                        )
-                        for i in range(child_step_idx + 1, next_child_index):
-                            end_to_end_steps.append(parent_path.steps[i].name)
-                            current_step_index += 1
-
-                    # Create MultiWorkflowPath
-                    mw_path = MultiWorkflowPath(
+            if not all(child_call_path_options):
+                continue
+            for child_path_combo in product(*child_call_path_options):
+                # Build end-to-end path by injecting child paths at call sites
+                end_to_end_steps = list(leading_steps)
+                transitions: list[tuple[int, str, str]] = []
+                total_decisions_count = parent_decisions
+
+                for (_, child_name), (child_steps, child_decisions), parent_after in zip(
+                    child_call_sites, child_path_combo, trailing_steps
+                ):
+                    # Record transition from parent to child, add the child's
+                    # steps, then record the transition back to the parent
+                    transitions.append((len(end_to_end_steps), root_class, child_name))
+                    end_to_end_steps += child_steps
+                    total_decisions_count += child_decisions
+                    transitions.append((len(end_to_end_steps), child_name, root_class))
+
+                    # Add parent steps between this child call and next (or end)
+                    end_to_end_steps += parent_after
+
+                # Create MultiWorkflowPath
+                mw_paths.append(
+                    MultiWorkflowPath(
                         path_id=f"mwpath_{mw_path_id}",
-                        workflows=workflows_traversed,
+                        workflows=list(workflows_traversed),
                         steps=end_to_end_steps,
                         workflow_transitions=transitions,
                         total_decisions=total_decisions_count,
                     )
-                    mw_paths.append(mw_path)
-                    mw_path_id += 1
+                )
+                mw_path_id += 1
 
         logger.debug(
             f"Inline mode: Generated {len(mw_paths)} end-to-end paths across "
@@ -5,11 +5,34 @@ through a workflow, recording all activities, decisions, and signals encountered
 along that path.
 """
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from typing import Literal
 
+# Node kinds a PathStep can represent
+StepNodeType = Literal['activity', 'decision', 'signal', 'child_workflow', 'external_signal']
 
-@dataclass
+
+@functools.lru_cache(maxsize=4096)
+def child_workflow_node_id(name: str, line_number: int) -> str:
+    """Return the deterministic graph node ID for a child workflow call.
+
+    Format: child_{workflow_name}_{line} (name lowercased for consistency). IDs
+    are memoized and interned, so repeated calls for the same workflow and line
+    skip the lowercase/format work and every path shares one string object.
+
+    Args:
+        name: Child workflow class name (e.g., "PaymentWorkflow").
+        line_number: Source line of the child workflow call.
+
+    Returns:
+        Node ID such as "child_paymentworkflow_45".
+    """
+    return sys.intern(f"child_{name.lower()}_{line_number}")
+
+
+@dataclass(frozen=True, slots=True)
 class PathStep:
     """Represents a single step in a workflow execution path.
 
@@ -17,6 +40,8 @@ class PathStep:
     This typed structure eliminates the need for string parsing to determine node types,
     making the code more robust and type-safe.
 
+    Steps are immutable and hashable once recorded on a path.
+
     Args:
         node_type: Type of node ('activity', 'decision', 'signal', 'child_workflow',
             'external_signal')
@@ -48,7 +73,7 @@ class PathStep:
         PathStep(node_type='external_signal', name='ship_order', line_number=50,
             target_workflow_pattern='shipping-{*}')
     """
-    node_type: Literal['activity', 'decision', 'signal', 'child_workflow', 'external_signal']
+    node_type: StepNodeType
     name: str
     decision_id: str | None = None
     decision_value: bool | None = None
@@ -72,7 +97,13 @@ class GraphPath:
     - A mapping of decision IDs to their values (true/false) for this path
 
     Node IDs are auto-generated sequentially for activities ("1", "2", "3", ...),
-    ensuring each activity gets a unique identifier in the resulting graph.
+    ensuring each activity gets a unique identifier within the path.
+
+    A path records steps only, not edges. The renderer derives edges at render
+    time because they depend on the GraphBuildingContext (branch labels, hidden
+    external signals re-linking neighbours) and on reconvergence across paths
+    (activities are keyed by name, not by the sequential IDs returned here).
+    Repeat renders of the same paths are served from MermaidRenderer's cache.
 
     Epic 2 scope: Only activity tracking is fully implemented. Decision and signal
     methods are stubs that will be completed in Epic 3 and Epic 4 respectively.
@@ -281,8 +312,7 @@ class GraphPath:
         self.steps.append(step)
 
         # Generate deterministic node ID based on workflow name and line number
-        # Format: child_{workflow_name}_{line} (lowercase for consistency)
-        node_id = f"child_{name.lower()}_{line_number}"
+        node_id = child_workflow_node_id(name, line_number)
 
         return node_id
 
@@ -330,7 +360,8 @@ class GraphPath:
         self.steps.append(step)
 
         # Generate deterministic node ID based on signal name and line number
-        # Format: ext_sig_{signal_name}_{line} (matches ExternalSignalDetector pattern)
-        node_id = f"ext_sig_{signal_name}_{line_number}"
+        # Format: ext_sig_{signal_name}_{line} (matches ExternalSignalDetector pattern).
+        # Interned so every path through this call shares one string object.
+        node_id = sys.intern(f"ext_sig_{signal_name}_{line_number}")
 
         return node_id
@@ -4,7 +4,14 @@ This module provides the MermaidRenderer class which converts GraphPath objects
 into valid Mermaid flowchart LR syntax for visualization.
 """
 
+import functools
+import operator
 import re
+import sys
+from collections.abc import Iterator
+from dataclasses import fields
+from pathlib import Path
+from typing import Literal, NamedTuple, overload
 
 from temporalio_graphs._internal.graph_models import (
     GraphNode,
@@ -15,7 +22,208 @@ from temporalio_graphs._internal.graph_models import (
 )
 from temporalio_graphs.context import GraphBuildingContext
 from temporalio_graphs.generator import PathPermutationGenerator
-from temporalio_graphs.path import GraphPath
+from temporalio_graphs.path import (
+    GraphPath,
+    PathStep,
+    StepNodeType,
+    child_workflow_node_id,
+)
+
+
+class RenderStats(NamedTuple):
+    """Size of a rendered Mermaid graph, returned by to_mermaid(return_stats=True).
+
+    Attributes:
+        n_nodes: Unique node definitions emitted, including Start and End.
+        n_edges: Unique edges emitted.
+        n_paths: Execution paths rendered.
+    """
+
+    n_nodes: int
+    n_edges: int
+    n_paths: int
+
+
+# Reads every PathStep field in one C-level call, yielding a tuple of plain
+# values that hashes and compares without going through the dataclass __eq__.
+_step_fields = operator.attrgetter(*(field.name for field in fields(PathStep)))
+
+# Field values of one PathStep, in declaration order
+_StepKey = tuple[
+    StepNodeType, str, str | None, bool | None, str | None, int | None, str | None
+]
+
+# Hashable fingerprint of a list of paths: one entry per path holding the path ID,
+# the field values of each step, and the path's decision outcomes.
+_PathsKey = tuple[tuple[str, tuple[_StepKey, ...], tuple[tuple[str, bool], ...]], ...]
+
+
+def _paths_key(paths: list[GraphPath]) -> _PathsKey:
+    """Build a hashable fingerprint capturing everything the renderer reads from paths.
+
+    Args:
+        paths: Execution paths about to be rendered.
+
+    Returns:
+        Nested tuple of path IDs, step field values, and decision outcomes. Two
+        path lists with equal keys always render to the same Mermaid output.
+    """
+    return tuple(
+        (path.path_id, tuple(map(_step_fields, path.steps)), tuple(path.decisions.items()))
+        for path in paths
+    )
+
+
+# Zero-width boundary between a lowercase and an uppercase letter (camelCase)
+_CAMEL_RE = re.compile(r"(?<=[a-z])(?=[A-Z])")
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_words(name: str) -> str:
+    """Split a camelCase/PascalCase name into space-separated words.
+
+    Memoized because the same activity, decision, and workflow names recur
+    across every path of a render.
+
+    Args:
+        name: Raw node name (e.g., "withdrawFunds").
+
+    Returns:
+        Name with a space inserted at each lower-to-upper transition
+        (e.g., "withdraw Funds").
+    """
+    # Single-case names ("BEGIN", "withdraw_funds") cannot contain a lower->upper
+    # transition; str.islower/isupper reject them in C without entering the regex.
+    if name.islower() or name.isupper():
+        return name
+    return _CAMEL_RE.sub(" ", name)
+
+
+class _PathsFingerprint:
+    """Render-cache key that compares by fingerprint and carries the paths for a miss.
+
+    Equality and hashing use only the _paths_key() fingerprint. The paths
+    themselves ride along so a cache miss can render them directly instead of
+    rebuilding them from the fingerprint; they are released after rendering so
+    cached keys never pin caller-owned, mutable GraphPath objects.
+    """
+
+    __slots__ = ("key", "paths", "_hash")
+
+    def __init__(self, paths: list[GraphPath]) -> None:
+        self.key = _paths_key(paths)
+        self.paths = paths
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _PathsFingerprint) and self.key == other.key
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(
+    fingerprint: _PathsFingerprint, context: GraphBuildingContext
+) -> tuple[str, RenderStats]:
+    """Render the fingerprinted paths with MermaidRenderer, memoizing the result.
+
+    GraphBuildingContext is a frozen dataclass, so the whole context is used as
+    part of the cache key; any option that affects output invalidates the entry.
+
+    Args:
+        fingerprint: Fingerprint of the paths to render, carrying the paths.
+        context: Configuration context used for rendering.
+
+    Returns:
+        Tuple of (Mermaid markdown string, RenderStats) for the described paths.
+    """
+    paths = fingerprint.paths
+    fingerprint.paths = []
+    return MermaidRenderer()._render_paths(paths, context)
+
+
+def _edge_label(
+    prev_node_id: str,
+    path: GraphPath,
+    signal_outcomes: dict[str, str],
+    context: GraphBuildingContext,
+) -> str:
+    """Return the label for the edge leaving prev_node_id on the given path.
+
+    Args:
+        prev_node_id: Node the edge starts from.
+        path: Path being rendered (supplies decision outcomes).
+        signal_outcomes: Signal name -> outcome mapping for the path.
+        context: Configuration context with decision branch labels.
+
+    Returns:
+        The yes/no label if prev_node_id is a decision, the signal outcome if it
+        is a signal, otherwise an empty string.
+    """
+    if prev_node_id in path.decisions:
+        return (
+            context.decision_true_label
+            if path.decisions[prev_node_id]
+            else context.decision_false_label
+        )
+    return signal_outcomes.get(prev_node_id, "")
+
+
+def _format_edge(src: str, dst: str, label: str, dashed: bool) -> str:
+    """Format one Mermaid edge line.
+
+    Args:
+        src: Source node ID.
+        dst: Destination node ID.
+        label: Edge label, or empty string for an unlabeled edge.
+        dashed: Use the dashed signal arrow (-.signal.->) instead of -->.
+
+    Returns:
+        Mermaid edge syntax, e.g. "d0 -- yes --> Deposit".
+    """
+    arrow = "-.signal.->" if dashed else "-->"
+    if label:
+        return f"{src} -- {label} {arrow} {dst}"
+    return f"{src} {arrow} {dst}"
+
+
+def _emit_lines(
+    nodes: dict[str, GraphNode], edges: dict[tuple[str, str, str], bool]
+) -> Iterator[str]:
+    """Yield the Mermaid lines for a collected graph: fence, nodes, edges, styles.
+
+    Args:
+        nodes: Unique nodes keyed by node ID (from _collect_graph()).
+        edges: Unique (src, dst, label) edges mapped to their dashed flag.
+
+    Yields:
+        One line of Mermaid markdown at a time, without trailing newlines.
+    """
+    yield "```mermaid"
+    yield "flowchart LR"
+
+    # Output nodes in order: s, numeric nodes, named/decision nodes, e
+    numeric_ids = sorted(int(node_id) for node_id in nodes if node_id.isdigit())
+    named_ids = sorted(
+        node_id for node_id in nodes if node_id not in ("s", "e") and not node_id.isdigit()
+    )
+    output_order = ["s"] + [str(i) for i in numeric_ids] + named_ids + ["e"]
+    for node_id in output_order:
+        if node_id in nodes:
+            yield nodes[node_id].to_mermaid()
+
+    # Unique edges in first-seen order
+    for (src, dst, label), dashed in edges.items():
+        yield _format_edge(src, dst, label, dashed)
+
+    # Style directives for external signal nodes (orange/amber color)
+    for node_id, node in nodes.items():
+        if node.node_type is NodeType.EXTERNAL_SIGNAL:
+            yield f"style {node_id} fill:#fff4e6,stroke:#ffa500"
+
+    # Close Mermaid fence
+    yield "```"
 
 
 class MermaidRenderer:
@@ -43,7 +251,28 @@ class MermaidRenderer:
         >>> print(output)  # Outputs valid Mermaid markdown with diagram
     """
 
-    def to_mermaid(self, paths: list[GraphPath], context: GraphBuildingContext) -> str:
+    @overload
+    def to_mermaid(
+        self,
+        paths: list[GraphPath],
+        context: GraphBuildingContext,
+        return_stats: Literal[False] = ...,
+    ) -> str: ...
+
+    @overload
+    def to_mermaid(
+        self,
+        paths: list[GraphPath],
+        context: GraphBuildingContext,
+        return_stats: Literal[True],
+    ) -> tuple[str, RenderStats]: ...
+
+    def to_mermaid(
+        self,
+        paths: list[GraphPath],
+        context: GraphBuildingContext,
+        return_stats: bool = False,
+    ) -> str | tuple[str, RenderStats]:
         """Convert workflow execution paths to Mermaid flowchart syntax.
 
         Generates valid Mermaid flowchart LR syntax from a list of execution
@@ -78,9 +307,13 @@ class MermaidRenderer:
                   (default True)
                 - decision_true_label: Label for true branches (default "yes")
                 - decision_false_label: Label for false branches (default "no")
+            return_stats: If True, also return a RenderStats with the number of
+                unique nodes, unique edges, and paths rendered. Lets callers check
+                graph size without scanning the output text. Default: False.
 
         Returns:
-            A complete Mermaid markdown string with fenced code blocks:
+            A complete Mermaid markdown string with fenced code blocks, or a
+            (markdown, RenderStats) tuple when return_stats is True:
             ```mermaid
             flowchart LR
             s((Start))
@@ -122,394 +355,236 @@ class MermaidRenderer:
             In Epic 2, typically processes a single linear path. Epic 3 handles
             multiple paths with reconverging nodes and decision branches.
             Deduplication ensures each decision node appears only once.
-        """
-        # Initialize output structure - use lists to preserve order
-        node_definitions: dict[str, str] = {}  # node_id -> definition
-        edges: list[str] = []
-        seen_edges: set[tuple[str, str, str]] = set()
-
-        # Build mapping of decision IDs to their names from PathStep objects
-        # With typed steps, we can directly identify decisions without heuristics
-        decision_id_to_name: dict[str, str] = {}
-        # Build mapping of signal names to their outcomes in each path
-        signal_outcomes: dict[str, dict[str, str]] = {}  # path_id -> {signal_name -> outcome}
 
-        if paths:
-            # Use the first path to build the decision mapping
-            first_path = paths[0]
-            for step in first_path.steps:
-                if step.node_type == 'decision' and step.decision_id:
-                    decision_id_to_name[step.decision_id] = step.name
-
-            # Build signal outcomes mapping for all paths
-            for path in paths:
-                signal_outcomes[path.path_id] = {}
-                for step in path.steps:
-                    if step.node_type == 'signal' and step.signal_outcome:
-                        signal_outcomes[path.path_id][step.name] = step.signal_outcome
-
-        # First pass: collect all nodes and edges
-        # Handle empty paths (edge case: Start -> End only)
-        if not paths:
-            node_definitions["s"] = f"s(({context.start_node_label}))"
-            node_definitions["e"] = f"e(({context.end_node_label}))"
-            edge_key = ("s", "e", "")
-            edges.append("s --> e")
-            seen_edges.add(edge_key)
+            MermaidRenderer output is memoized on a fingerprint of (paths,
+            context), so repeat renders of equal inputs reuse the rendered text
+            instead of rebuilding nodes and edges. Subclasses always render
+            through their own _render_paths().
+        """
+        if type(self) is MermaidRenderer:
+            text, stats = _render_cached(_PathsFingerprint(paths), context)
         else:
-            # Process each path
-            for path in paths:
-                # Add Start node
-                if "s" not in node_definitions:
-                    node_definitions["s"] = f"s(({context.start_node_label}))"
-
-                # Process activities and decisions in path
-                # With typed PathStep objects, we can directly check node_type
-                prev_node_id = "s"
-                for step_index, step in enumerate(path.steps, 1):
-                    # Validate step
-                    if step.name is None or step.name == "":
-                        raise ValueError(
-                            f"Step name cannot be None or empty string in path "
-                            f"{path.path_id} at step index {step_index}"
-                        )
-
-                    # Determine node type directly from PathStep
-                    is_decision = step.node_type == 'decision'
-                    is_signal = step.node_type == 'signal'
-                    is_child_workflow = step.node_type == 'child_workflow'
-                    is_external_signal = step.node_type == 'external_signal'
-
-                    if is_external_signal:
-                        # External signal node - skip if show_external_signals is False
-                        if not context.show_external_signals:
-                            continue
-
-                        # Use deterministic ID: ext_sig_{signal_name}_{line_number}
-                        if step.line_number is None:
-                            raise ValueError(
-                                f"External signal step '{step.name}' missing line_number "
-                                f"in path {path.path_id}"
-                            )
-
-                        node_id = f"ext_sig_{step.name}_{step.line_number}"
-
-                        # Format label based on external_signal_label_style
-                        if context.external_signal_label_style == "target-pattern":
-                            target = step.target_workflow_pattern or "<unknown>"
-                            display_name = f"Signal '{step.name}' to {target}"
-                        else:  # "name-only"
-                            display_name = f"Signal '{step.name}'"
-
-                        # Add external signal node definition (deduplicated by dict key)
-                        if node_id not in node_definitions:
-                            external_signal_node = GraphNode(
-                                node_id, NodeType.EXTERNAL_SIGNAL, display_name
-                            )
-                            node_definitions[node_id] = external_signal_node.to_mermaid()
-
-                        # Add dashed edge from previous node to external signal node
-                        edge_label = ""
-                        if prev_node_id in path.decisions:
-                            decision_value = path.decisions[prev_node_id]
-                            edge_label = (
-                                context.decision_true_label
-                                if decision_value
-                                else context.decision_false_label
-                            )
-                        elif prev_node_id in signal_outcomes[path.path_id]:
-                            edge_label = signal_outcomes[path.path_id][prev_node_id]
-
-                        edge_key = (prev_node_id, node_id, edge_label)
-                        if edge_key not in seen_edges:
-                            if edge_label:
-                                edge = f"{prev_node_id} -- {edge_label} -.signal.-> {node_id}"
-                                edges.append(edge)
-                            else:
-                                edges.append(f"{prev_node_id} -.signal.-> {node_id}")
-                            seen_edges.add(edge_key)
-
-                        prev_node_id = node_id
+            text, stats = self._render_paths(paths, context)
+        if return_stats:
+            return text, stats
+        return text
 
-                    elif is_signal:
-                        # Signal node - use signal name as node ID for reconvergence
-                        node_id = step.name
+    def to_mermaid_stream(
+        self,
+        paths: list[GraphPath],
+        context: GraphBuildingContext,
+        output_file: Path | str,
+    ) -> RenderStats:
+        """Render paths as Mermaid and write it straight to a file.
 
-                        # Apply word splitting if enabled
-                        display_name = step.name
-                        if context.split_names_by_words:
-                            display_name = re.sub(r"([a-z])([A-Z])", r"\1 \2", step.name)
+        Lines are written through a buffered file as they are generated, so the
+        full diagram is never held in memory as one string. Use this for very
+        large graphs; the render cache is bypassed because nothing is returned.
 
-                        # Add signal node definition (deduplicated by dict key)
-                        if node_id not in node_definitions:
-                            signal_node = GraphNode(node_id, NodeType.SIGNAL, display_name)
-                            node_definitions[node_id] = signal_node.to_mermaid()
+        Args:
+            paths: Execution paths to render (same as to_mermaid()).
+            context: Configuration context (same as to_mermaid()).
+            output_file: Destination path. Parent directories are created if
+                needed and an existing file is overwritten.
 
-                        # Add edge from previous node to signal node
-                        # Check if previous node was a decision or signal to add appropriate label
-                        edge_label = ""
-                        if prev_node_id in path.decisions:
-                            # Previous node is a decision - check its value
-                            decision_value = path.decisions[prev_node_id]
-                            edge_label = (
-                                context.decision_true_label
-                                if decision_value
-                                else context.decision_false_label
-                            )
-                        elif prev_node_id in signal_outcomes[path.path_id]:
-                            # Previous node is a signal - use its outcome as label
-                            edge_label = signal_outcomes[path.path_id][prev_node_id]
-
-                        edge_key = (prev_node_id, node_id, edge_label)
-                        if edge_key not in seen_edges:
-                            # Use dashed edge if previous node is external signal
-                            if prev_node_id.startswith("ext_sig_"):
-                                if edge_label:
-                                    edge = f"{prev_node_id} -- {edge_label} -.signal.-> {node_id}"
-                                    edges.append(edge)
-                                else:
-                                    edges.append(f"{prev_node_id} -.signal.-> {node_id}")
-                            else:
-                                if edge_label:
-                                    edges.append(f"{prev_node_id} -- {edge_label} --> {node_id}")
-                                else:
-                                    edges.append(f"{prev_node_id} --> {node_id}")
-                            seen_edges.add(edge_key)
-
-                        prev_node_id = node_id
-
-                    elif is_decision:
-                        # Get decision ID directly from PathStep
-                        if step.decision_id is None:
-                            raise ValueError(
-                                f"Decision step '{step.name}' missing decision_id "
-                                f"in path {path.path_id}"
-                            )
+        Returns:
+            RenderStats for the written graph.
 
-                        node_id = step.decision_id
+        Raises:
+            ValueError: If any step name is None/empty or required step metadata
+                is missing. Raised before the file is opened.
 
-                        # Apply word splitting if enabled
-                        display_name = step.name
-                        if context.split_names_by_words:
-                            display_name = re.sub(r"([a-z])([A-Z])", r"\1 \2", step.name)
+        Example:
+            >>> renderer = MermaidRenderer()
+            >>> stats = renderer.to_mermaid_stream(paths, context, "diagram.md")
+            >>> # diagram.md holds renderer.to_mermaid(paths, context) plus a final newline
+        """
+        nodes, edges = self._collect_graph(paths, context)
+        output_path = Path(output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        # newline="" writes "\n" as-is on every platform, matching _write_output
+        with output_path.open("w", encoding="utf-8", newline="", buffering=1 << 16) as f:
+            f.writelines(f"{line}\n" for line in _emit_lines(nodes, edges))
+        return RenderStats(n_nodes=len(nodes), n_edges=len(edges), n_paths=len(paths))
+
+    def _render_paths(
+        self, paths: list[GraphPath], context: GraphBuildingContext
+    ) -> tuple[str, RenderStats]:
+        """Render paths to Mermaid syntax without consulting the render cache.
 
-                        # Add decision node definition (deduplicated by dict key)
-                        if node_id not in node_definitions:
-                            decision_node = GraphNode(node_id, NodeType.DECISION, display_name)
-                            node_definitions[node_id] = decision_node.to_mermaid()
-
-                        # Add edges from previous node to decision node
-                        # Check if previous node was a decision or signal to add appropriate label
-                        edge_label = ""
-                        if prev_node_id in path.decisions:
-                            # Previous node is a decision - check its value
-                            decision_value = path.decisions[prev_node_id]
-                            edge_label = (
-                                context.decision_true_label
-                                if decision_value
-                                else context.decision_false_label
-                            )
-                        elif prev_node_id in signal_outcomes[path.path_id]:
-                            # Previous node is a signal - use its outcome as label
-                            edge_label = signal_outcomes[path.path_id][prev_node_id]
-
-                        edge_key = (prev_node_id, node_id, edge_label)
-                        if edge_key not in seen_edges:
-                            # Use dashed edge if previous node is external signal
-                            if prev_node_id.startswith("ext_sig_"):
-                                if edge_label:
-                                    edge = f"{prev_node_id} -- {edge_label} -.signal.-> {node_id}"
-                                    edges.append(edge)
-                                else:
-                                    edges.append(f"{prev_node_id} -.signal.-> {node_id}")
-                            else:
-                                if edge_label:
-                                    edges.append(f"{prev_node_id} -- {edge_label} --> {node_id}")
-                                else:
-                                    edges.append(f"{prev_node_id} --> {node_id}")
-                            seen_edges.add(edge_key)
-
-                        prev_node_id = node_id
-
-                    elif is_child_workflow:
-                        # Child workflow node - use deterministic ID based on name + line number
-                        # Format: child_{workflow_name}_{line} (lowercase for consistency)
-                        if step.line_number is None:
-                            raise ValueError(
-                                f"Child workflow step '{step.name}' missing line_number "
-                                f"in path {path.path_id}"
-                            )
+        Args:
+            paths: Execution paths to render.
+            context: Configuration context for labels and word splitting.
 
-                        node_id = f"child_{step.name.lower()}_{step.line_number}"
+        Returns:
+            Tuple of (complete Mermaid markdown string, RenderStats); see
+            to_mermaid().
 
-                        # Apply word splitting if enabled
-                        display_name = step.name
-                        if context.split_names_by_words:
-                            display_name = re.sub(r"([a-z])([A-Z])", r"\1 \2", step.name)
+        Raises:
+            ValueError: If any step name is None/empty or required step metadata
+                is missing.
+        """
+        nodes, edges = self._collect_graph(paths, context)
+        stats = RenderStats(n_nodes=len(nodes), n_edges=len(edges), n_paths=len(paths))
+        return "\n".join(_emit_lines(nodes, edges)), stats
 
-                        # Add child workflow node definition (deduplicated by dict key)
-                        if node_id not in node_definitions:
-                            child_workflow_node = GraphNode(
-                                node_id, NodeType.CHILD_WORKFLOW, display_name
-                            )
-                            node_definitions[node_id] = child_workflow_node.to_mermaid()
-
-                        # Add edge from previous node to child workflow node
-                        # Check if previous node was a decision or signal to add appropriate label
-                        edge_label = ""
-                        if prev_node_id in path.decisions:
-                            # Previous node is a decision - check its value
-                            decision_value = path.decisions[prev_node_id]
-                            edge_label = (
-                                context.decision_true_label
-                                if decision_value
-                                else context.decision_false_label
-                            )
-                        elif prev_node_id in signal_outcomes[path.path_id]:
-                            # Previous node is a signal - use its outcome as label
-                            edge_label = signal_outcomes[path.path_id][prev_node_id]
-
-                        edge_key = (prev_node_id, node_id, edge_label)
-                        if edge_key not in seen_edges:
-                            # Use dashed edge if previous node is external signal
-                            if prev_node_id.startswith("ext_sig_"):
-                                if edge_label:
-                                    edge = f"{prev_node_id} -- {edge_label} -.signal.-> {node_id}"
-                                    edges.append(edge)
-                                else:
-                                    edges.append(f"{prev_node_id} -.signal.-> {node_id}")
-                            else:
-                                if edge_label:
-                                    edges.append(f"{prev_node_id} -- {edge_label} --> {node_id}")
-                                else:
-                                    edges.append(f"{prev_node_id} --> {node_id}")
-                            seen_edges.add(edge_key)
-
-                        prev_node_id = node_id
+    def _collect_graph(
+        self, paths: list[GraphPath], context: GraphBuildingContext
+    ) -> tuple[dict[str, GraphNode], dict[tuple[str, str, str], bool]]:
+        """Walk all paths and collect the unique nodes and edges of the graph.
 
-                    else:
-                        # This is an activity node
-                        # Use activity NAME as node ID for natural reconvergence (.NET pattern)
-                        # This makes the same activity across paths become the same node
-                        node_id = step.name
+        Args:
+            paths: Execution paths to render.
+            context: Configuration context for labels and word splitting.
 
-                        # Apply word splitting if enabled
-                        display_name = step.name
-                        if context.split_names_by_words:
-                            display_name = re.sub(r"([a-z])([A-Z])", r"\1 \2", step.name)
+        Returns:
+            Tuple of (node_id -> GraphNode, (src, dst, label) -> dashed), both in
+            first-seen order.
 
-                        # Add activity node definition (deduplicated by dict key)
-                        if node_id not in node_definitions:
-                            node_definitions[node_id] = f"{node_id}[{display_name}]"
+        Raises:
+            ValueError: If any step name is None/empty or required step metadata
+                is missing.
+        """
+        # Walk every path once, collecting unique nodes and edges.
+        # Deduplication is intrinsic to insertion: nodes is keyed by node_id and
+        # edges by (src, dst, label), so shared nodes across paths cost one O(1)
+        # dict operation each. Dict insertion order preserves first-seen order.
+        nodes: dict[str, GraphNode] = {}
+        edges: dict[tuple[str, str, str], bool] = {}  # (src, dst, label) -> dashed
 
-                        # Add edge from previous node to this activity
-                        # Check if previous node was a decision or signal to add appropriate label
-                        edge_label = ""
-                        if prev_node_id in path.decisions:
-                            # Previous node is a decision - check its value
-                            decision_value = path.decisions[prev_node_id]
-                            edge_label = (
-                                context.decision_true_label
-                                if decision_value
-                                else context.decision_false_label
-                            )
-                        elif prev_node_id in signal_outcomes[path.path_id]:
-                            # Previous node is a signal - use its outcome as label
-                            edge_label = signal_outcomes[path.path_id][prev_node_id]
-
-                        edge_key = (prev_node_id, node_id, edge_label)
-                        if edge_key not in seen_edges:
-                            # Use dashed edge if previous node is external signal
-                            if prev_node_id.startswith("ext_sig_"):
-                                if edge_label:
-                                    edge = f"{prev_node_id} -- {edge_label} -.signal.-> {node_id}"
-                                    edges.append(edge)
-                                else:
-                                    edges.append(f"{prev_node_id} -.signal.-> {node_id}")
-                            else:
-                                if edge_label:
-                                    edges.append(f"{prev_node_id} -- {edge_label} --> {node_id}")
-                                else:
-                                    edges.append(f"{prev_node_id} --> {node_id}")
-                            seen_edges.add(edge_key)
-
-                        prev_node_id = node_id
+        # Handle empty paths (edge case: Start -> End only)
+        nodes["s"] = GraphNode("s", NodeType.START, context.start_node_label)
+        if not paths:
+            nodes["e"] = GraphNode("e", NodeType.END, context.end_node_label)
+            edges[("s", "e", "")] = False
 
-                # Add End node
-                if "e" not in node_definitions:
-                    node_definitions["e"] = f"e(({context.end_node_label}))"
+        # Bind hot-loop callables and labels to locals; this loop runs once per
+        # step of every path and dominates render time for large graphs.
+        step_to_node = self._step_to_node
+        add_node = nodes.setdefault
+        add_edge = edges.setdefault
+        true_label = context.decision_true_label
+        false_label = context.decision_false_label
 
-                # Record edge to End node
-                # Check if previous node was a decision or signal to add appropriate label
-                edge_label_to_end = ""
-                if prev_node_id in path.decisions:
-                    # Previous node is a decision - check its value
-                    decision_value = path.decisions[prev_node_id]
-                    edge_label_to_end = (
-                        context.decision_true_label
-                        if decision_value
-                        else context.decision_false_label
+        for path in paths:
+            # Signal outcomes on this path label the edges leaving each signal node
+            signal_outcomes = {
+                step.name: step.signal_outcome
+                for step in path.steps
+                if step.node_type == "signal" and step.signal_outcome
+            }
+            decisions = path.decisions
+
+            prev_node_id = "s"
+            for step_index, step in enumerate(path.steps, 1):
+                # Validate step
+                if step.name is None or step.name == "":
+                    raise ValueError(
+                        f"Step name cannot be None or empty string in path "
+                        f"{path.path_id} at step index {step_index}"
                     )
-                elif prev_node_id in signal_outcomes[path.path_id]:
-                    # Previous node is a signal - use its outcome as label
-                    edge_label_to_end = signal_outcomes[path.path_id][prev_node_id]
 
-                edge_key = (prev_node_id, "e", edge_label_to_end)
-                if edge_key not in seen_edges:
-                    # Use dashed edge if previous node is external signal
-                    if prev_node_id.startswith("ext_sig_"):
-                        if edge_label_to_end:
-                            edge = f"{prev_node_id} -- {edge_label_to_end} -.signal.-> e"
-                            edges.append(edge)
-                        else:
-                            edges.append(f"{prev_node_id} -.signal.-> e")
-                    else:
-                        if edge_label_to_end:
-                            edges.append(f"{prev_node_id} -- {edge_label_to_end} --> e")
-                        else:
-                            edges.append(f"{prev_node_id} --> e")
-                    seen_edges.add(edge_key)
-
-        # Second pass: build output with nodes first, then edges
-        lines: list[str] = []
-        lines.append("```mermaid")
-        lines.append("flowchart LR")
+                node = step_to_node(step, path.path_id, context)
+                if node is None:
+                    continue
+                node_id = node.node_id
+                add_node(node_id, node)
+
+                # Label the edge with the outcome of a preceding decision/signal
+                if prev_node_id in decisions:
+                    label = true_label if decisions[prev_node_id] else false_label
+                else:
+                    label = signal_outcomes.get(prev_node_id, "")
+
+                # External signal edges, and edges leaving one, are dashed
+                dashed = step.node_type == "external_signal" or prev_node_id.startswith(
+                    "ext_sig_"
+                )
+                add_edge((prev_node_id, node_id, label), dashed)
+                prev_node_id = node_id
 
-        # Add all node definitions (preserve order: s, then numbered/decision nodes, then e)
-        # Collect numeric and decision node IDs separately
-        numeric_ids = []
-        decision_ids = []
+            # Record edge to End node
+            if "e" not in nodes:
+                nodes["e"] = GraphNode("e", NodeType.END, context.end_node_label)
+            label = _edge_label(prev_node_id, path, signal_outcomes, context)
+            add_edge((prev_node_id, "e", label), prev_node_id.startswith("ext_sig_"))
 
-        for node_id in node_definitions.keys():
-            if node_id == "s" or node_id == "e":
-                continue
-            if node_id.isdigit():
-                numeric_ids.append(int(node_id))
-            else:
-                decision_ids.append(node_id)
+        return nodes, edges
 
-        numeric_ids.sort()
+    def _step_to_node(
+        self, step: PathStep, path_id: str, context: GraphBuildingContext
+    ) -> GraphNode | None:
+        """Build the graph node a path step renders as.
 
-        # Output nodes in order: s, numeric nodes, decision nodes, e
-        output_order = ["s"] + [str(i) for i in numeric_ids] + sorted(decision_ids) + ["e"]
+        Node IDs are chosen so equivalent steps on different paths reconverge:
+        activities and signals use their name, decisions their decision ID, and
+        child workflows / external signals a deterministic name + line ID.
 
-        for node_id in output_order:
-            if node_id in node_definitions:
-                lines.append(node_definitions[node_id])
+        Args:
+            step: Path step to convert.
+            path_id: ID of the path containing the step, for error messages.
+            context: Configuration context for labels and word splitting.
 
-        # Add all edge definitions
-        for edge in edges:
-            lines.append(edge)
+        Returns:
+            GraphNode for the step, or None if the step is hidden by the
+            configuration (external signals with show_external_signals=False).
 
-        # Add style directives for external signal nodes (orange/amber color)
-        for node_id, node_def in node_definitions.items():
-            if node_id.startswith("ext_sig_"):
-                lines.append(f"style {node_id} fill:#fff4e6,stroke:#ffa500")
+        Raises:
+            ValueError: If a decision step has no decision_id, or a child workflow
+                or external signal step has no line_number.
+        """
+        if step.node_type == "external_signal":
+            # External signal node - skip if show_external_signals is False
+            if not context.show_external_signals:
+                return None
+            if step.line_number is None:
+                raise ValueError(
+                    f"External signal step '{step.name}' missing line_number "
+                    f"in path {path_id}"
+                )
+            # Format label based on external_signal_label_style
+            if context.external_signal_label_style == "target-pattern":
+                target = step.target_workflow_pattern or "<unknown>"
+                display_name = f"Signal '{step.name}' to {target}"
+            else:  # "name-only"
+                display_name = f"Signal '{step.name}'"
+            # Deterministic ID: ext_sig_{signal_name}_{line_number}. Constructed
+            # IDs are interned so the node/edge dicts share one object per ID
+            # across all paths.
+            return GraphNode(
+                sys.intern(f"ext_sig_{step.name}_{step.line_number}"),
+                NodeType.EXTERNAL_SIGNAL,
+                display_name,
+            )
+
+        display_name = _split_words(step.name) if context.split_names_by_words else step.name
+
+        if step.node_type == "signal":
+            # Signal node - use signal name as node ID for reconvergence
+            return GraphNode(step.name, NodeType.SIGNAL, display_name)
+
+        if step.node_type == "decision":
+            if step.decision_id is None:
+                raise ValueError(
+                    f"Decision step '{step.name}' missing decision_id in path {path_id}"
+                )
+            return GraphNode(step.decision_id, NodeType.DECISION, display_name)
 
-        # Close Mermaid fence
-        lines.append("```")
+        if step.node_type == "child_workflow":
+            # Deterministic ID: child_{workflow_name}_{line} (lowercase for consistency)
+            if step.line_number is None:
+                raise ValueError(
+                    f"Child workflow step '{step.name}' missing line_number in path {path_id}"
+                )
+            return GraphNode(
+                child_workflow_node_id(step.name, step.line_number),
+                NodeType.CHILD_WORKFLOW,
+                display_name,
+            )
 
-        return "\n".join(lines)
+        # Activity node - use activity NAME as node ID for natural reconvergence
+        # (.NET pattern): the same activity across paths becomes the same node
+        return GraphNode(step.name, NodeType.ACTIVITY, display_name)
 
     def render_signal_graph(
         self,
@@ -565,8 +640,7 @@ class MermaidRenderer:
 
             # Render workflow internal nodes (activities, decisions, etc.)
             internal_lines = self._render_workflow_internal(metadata, context)
-            for line in internal_lines:
-                lines.append(f"        {line}")
+            lines.extend(f"        {line}" for line in internal_lines)
 
             # Render signal handlers as hexagon nodes
             for handler in metadata.signal_handlers:
@@ -701,18 +775,14 @@ class MermaidRenderer:
                         node_id = f"{step.decision_id}_{workflow_name}"
                         display_name = step.name
                         if context.split_names_by_words:
-                            display_name = re.sub(
-                                r"([a-z])([A-Z])", r"\1 \2", step.name
-                            )
+                            display_name = _split_words(step.name)
                         if node_id not in node_definitions:
                             node_definitions[node_id] = f"{node_id}{{{display_name}}}"
                     elif step.node_type == "signal":
                         node_id = f"{step.name}_{workflow_name}"
                         display_name = step.name
                         if context.split_names_by_words:
-                            display_name = re.sub(
-                                r"([a-z])([A-Z])", r"\1 \2", step.name
-                            )
+                            display_name = _split_words(step.name)
                         if node_id not in node_definitions:
                             signal_node = GraphNode(
                                 node_id, NodeType.SIGNAL, display_name
@@ -724,9 +794,7 @@ class MermaidRenderer:
                         node_id = f"child_{step.name.lower()}_{step.line_number}_{workflow_name}"
                         display_name = step.name
                         if context.split_names_by_words:
-                            display_name = re.sub(
-                                r"([a-z])([A-Z])", r"\1 \2", step.name
-                            )
+                            display_name = _split_words(step.name)
                         if node_id not in node_definitions:
                             child_node = GraphNode(
                                 node_id, NodeType.CHILD_WORKFLOW, display_name
@@ -753,9 +821,7 @@ class MermaidRenderer:
                         node_id = f"{step.name}_{workflow_name}"
                         display_name = step.name
                         if context.split_names_by_words:
-                            display_name = re.sub(
-                                r"([a-z])([A-Z])", r"\1 \2", step.name
-                            )
+                            display_name = _split_words(step.name)
                         if node_id not in node_definitions:
                             node_definitions[node_id] = f"{node_id}[{display_name}]"
 
@@ -822,8 +888,7 @@ class MermaidRenderer:
             lines.append(node_definitions[end_id])
 
         # Output edges
-        for edge in edges:
-            lines.append(edge)
+        lines.extend(edges)
 
         return lines
 
@@ -1,7 +1,115 @@
 """Pytest configuration and shared fixtures."""
 
+import ast
+import functools
+from collections.abc import Callable
+from pathlib import Path
+
 import pytest
 
+from temporalio_graphs._internal.graph_models import WorkflowCallGraph, WorkflowMetadata
+from temporalio_graphs.analyzer import WorkflowAnalyzer
+from temporalio_graphs.call_graph_analyzer import WorkflowCallGraphAnalyzer
+from temporalio_graphs.context import GraphBuildingContext
+from temporalio_graphs.renderer import MermaidRenderer
+
+SAMPLE_WORKFLOWS_DIR = Path(__file__).parent / "fixtures" / "sample_workflows"
+
+
+@pytest.fixture(scope="session")
+def renderer() -> MermaidRenderer:
+    """Shared MermaidRenderer; the renderer holds no per-render state."""
+    return MermaidRenderer()
+
+
+@pytest.fixture(scope="session")
+def default_context() -> GraphBuildingContext:
+    """Shared default GraphBuildingContext; the context is frozen."""
+    return GraphBuildingContext()
+
+
+@pytest.fixture(scope="session")
+def make_context() -> Callable[..., GraphBuildingContext]:
+    """Build GraphBuildingContext instances, sharing one per distinct set of options.
+
+    The context is frozen and hashable, so equal option sets can safely reuse a
+    single instance. Contexts that carry a graph_output_file are always built
+    fresh so a test's output path is never shared with another test.
+    """
+
+    @functools.lru_cache(maxsize=64)
+    def _cached(**kwargs: object) -> GraphBuildingContext:
+        return GraphBuildingContext(**kwargs)  # type: ignore[arg-type]
+
+    def make(**kwargs: object) -> GraphBuildingContext:
+        if "graph_output_file" in kwargs:
+            return GraphBuildingContext(**kwargs)  # type: ignore[arg-type]
+        return _cached(**kwargs)
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def sample_workflow_asts() -> dict[Path, ast.Module]:
+    """Parsed ASTs for every syntactically valid sample workflow fixture.
+
+    Each fixture file is parsed once per session; fixtures with invalid syntax
+    are omitted so tests exercising parse errors still go through analyze().
+    Raw bytes are handed to the compiler, which decodes them itself exactly as
+    analyze() does, so no intermediate str is built.
+    """
+    asts: dict[Path, ast.Module] = {}
+    for path in sorted(SAMPLE_WORKFLOWS_DIR.glob("*.py")):
+        try:
+            asts[path] = compile(
+                path.read_bytes(),
+                str(path),
+                "exec",
+                flags=ast.PyCF_ONLY_AST,
+                dont_inherit=True,
+            )
+        except SyntaxError:
+            continue
+    return asts
+
+
+@pytest.fixture
+def cached_analyze(
+    sample_workflow_asts: dict[Path, ast.Module],
+) -> Callable[[Path], WorkflowMetadata]:
+    """Analyze a sample workflow fixture from its session-cached AST."""
+
+    def _analyze(workflow_file: Path) -> WorkflowMetadata:
+        return WorkflowAnalyzer().analyze_tree(sample_workflow_asts[workflow_file], workflow_file)
+
+    return _analyze
+
+
+@pytest.fixture(scope="session")
+def call_graph_cached() -> Callable[..., WorkflowCallGraph]:
+    """Build call graphs once per (file, depth, search paths) for the whole session.
+
+    Returned graphs are shared between tests and must be treated as read-only.
+    Tests that expect analysis to raise should call WorkflowCallGraphAnalyzer
+    directly, since exceptions are not cached.
+    """
+
+    @functools.cache
+    def _analyze(
+        entry_workflow: Path, depth: int, search_paths: tuple[Path, ...] | None
+    ) -> WorkflowCallGraph:
+        analyzer = WorkflowCallGraphAnalyzer(GraphBuildingContext(max_expansion_depth=depth))
+        return analyzer.analyze(
+            entry_workflow, search_paths=list(search_paths) if search_paths is not None else None
+        )
+
+    def analyze(
+        entry_workflow: Path, depth: int = 2, search_paths: tuple[Path, ...] | None = None
+    ) -> WorkflowCallGraph:
+        return _analyze(entry_workflow.resolve(), depth, search_paths)
+
+    return analyze
+
 
 @pytest.fixture
 def sample_workflow_code():
@@ -15,12 +15,6 @@ from temporalio_graphs.generator import PathPermutationGenerator
 from temporalio_graphs.renderer import MermaidRenderer
 
 
-@pytest.fixture
-def renderer() -> MermaidRenderer:
-    """Create a MermaidRenderer instance."""
-    return MermaidRenderer()
-
-
 @pytest.fixture
 def no_split_context() -> GraphBuildingContext:
     """Create context with word splitting disabled."""
@@ -77,8 +77,8 @@ class TestParentChildWorkflowIntegration:
         assert "child_paymentworkflow_" in result.lower()
 
         # Verify activities are present with single brackets
-        assert "[validate_order]" in result or "[Validate Order]" in result
-        assert "[send_confirmation]" in result or "[Send Confirmation]" in result
+        assert "validate_order[validate_order]" in result
+        assert "send_confirmation[send_confirmation]" in result
 
         # Verify edge connections
         # validate_order -> child workflow -> send_confirmation
@@ -328,7 +328,7 @@ class TestAnalyzeWorkflowGraphReferenceMode:
         # Verify child workflow appears as node (not expanded)
         # Note: Current implementation shows "PaymentWorkflow" as regular activity
         # Future enhancement: render as [[PaymentWorkflow]] with double brackets
-        assert "PaymentWorkflow" in result or "Payment Workflow" in result
+        assert "PaymentWorkflow[Payment Workflow]" in result
 
         # Verify parent activities are present
         assert "validate_order" in result
@@ -498,7 +498,7 @@ class TestAnalyzeWorkflowGraphSubgraphMode:
         # Future enhancement: verify actual "subgraph OrderWorkflow" syntax
 
         # For now, verify child workflow appears as node
-        assert "PaymentWorkflow" in result or "Payment Workflow" in result
+        assert "PaymentWorkflow[Payment Workflow]" in result
 
 
 class TestAnalyzeWorkflowGraphGoldenFiles:
@@ -24,6 +24,10 @@ from pathlib import Path
 
 from temporalio_graphs import analyze_workflow
 
+SIGNAL_EXAMPLE_DIR = Path(__file__).parent.parent.parent / "examples" / "signal_workflow"
+SIGNAL_WORKFLOW_FILE = SIGNAL_EXAMPLE_DIR / "workflow.py"
+SIGNAL_EXPECTED_OUTPUT_FILE = SIGNAL_EXAMPLE_DIR / "expected_output.md"
+
 
 def _extract_mermaid_content(output: str) -> str:
     """Extract Mermaid content from output.
@@ -112,9 +116,7 @@ def test_signal_workflow_generates_valid_mermaid() -> None:
     shows Signaled/Timeout paths, and produces valid Mermaid with hexagons.
     """
     # Get workflow file path
-    workflow_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "workflow.py"
-    )
+    workflow_file = SIGNAL_WORKFLOW_FILE
 
     # Analyze workflow
     output = analyze_workflow(workflow_file)
@@ -162,12 +164,8 @@ def test_signal_workflow_matches_golden_file() -> None:
     and runtime output matches expected structure.
     """
     # Get file paths
-    workflow_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "workflow.py"
-    )
-    expected_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "expected_output.md"
-    )
+    workflow_file = SIGNAL_WORKFLOW_FILE
+    expected_file = SIGNAL_EXPECTED_OUTPUT_FILE
 
     # AC5: Verify golden file exists
     assert expected_file.exists(), f"Golden file should exist at {expected_file}"
@@ -209,9 +207,7 @@ def test_signal_workflow_generates_two_paths() -> None:
     for 1 signal point (2^1 = 2).
     """
     # Get workflow file path
-    workflow_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "workflow.py"
-    )
+    workflow_file = SIGNAL_WORKFLOW_FILE
 
     # Analyze workflow
     output = analyze_workflow(workflow_file)
@@ -263,9 +259,7 @@ def test_signal_workflow_analysis_performance() -> None:
     meeting NFR-MAINT-2 performance requirements.
     """
     # Get workflow file path
-    workflow_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "workflow.py"
-    )
+    workflow_file = SIGNAL_WORKFLOW_FILE
 
     # Measure analysis time
     start_time = time.time()
@@ -284,9 +278,7 @@ def test_signal_hexagon_syntax_correct() -> None:
     not {Name} (diamond) or [Name] (rectangle).
     """
     # Get workflow file path
-    workflow_file = (
-        Path(__file__).parent.parent.parent / "examples" / "signal_workflow" / "workflow.py"
-    )
+    workflow_file = SIGNAL_WORKFLOW_FILE
 
     # Analyze workflow
     output = analyze_workflow(workflow_file)
@@ -4,14 +4,99 @@ This module tests the WorkflowAnalyzer class which extracts workflow metadata
 from Python source files using static AST analysis.
 """
 
+import ast
+import logging
+import os
 import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Final
 
 import pytest
 
-from temporalio_graphs.analyzer import WorkflowAnalyzer
+from temporalio_graphs._internal.graph_models import WorkflowMetadata
+from temporalio_graphs.analyzer import WorkflowAnalyzer, _parse_source
 from temporalio_graphs.exceptions import WorkflowParseError
 
+# Inline workflow sources, encoded once at import and written with write_bytes().
+_DIRECT_IMPORT_WORKFLOW_SOURCE: Final[bytes] = b"""from temporalio.workflow import defn, run
+
+@defn
+class DirectImportWorkflow:
+    @run
+    async def run(self, name: str) -> str:
+        return f"Hello {name}"
+"""
+
+_NESTED_WORKFLOW_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+class NonWorkflowClass:
+    def some_method(self):
+        pass
+
+@workflow.defn
+class MyWorkflow:
+    @workflow.run
+    async def run(self, name: str) -> str:
+        return f"Hello {name}"
+
+    def helper(self):
+        pass
+
+class AnotherNonWorkflow:
+    pass
+"""
+
+_SYNC_WORKFLOW_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+@workflow.defn
+class SyncWorkflow:
+    @workflow.run
+    def run(self, name: str) -> str:
+        return f"Hello {name}"
+"""
+
+_NO_ACTIVITIES_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+@workflow.defn
+class NoActivityWorkflow:
+    @workflow.run
+    async def run(self) -> str:
+        return "done"
+"""
+
+_NON_ACTIVITY_CALLS_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+@workflow.defn
+class NonActivityWorkflow:
+    @workflow.run
+    async def run(self) -> str:
+        workflow.execute_signal("my_signal")
+        other_module.execute_activity("something")
+        self.helper_method()
+        return "done"
+"""
+
+_NON_PY_WORKFLOW_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+@workflow.defn
+class MyWorkflow:
+    @workflow.run
+    async def run(self, name: str) -> str:
+        return f"Hello {name}"
+"""
+
+_MALFORMED_ACTIVITY_SOURCE: Final[bytes] = b"""from temporalio import workflow
+
+@workflow.defn
+class MalformedActivityWorkflow:
+    @workflow.run
+    async def run(self) -> str:
+        # Malformed: numeric literal as activity (invalid but parseable)
+        await workflow.execute_activity(123, start_to_close_timeout=None)
+        return "done"
+"""
+
 
 @pytest.fixture
 def analyzer() -> WorkflowAnalyzer:
@@ -37,31 +122,31 @@ def test_analyzer_detects_workflow_defn_decorator(
 
 
 def test_analyzer_extracts_workflow_class_name(
-    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+    cached_analyze: Callable[[Path], WorkflowMetadata], fixtures_dir: Path
 ) -> None:
     """Test that analyzer correctly extracts workflow class name."""
     workflow_file = fixtures_dir / "valid_linear_workflow.py"
-    metadata = analyzer.analyze(workflow_file)
+    metadata = cached_analyze(workflow_file)
 
     assert metadata.workflow_class == "MyWorkflow"
 
 
 def test_analyzer_detects_workflow_run_method(
-    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+    cached_analyze: Callable[[Path], WorkflowMetadata], fixtures_dir: Path
 ) -> None:
     """Test that analyzer detects @workflow.run method."""
     workflow_file = fixtures_dir / "valid_linear_workflow.py"
-    metadata = analyzer.analyze(workflow_file)
+    metadata = cached_analyze(workflow_file)
 
     assert metadata.workflow_run_method == "run"
 
 
 def test_analyzer_detects_multiple_methods_in_class(
-    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+    cached_analyze: Callable[[Path], WorkflowMetadata], fixtures_dir: Path
 ) -> None:
     """Test that analyzer only detects run method, ignoring other methods."""
     workflow_file = fixtures_dir / "multiple_methods_workflow.py"
-    metadata = analyzer.analyze(workflow_file)
+    metadata = cached_analyze(workflow_file)
 
     assert metadata.workflow_class == "MyWorkflow"
     assert metadata.workflow_run_method == "run"
@@ -79,7 +164,7 @@ def test_analyzer_no_workflow_defn_raises_error(
 
     error_message = str(exc_info.value)
     assert "Missing @workflow.defn decorator" in error_message
-    assert str(workflow_file.resolve()) in error_message
+    assert os.path.normpath(str(workflow_file)) in error_message
     assert "Add @workflow.defn decorator to workflow class" in error_message
 
 
@@ -95,7 +180,7 @@ def test_analyzer_no_workflow_run_raises_error(
     error_message = str(exc_info.value)
     assert "Missing @workflow.run method" in error_message
     # Note: workflow class name may or may not be in the new error format
-    assert str(workflow_file.resolve()) in error_message
+    assert os.path.normpath(str(workflow_file)) in error_message
 
 
 def test_analyzer_invalid_python_syntax_raises_error(
@@ -109,7 +194,7 @@ def test_analyzer_invalid_python_syntax_raises_error(
 
     error_message = str(exc_info.value)
     assert "Invalid Python syntax" in error_message
-    assert str(workflow_file.resolve()) in error_message
+    assert os.path.normpath(str(workflow_file)) in error_message
 
 
 def test_analyzer_file_not_found_raises_error(analyzer: WorkflowAnalyzer) -> None:
@@ -131,17 +216,13 @@ def test_analyzer_stores_source_line_numbers(
     workflow_file = fixtures_dir / "valid_linear_workflow.py"
     metadata = analyzer.analyze(workflow_file)
 
-    # Line numbers should be tracked internally (verified by successful analysis)
-    # The _line_numbers dict is private, but we can verify correct parsing
     assert metadata.workflow_class == "MyWorkflow"
     assert metadata.workflow_run_method == "run"
 
-    # Verify line numbers are captured in internal state
-    assert hasattr(analyzer, "_line_numbers")
-    assert "workflow_class" in analyzer._line_numbers
-    assert "workflow_run_method" in analyzer._line_numbers
-    assert analyzer._line_numbers["workflow_class"] > 0
-    assert analyzer._line_numbers["workflow_run_method"] > 0
+    # Both elements are recorded with positive source line numbers
+    line_numbers = analyzer.debug_info.line_numbers
+    assert line_numbers.keys() == {"workflow_class", "workflow_run_method"}
+    assert min(line_numbers.values()) > 0
 
 
 def test_analyzer_empty_workflow_class(
@@ -157,12 +238,37 @@ def test_analyzer_empty_workflow_class(
     assert "Missing @workflow.run method" in error_message
 
 
+def test_analyze_tree_matches_analyze(
+    analyzer: WorkflowAnalyzer,
+    fixtures_dir: Path,
+    sample_workflow_asts: dict[Path, ast.Module],
+) -> None:
+    """Test that analyze_tree() on a pre-parsed AST matches analyze() on the file."""
+    workflow_file = fixtures_dir / "signal_with_decision.py"
+    tree = sample_workflow_asts[workflow_file]
+
+    from_tree = WorkflowAnalyzer().analyze_tree(tree, workflow_file)
+    from_file = analyzer.analyze(workflow_file)
+
+    assert from_tree == from_file
+
+
+def test_analyze_tree_missing_workflow_defn_raises_error(analyzer: WorkflowAnalyzer) -> None:
+    """Test that analyze_tree() reports missing @workflow.defn with the given path."""
+    tree = ast.parse("class NotAWorkflow:\n    pass\n")
+
+    with pytest.raises(WorkflowParseError) as exc_info:
+        analyzer.analyze_tree(tree, "/virtual/not_a_workflow.py")
+
+    error_message = str(exc_info.value)
+    assert "Missing @workflow.defn decorator" in error_message
+    assert "not_a_workflow.py" in error_message
+
+
 def test_analyzer_returns_workflow_metadata(
     analyzer: WorkflowAnalyzer, fixtures_dir: Path
 ) -> None:
     """Test that analyzer returns WorkflowMetadata with correct type."""
-    from temporalio_graphs._internal.graph_models import WorkflowMetadata
-
     workflow_file = fixtures_dir / "valid_linear_workflow.py"
     metadata = analyzer.analyze(workflow_file)
 
@@ -191,11 +297,11 @@ def test_metadata_fields_populated_correctly(
 
 
 def test_metadata_total_paths_equals_one(
-    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+    cached_analyze: Callable[[Path], WorkflowMetadata], fixtures_dir: Path
 ) -> None:
     """Test that total_paths is 1 for linear workflows in Epic 2."""
     workflow_file = fixtures_dir / "valid_linear_workflow.py"
-    metadata = analyzer.analyze(workflow_file)
+    metadata = cached_analyze(workflow_file)
 
     assert metadata.total_paths == 1
 
@@ -221,11 +327,11 @@ def test_analyzer_accepts_string_path(
 
 
 def test_analyzer_detects_async_run_method(
-    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+    cached_analyze: Callable[[Path], WorkflowMetadata], fixtures_dir: Path
 ) -> None:
     """Test that analyzer detects async run methods."""
     workflow_file = fixtures_dir / "async_run_workflow.py"
-    metadata = analyzer.analyze(workflow_file)
+    metadata = cached_analyze(workflow_file)
 
     assert metadata.workflow_class == "AsyncWorkflow"
     assert metadata.workflow_run_method == "run"
@@ -259,7 +365,7 @@ def test_error_message_includes_file_path(
         analyzer.analyze(workflow_file)
 
     error_message = str(exc_info.value)
-    assert str(workflow_file.resolve()) in error_message
+    assert os.path.normpath(str(workflow_file)) in error_message
 
 
 def test_error_message_includes_helpful_suggestion(
@@ -276,86 +382,47 @@ def test_error_message_includes_helpful_suggestion(
     assert "Suggestion:" in error_message or "Ensure" in error_message or "Please" in error_message
 
 
-def test_analyzer_imports_workflow_metadata() -> None:
-    """Test that analyzer can import WorkflowMetadata."""
-    from temporalio_graphs._internal.graph_models import WorkflowMetadata
-
-    # Verify import succeeds
-    assert WorkflowMetadata is not None
-
-
-def test_analyzer_uses_workflow_parse_error() -> None:
-    """Test that analyzer uses WorkflowParseError exception."""
-    from temporalio_graphs.exceptions import WorkflowParseError
-
-    # Verify import succeeds
-    assert WorkflowParseError is not None
-
 
-def test_public_methods_have_docstrings(analyzer: WorkflowAnalyzer) -> None:
-    """Test that public methods have docstrings."""
-    # analyze() method should have docstring
-    assert analyzer.analyze.__doc__ is not None
-    assert len(analyzer.analyze.__doc__) > 50
+@pytest.mark.parametrize(
+    ("filename", "source", "needle", "workflow_class", "activity_count"),
+    [
+        # Non-.py extension with valid Python content
+        ("workflow.txt", _NON_PY_WORKFLOW_SOURCE, ".py extension", "MyWorkflow", 0),
+        # Numeric literal as activity reference falls back to a placeholder name
+        (
+            "malformed_activity.py",
+            _MALFORMED_ACTIVITY_SOURCE,
+            "Could not extract activity name",
+            "MalformedActivityWorkflow",
+            1,
+        ),
+    ],
+    ids=["non_py_extension", "malformed_activity_call"],
+)
+def test_analyzer_logs_warning(
+    analyzer: WorkflowAnalyzer,
+    tmp_path: Path,
+    caplog: pytest.LogCaptureFixture,
+    filename: str,
+    source: bytes,
+    needle: str,
+    workflow_class: str,
+    activity_count: int,
+) -> None:
+    """Test that analyzer logs warnings for suspicious input but still succeeds."""
+    workflow_file = tmp_path / filename
+    workflow_file.write_bytes(source)
 
-    # Class should have docstring
-    assert WorkflowAnalyzer.__doc__ is not None
-    assert len(WorkflowAnalyzer.__doc__) > 50
-
-
-def test_docstrings_have_args_section(analyzer: WorkflowAnalyzer) -> None:
-    """Test that docstrings include Args section (Google style)."""
-    # analyze() method docstring should have Args section
-    docstring = analyzer.analyze.__doc__
-    assert docstring is not None
-    assert "Args:" in docstring
-    assert "Returns:" in docstring
-    assert "Raises:" in docstring
-
-
-def test_analyzer_class_extends_ast_node_visitor() -> None:
-    """Test that WorkflowAnalyzer extends ast.NodeVisitor."""
-    import ast
-
-    assert issubclass(WorkflowAnalyzer, ast.NodeVisitor)
-
-
-def test_analyzer_has_analyze_method() -> None:
-    """Test that WorkflowAnalyzer has analyze method with correct signature."""
-    analyzer = WorkflowAnalyzer()
-
-    assert hasattr(analyzer, "analyze")
-    assert callable(analyzer.analyze)
-
-
-def test_analyzer_warns_non_py_extension(
-    analyzer: WorkflowAnalyzer, tmp_path: Path, caplog: pytest.LogCaptureFixture
-) -> None:
-    """Test that analyzer warns when file doesn't have .py extension."""
-    import logging
-
-    # Create a temp file with non-.py extension but valid Python content
-    workflow_file = tmp_path / "workflow.txt"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-@workflow.defn
-class MyWorkflow:
-    @workflow.run
-    async def run(self, name: str) -> str:
-        return f"Hello {name}"
-"""
-    )
-
-    # Capture log warnings
     with caplog.at_level(logging.WARNING, logger="temporalio_graphs.analyzer"):
         metadata = analyzer.analyze(workflow_file)
 
-        # Analysis should succeed despite warning
-        assert metadata.workflow_class == "MyWorkflow"
+    # Analysis should succeed despite warning
+    assert metadata.workflow_class == workflow_class
+    assert len(metadata.activities) == activity_count
+    assert all(a.name.startswith("<unknown_activity_") for a in metadata.activities)
 
-        # Check that warning was logged
-        assert any(".py extension" in record.message for record in caplog.records)
+    # Check that warning was logged
+    assert any(needle in record.message for record in caplog.records)
 
 
 def test_analyzer_direct_decorator_import(
@@ -364,16 +431,7 @@ def test_analyzer_direct_decorator_import(
     """Test that analyzer handles direct decorator imports."""
     # Create workflow with direct import pattern
     workflow_file = tmp_path / "direct_import_workflow.py"
-    workflow_file.write_text(
-        """from temporalio.workflow import defn, run
-
-@defn
-class DirectImportWorkflow:
-    @run
-    async def run(self, name: str) -> str:
-        return f"Hello {name}"
-"""
-    )
+    workflow_file.write_bytes(_DIRECT_IMPORT_WORKFLOW_SOURCE)
 
     metadata = analyzer.analyze(workflow_file)
     assert metadata.workflow_class == "DirectImportWorkflow"
@@ -385,26 +443,7 @@ def test_analyzer_nested_class_doesnt_interfere(
 ) -> None:
     """Test that nested classes or classes outside workflow are ignored."""
     workflow_file = tmp_path / "nested_workflow.py"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-class NonWorkflowClass:
-    def some_method(self):
-        pass
-
-@workflow.defn
-class MyWorkflow:
-    @workflow.run
-    async def run(self, name: str) -> str:
-        return f"Hello {name}"
-
-    def helper(self):
-        pass
-
-class AnotherNonWorkflow:
-    pass
-"""
-    )
+    workflow_file.write_bytes(_NESTED_WORKFLOW_SOURCE)
 
     metadata = analyzer.analyze(workflow_file)
     assert metadata.workflow_class == "MyWorkflow"
@@ -414,16 +453,7 @@ class AnotherNonWorkflow:
 def test_analyzer_sync_run_method(analyzer: WorkflowAnalyzer, tmp_path: Path) -> None:
     """Test that analyzer handles non-async (sync) run methods."""
     workflow_file = tmp_path / "sync_workflow.py"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-@workflow.defn
-class SyncWorkflow:
-    @workflow.run
-    def run(self, name: str) -> str:
-        return f"Hello {name}"
-"""
-    )
+    workflow_file.write_bytes(_SYNC_WORKFLOW_SOURCE)
 
     metadata = analyzer.analyze(workflow_file)
     assert metadata.workflow_class == "SyncWorkflow"
@@ -474,16 +504,7 @@ def test_analyzer_detects_duplicate_activities(
 def test_analyzer_no_activities_workflow(analyzer: WorkflowAnalyzer, tmp_path: Path) -> None:
     """Test that analyzer handles workflows with no activity calls."""
     workflow_file = tmp_path / "no_activities.py"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-@workflow.defn
-class NoActivityWorkflow:
-    @workflow.run
-    async def run(self) -> str:
-        return "done"
-"""
-    )
+    workflow_file.write_bytes(_NO_ACTIVITIES_SOURCE)
 
     metadata = analyzer.analyze(workflow_file)
     assert len(metadata.activities) == 0
@@ -534,12 +555,12 @@ def test_analyzer_activity_line_numbers(
     # Verify activities are detected (internal line tracking)
     assert len(metadata.activities) >= 1
 
-    # Verify that line numbers are stored internally
-    assert hasattr(analyzer, "_activities")
-    assert len(analyzer._activities) >= 1
+    # Activities recorded by the analyzer match the returned metadata
+    debug_activities = analyzer.debug_info.activities
+    assert debug_activities == metadata.activities
 
     # Check that Activity objects contain name and line_num
-    for activity in analyzer._activities:
+    for activity in debug_activities:
         assert isinstance(activity.name, str)
         assert isinstance(activity.line_num, int)
         assert activity.line_num > 0
@@ -550,19 +571,7 @@ def test_analyzer_ignores_non_activity_calls(
 ) -> None:
     """Test that analyzer ignores non-activity method calls."""
     workflow_file = tmp_path / "non_activity_calls.py"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-@workflow.defn
-class NonActivityWorkflow:
-    @workflow.run
-    async def run(self) -> str:
-        workflow.execute_signal("my_signal")
-        other_module.execute_activity("something")
-        self.helper_method()
-        return "done"
-"""
-    )
+    workflow_file.write_bytes(_NON_ACTIVITY_CALLS_SOURCE)
 
     metadata = analyzer.analyze(workflow_file)
     # Should have no activities since only non-activity calls are present
@@ -617,38 +626,6 @@ def test_analyzer_backward_compatibility_with_story_2_2(
     assert isinstance(metadata.activities, list)
 
 
-def test_analyzer_handles_malformed_activity_call(
-    analyzer: WorkflowAnalyzer, tmp_path: Path, caplog: pytest.LogCaptureFixture
-) -> None:
-    """Test that analyzer logs warning for malformed activity calls."""
-    import logging
-
-    workflow_file = tmp_path / "malformed_activity.py"
-    workflow_file.write_text(
-        """from temporalio import workflow
-
-@workflow.defn
-class MalformedActivityWorkflow:
-    @workflow.run
-    async def run(self) -> str:
-        # Malformed: numeric literal as activity (invalid but parseable)
-        await workflow.execute_activity(123, start_to_close_timeout=None)
-        return "done"
-"""
-    )
-
-    # Capture warnings
-    with caplog.at_level(logging.WARNING, logger="temporalio_graphs.analyzer"):
-        metadata = analyzer.analyze(workflow_file)
-
-        # Should detect the malformed activity with placeholder name
-        assert len(metadata.activities) == 1
-        assert any(a.name.startswith("<unknown_activity_") for a in metadata.activities)
-
-        # Check that warning was logged
-        assert any("Could not extract activity name" in record.message for record in caplog.records)
-
-
 # ============================================================================
 # Signal Detection Integration Tests (Story 4.1)
 # ============================================================================
@@ -861,4 +838,36 @@ def test_analyzer_signal_handlers_is_tuple(
 
     # Verify it's a tuple, not a list
     assert isinstance(metadata.signal_handlers, tuple)
-    assert len(metadata.signal_handlers) == 2
\ No newline at end of file
+    assert len(metadata.signal_handlers) == 2
+
+
+def test_analyzer_caches_resolved_absolute_paths(
+    analyzer: WorkflowAnalyzer, fixtures_dir: Path
+) -> None:
+    """Test that repeated analysis of an absolute path reuses the resolved Path."""
+    workflow_file = fixtures_dir / "valid_linear_workflow.py"
+    first = analyzer.analyze(workflow_file)
+    second = analyzer.analyze(workflow_file)
+
+    assert first.source_file is second.source_file
+    assert analyzer._resolved_paths[str(workflow_file)] == workflow_file.resolve()
+
+
+def test_analyze_reuses_parsed_tree_until_file_changes(
+    analyzer: WorkflowAnalyzer, fixtures_dir: Path, tmp_path: Path
+) -> None:
+    """Test that unchanged files are parsed once and edited files are re-parsed."""
+    workflow_file = tmp_path / "workflow.py"
+    source = (fixtures_dir / "valid_linear_workflow.py").read_bytes()
+    workflow_file.write_bytes(source)
+    _parse_source.cache_clear()
+
+    analyzer.analyze(workflow_file)
+    analyzer.analyze(workflow_file)
+    assert (_parse_source.cache_info().hits, _parse_source.cache_info().misses) == (1, 1)
+
+    # Appending changes size (and mtime), so the stale tree is not reused
+    workflow_file.write_bytes(source + b"\n# edited\n")
+    analyzer.analyze(workflow_file)
+    assert _parse_source.cache_info().misses == 2
+
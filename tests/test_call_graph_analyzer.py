@@ -1,8 +1,14 @@
 """Unit tests for WorkflowCallGraphAnalyzer (Story 6.3)."""
 
-import pytest
+import ast
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+import pytest
 
+from temporalio_graphs._internal.graph_models import WorkflowCallGraph
+from temporalio_graphs.analyzer import WorkflowAnalyzer
 from temporalio_graphs.call_graph_analyzer import WorkflowCallGraphAnalyzer
 from temporalio_graphs.context import GraphBuildingContext
 from temporalio_graphs.exceptions import (
@@ -10,17 +16,151 @@ from temporalio_graphs.exceptions import (
     CircularWorkflowError,
 )
 
+_PARENT_CHILD_DIR = Path("tests/fixtures/parent_child_workflows")
 
+_NONEXISTENT_CHILD_SRC = """
+from temporalio import workflow
+
+@workflow.defn
+class TestParent:
+    @workflow.run
+    async def run(self):
+        await workflow.execute_child_workflow("NonExistentWorkflow")
+"""
+
+_MALFORMED_SRC = "this is not valid python syntax {{{"
+
+_SHARED_CHILD_SRC = """
+from temporalio import workflow
+
+@workflow.defn
+class SharedChildWorkflow:
+    @workflow.run
+    async def run(self):
+        return "shared"
+"""
+
+# Two parents (ChildA, ChildB) that both call SharedChildWorkflow
+_MULTI_PARENT_SRC = """
+from temporalio import workflow
+
+@workflow.defn
+class ChildA:
+    @workflow.run
+    async def run(self):
+        from shared_child import SharedChildWorkflow
+        await workflow.execute_child_workflow(SharedChildWorkflow)
+        return "a"
+
+@workflow.defn
+class ChildB:
+    @workflow.run
+    async def run(self):
+        from shared_child import SharedChildWorkflow
+        await workflow.execute_child_workflow(SharedChildWorkflow)
+        return "b"
+
+@workflow.defn
+class MultiParent:
+    @workflow.run
+    async def run(self):
+        await workflow.execute_child_workflow(ChildA)
+        await workflow.execute_child_workflow(ChildB)
+        return "parent"
+"""
+
+# Sources above are constants, so parse them once at import and hand the trees to
+# the analyzer's AST cache instead of re-parsing the written files in every test.
+_NONEXISTENT_CHILD_AST = ast.parse(_NONEXISTENT_CHILD_SRC)
+_SHARED_CHILD_AST = ast.parse(_SHARED_CHILD_SRC)
+_MULTI_PARENT_AST = ast.parse(_MULTI_PARENT_SRC)
+
+
+@pytest.fixture(scope="session")
+def nonexistent_child_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Parent workflow calling a child that exists nowhere on disk."""
+    path = tmp_path_factory.mktemp("nonexistent_child") / "parent.py"
+    path.write_text(_NONEXISTENT_CHILD_SRC)
+    return path
+
+
+@pytest.fixture(scope="session")
+def malformed_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Workflow file containing invalid Python syntax."""
+    path = tmp_path_factory.mktemp("malformed") / "malformed.py"
+    path.write_text(_MALFORMED_SRC)
+    return path
+
+
+@pytest.fixture(scope="session")
+def multi_parent_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory with two parents sharing one child; returns the entry workflow file."""
+    tree_dir = tmp_path_factory.mktemp("multi_parent")
+    (tree_dir / "shared_child.py").write_text(_SHARED_CHILD_SRC)
+    parent = tree_dir / "multi_parent.py"
+    parent.write_text(_MULTI_PARENT_SRC)
+    return parent
+
+
+_LATTICE_PARENTS = 20
+_LATTICE_CHILDREN = 20
+
+
+def _workflow_class_src(name: str, children: list[str]) -> str:
+    calls = "".join(f"        await workflow.execute_child_workflow({c})\n" for c in children)
+    return (
+        f"@workflow.defn\nclass {name}:\n    @workflow.run\n    async def run(self):\n"
+        f"{calls}        return {name!r}\n\n"
+    )
+
+
+@pytest.fixture(scope="session")
+def lattice_tree(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Root -> N parents -> the same M shared children; returns the root file."""
+    tree_dir = tmp_path_factory.mktemp("lattice")
+    children = [f"LatticeChild{i}" for i in range(_LATTICE_CHILDREN)]
+    parents = [f"LatticeParent{i}" for i in range(_LATTICE_PARENTS)]
+
+    (tree_dir / "lattice_children.py").write_text(
+        "from temporalio import workflow\n\n"
+        + "".join(_workflow_class_src(name, []) for name in children)
+    )
+    (tree_dir / "lattice_parents.py").write_text(
+        "from temporalio import workflow\n"
+        f"from lattice_children import {', '.join(children)}\n\n"
+        + "".join(_workflow_class_src(name, children) for name in parents)
+    )
+    root = tree_dir / "lattice_root.py"
+    root.write_text(
+        "from temporalio import workflow\n"
+        f"from lattice_parents import {', '.join(parents)}\n\n"
+        + _workflow_class_src("LatticeRoot", parents)
+    )
+    return root
+
+
+@pytest.fixture(scope="class")
+def graphs(call_graph_cached: Callable[..., WorkflowCallGraph]) -> dict[str, WorkflowCallGraph]:
+    """Depth-2 call graphs for the shared fixture workflows, built once per class."""
+    return {
+        name: call_graph_cached(_PARENT_CHILD_DIR / file_name)
+        for name, file_name in {
+            "simple": "simple_parent.py",
+            "multi": "multi_child_parent.py",
+            "nested": "nested_grandchild.py",
+            "same_file": "same_file_parent_child.py",
+            "empty": "simple_child.py",
+        }.items()
+    }
+
+
+@pytest.mark.xdist_group("call_graph")
 class TestWorkflowCallGraphAnalyzer:
     """Test WorkflowCallGraphAnalyzer functionality."""
 
-    def test_simple_parent_child_analysis(self) -> None:
+    def test_simple_parent_child_analysis(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test simple parent-child analysis (1 parent, 1 child) - AC1, AC6."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
-        call_graph = analyzer.analyze(parent_file)
+        call_graph = graphs["simple"]
 
         # Verify root workflow
         assert call_graph.root_workflow.workflow_class == "SimpleParentWorkflow"
@@ -38,13 +178,9 @@ class TestWorkflowCallGraphAnalyzer:
         assert call_graph.root_workflow is not child_metadata
         assert call_graph.root_workflow.source_file != child_metadata.source_file
 
-    def test_multiple_children_analysis(self) -> None:
+    def test_multiple_children_analysis(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test multiple children (1 parent, 2 different children) - AC1."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/multi_child_parent.py")
-        call_graph = analyzer.analyze(parent_file)
+        call_graph = graphs["multi"]
 
         # Verify both children discovered
         assert call_graph.total_workflows == 3
@@ -55,13 +191,9 @@ class TestWorkflowCallGraphAnalyzer:
         assert ("MultiChildParentWorkflow", "ChildWorkflowA") in call_graph.call_relationships
         assert ("MultiChildParentWorkflow", "ChildWorkflowB") in call_graph.call_relationships
 
-    def test_nested_children_analysis(self) -> None:
+    def test_nested_children_analysis(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test nested children (parent → child → grandchild, depth=2) - AC1, AC4."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/nested_grandchild.py")
-        call_graph = analyzer.analyze(parent_file)
+        call_graph = graphs["nested"]
 
         # Verify all three levels discovered (depth 2 = parent + child + grandchild)
         assert call_graph.total_workflows == 3
@@ -84,67 +216,95 @@ class TestWorkflowCallGraphAnalyzer:
         with pytest.raises(CircularWorkflowError) as exc_info:
             analyzer.analyze(parent_file)
 
-        # Verify workflow chain is included in error
+        # Verify workflow chain is a proper cycle witness in call order
         error = exc_info.value
-        assert "CircularWorkflowA" in error.workflow_chain
-        assert "CircularWorkflowB" in error.workflow_chain
-        # Last element should be the one creating the cycle
-        assert error.workflow_chain[-1] == "CircularWorkflowA"
-
-    def test_depth_limit_enforcement(self) -> None:
-        """Test depth limit enforcement (reject workflows at depth 3) - AC4."""
-        # Set max_expansion_depth to 1 (only root + direct children, no grandchildren)
-        context = GraphBuildingContext(max_expansion_depth=1)
+        assert error.workflow_chain == [
+            "CircularWorkflowA",
+            "CircularWorkflowB",
+            "CircularWorkflowA",
+        ]
+        # First and last elements are the workflow that closes the cycle
+        assert error.workflow_chain[0] == error.workflow_chain[-1]
+
+    def test_circular_detection_visits_each_edge_once(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cycle detection is a single DFS pass over the call graph.
+
+        Workflows on the current chain are GRAY; reaching a GRAY workflow again is
+        the cycle. Each workflow's children must be expanded at most once, so
+        expansions never exceed the number of call edges (A → B, B → A).
+        """
+        context = GraphBuildingContext(max_expansion_depth=3)
         analyzer = WorkflowCallGraphAnalyzer(context)
 
-        parent_file = Path("tests/fixtures/parent_child_workflows/nested_grandchild.py")
-        call_graph = analyzer.analyze(parent_file)
+        expansions: list[str] = []
+        original = analyzer._analyze_children
 
-        # With depth=1, should only analyze parent + child (no grandchild)
-        assert call_graph.total_workflows == 2  # Parent + ChildWithGrandchildWorkflow
-        assert "ChildWithGrandchildWorkflow" in call_graph.child_workflows
-        # Grandchild should NOT be discovered due to depth limit
-        assert "GrandchildWorkflow" not in call_graph.child_workflows
+        def counting_analyze_children(**kwargs: Any) -> None:
+            expansions.append(kwargs["parent_metadata"].workflow_class)
+            original(**kwargs)
+
+        monkeypatch.setattr(analyzer, "_analyze_children", counting_analyze_children)
+
+        parent_file = Path("tests/fixtures/parent_child_workflows/circular_a.py")
+        with pytest.raises(CircularWorkflowError):
+            analyzer.analyze(parent_file)
+
+        edges_in_graph = 2
+        assert expansions == ["CircularWorkflowA", "CircularWorkflowB"]
+        assert len(expansions) <= edges_in_graph
+        # The GRAY chain is fully unwound after the error propagates
+        assert analyzer._visited_workflows == {}
+
+    @pytest.mark.parametrize(
+        ("depth", "expected_total", "expected_present", "expected_absent"),
+        [
+            (0, 1, [], ["ChildWithGrandchildWorkflow", "GrandchildWorkflow"]),
+            (1, 2, ["ChildWithGrandchildWorkflow"], ["GrandchildWorkflow"]),
+            (2, 3, ["ChildWithGrandchildWorkflow", "GrandchildWorkflow"], []),
+        ],
+    )
+    def test_depth_limits(
+        self,
+        call_graph_cached: Callable[..., WorkflowCallGraph],
+        depth: int,
+        expected_total: int,
+        expected_present: list[str],
+        expected_absent: list[str],
+    ) -> None:
+        """Test max_expansion_depth limits how deep children are analyzed - AC4."""
+        parent_file = Path("tests/fixtures/parent_child_workflows/nested_grandchild.py")
+        call_graph = call_graph_cached(parent_file, depth=depth)
+
+        assert call_graph.total_workflows == expected_total
+        for workflow_name in expected_present:
+            assert workflow_name in call_graph.child_workflows
+        # Workflows beyond the depth limit should NOT be discovered
+        for workflow_name in expected_absent:
+            assert workflow_name not in call_graph.child_workflows
+        # Root workflow still has its child_workflow_calls detected at any depth
+        assert len(call_graph.root_workflow.child_workflow_calls) == 1
 
-    def test_child_workflow_not_found_error(self) -> None:
+    def test_child_workflow_not_found_error(self, nonexistent_child_file: Path) -> None:
         """Test child workflow not found error with clear message - AC8."""
         context = GraphBuildingContext(max_expansion_depth=2)
         analyzer = WorkflowCallGraphAnalyzer(context)
+        analyzer._ast_cache[nonexistent_child_file.resolve()] = _NONEXISTENT_CHILD_AST
 
-        # Create a temporary parent workflow that references non-existent child
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("""
-from temporalio import workflow
+        with pytest.raises(ChildWorkflowNotFoundError) as exc_info:
+            analyzer.analyze(nonexistent_child_file)
 
-@workflow.defn
-class TestParent:
-    @workflow.run
-    async def run(self):
-        await workflow.execute_child_workflow("NonExistentWorkflow")
-""")
-            temp_file = Path(f.name)
-
-        try:
-            with pytest.raises(ChildWorkflowNotFoundError) as exc_info:
-                analyzer.analyze(temp_file)
-
-            # Verify error message includes workflow name and search paths
-            error = exc_info.value
-            assert error.workflow_name == "NonExistentWorkflow"
-            assert len(error.search_paths) > 0
-            assert "could not be found" in str(error).lower()
-            assert "searched in:" in str(error).lower()
-        finally:
-            temp_file.unlink()
-
-    def test_import_tracking_resolution(self) -> None:
-        """Test import tracking resolution (child imported from another module) - AC2."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
+        # Verify error message includes workflow name and search paths
+        error = exc_info.value
+        assert error.workflow_name == "NonExistentWorkflow"
+        assert len(error.search_paths) > 0
+        assert "could not be found" in str(error).lower()
+        assert "searched in:" in str(error).lower()
 
-        parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
-        call_graph = analyzer.analyze(parent_file)
+    def test_import_tracking_resolution(self, graphs: dict[str, WorkflowCallGraph]) -> None:
+        """Test import tracking resolution (child imported from another module) - AC2."""
+        call_graph = graphs["simple"]
 
         # SimpleParentWorkflow imports SimpleChildWorkflow from another file
         # Verify child was resolved via import tracking
@@ -155,11 +315,10 @@ class TestParent:
         assert child_metadata.source_file.name == "simple_child.py"
         assert call_graph.root_workflow.source_file.name == "simple_parent.py"
 
-    def test_filesystem_search_resolution(self) -> None:
+    def test_filesystem_search_resolution(
+        self, call_graph_cached: Callable[..., WorkflowCallGraph]
+    ) -> None:
         """Test filesystem search resolution (child in different directory) - AC2."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
         # Test with explicit search paths
         parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
         search_paths = [
@@ -167,31 +326,26 @@ class TestParent:
             Path("tests/fixtures"),
         ]
 
-        call_graph = analyzer.analyze(parent_file, search_paths=search_paths)
+        call_graph = call_graph_cached(parent_file, search_paths=tuple(search_paths))
 
         # Should find child via filesystem search in search_paths
         assert "SimpleChildWorkflow" in call_graph.child_workflows
 
-    def test_search_paths_default_to_parent_directory(self) -> None:
+    def test_search_paths_default_to_parent_directory(
+        self, call_graph_cached: Callable[..., WorkflowCallGraph]
+    ) -> None:
         """Test search paths defaulting to parent directory - AC7."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
         parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
 
         # Call analyze without search_paths parameter
-        call_graph = analyzer.analyze(parent_file, search_paths=None)
+        call_graph = call_graph_cached(parent_file, search_paths=None)
 
         # Should still find child in same directory as parent (default search path)
         assert "SimpleChildWorkflow" in call_graph.child_workflows
 
-    def test_same_file_parent_child(self) -> None:
+    def test_same_file_parent_child(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test parent and child in same file (Priority 1 resolution) - AC2."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/same_file_parent_child.py")
-        call_graph = analyzer.analyze(parent_file)
+        call_graph = graphs["same_file"]
 
         # Verify child discovered in same file
         assert "SameFileChildWorkflow" in call_graph.child_workflows
@@ -200,13 +354,9 @@ class TestParent:
         # Both should have same source file
         assert child_metadata.source_file == call_graph.root_workflow.source_file
 
-    def test_workflow_call_graph_structure(self) -> None:
+    def test_workflow_call_graph_structure(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test WorkflowCallGraph data model contains all required fields - AC5."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
-        call_graph = analyzer.analyze(parent_file)
+        call_graph = graphs["simple"]
 
         # Verify all WorkflowCallGraph fields are populated
         assert call_graph.root_workflow is not None
@@ -221,90 +371,45 @@ class TestParent:
         assert child_call.workflow_name == "SimpleChildWorkflow"
         assert child_call.parent_workflow == "SimpleParentWorkflow"
 
-    def test_depth_0_only_analyzes_root(self) -> None:
-        """Test depth=0 only analyzes root workflow (no children) - AC4."""
-        context = GraphBuildingContext(max_expansion_depth=0)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/simple_parent.py")
-        call_graph = analyzer.analyze(parent_file)
-
-        # With depth=0, should only analyze root workflow
-        assert call_graph.total_workflows == 1
-        assert len(call_graph.child_workflows) == 0
-        # Root workflow should still have child_workflow_calls detected
-        assert len(call_graph.root_workflow.child_workflow_calls) == 1
-
-    def test_backtracking_allows_shared_children(self) -> None:
+    def test_backtracking_allows_shared_children(self, multi_parent_tree: Path) -> None:
         """Test backtracking allows same child from different parents (DAG structure)."""
-        # Create a scenario where two parents call the same child
-        import tempfile
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-
-            # Create shared child
-            shared_child = tmpdir_path / "shared_child.py"
-            shared_child.write_text("""
-from temporalio import workflow
+        context = GraphBuildingContext(max_expansion_depth=2)
+        analyzer = WorkflowCallGraphAnalyzer(context)
+        analyzer._ast_cache[multi_parent_tree.resolve()] = _MULTI_PARENT_AST
+        analyzer._ast_cache[(multi_parent_tree.parent / "shared_child.py").resolve()] = (
+            _SHARED_CHILD_AST
+        )
 
-@workflow.defn
-class SharedChildWorkflow:
-    @workflow.run
-    async def run(self):
-        return "shared"
-""")
+        call_graph = analyzer.analyze(multi_parent_tree, search_paths=[multi_parent_tree.parent])
 
-            # Create two parent workflows that both call SharedChildWorkflow
-            parent = tmpdir_path / "multi_parent.py"
-            parent.write_text("""
-from temporalio import workflow
+        # Should discover all workflows without circular error
+        assert call_graph.total_workflows >= 3  # MultiParent + ChildA + ChildB
 
-@workflow.defn
-class ChildA:
-    @workflow.run
-    async def run(self):
-        from shared_child import SharedChildWorkflow
-        await workflow.execute_child_workflow(SharedChildWorkflow)
-        return "a"
-
-@workflow.defn
-class ChildB:
-    @workflow.run
-    async def run(self):
-        from shared_child import SharedChildWorkflow
-        await workflow.execute_child_workflow(SharedChildWorkflow)
-        return "b"
+    def test_shared_children_resolved_once_in_lattice(
+        self, lattice_tree: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test N parents sharing M children resolve O(N+M) files, not O(N*M)."""
+        context = GraphBuildingContext(max_expansion_depth=2, suppress_validation=True)
+        analyzer = WorkflowCallGraphAnalyzer(context)
 
-@workflow.defn
-class MultiParent:
-    @workflow.run
-    async def run(self):
-        await workflow.execute_child_workflow(ChildA)
-        await workflow.execute_child_workflow(ChildB)
-        return "parent"
-""")
+        resolved: list[str] = []
+        original = analyzer._resolve_child_workflow_file
 
-            context = GraphBuildingContext(max_expansion_depth=2)
-            analyzer = WorkflowCallGraphAnalyzer(context)
+        def counting_resolve(**kwargs: Any) -> Path:
+            resolved.append(kwargs["workflow_name"])
+            return original(**kwargs)
 
-            call_graph = analyzer.analyze(parent, search_paths=[tmpdir_path])
+        monkeypatch.setattr(analyzer, "_resolve_child_workflow_file", counting_resolve)
 
-            # Should discover all workflows without circular error
-            assert call_graph.total_workflows >= 3  # MultiParent + ChildA + ChildB
+        call_graph = analyzer.analyze(lattice_tree)
 
-    def test_context_configuration_respected(self) -> None:
-        """Test that GraphBuildingContext configuration is passed through."""
-        context = GraphBuildingContext(
-            max_expansion_depth=1,
-            suppress_validation=True,
+        assert call_graph.total_workflows == 1 + _LATTICE_PARENTS + _LATTICE_CHILDREN
+        assert len(call_graph.call_relationships) == (
+            _LATTICE_PARENTS + _LATTICE_PARENTS * _LATTICE_CHILDREN
         )
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
-        parent_file = Path("tests/fixtures/parent_child_workflows/nested_grandchild.py")
-        call_graph = analyzer.analyze(parent_file)
-
-        # Verify max_expansion_depth=1 is enforced
-        assert call_graph.total_workflows == 2  # Parent + child only
+        # Every shared child is resolved once, however many parents call it
+        assert len(resolved) <= _LATTICE_PARENTS + _LATTICE_CHILDREN
+        assert len(set(resolved)) == len(resolved)
 
     def test_absolute_path_resolution(self) -> None:
         """Test that file paths are resolved to absolute paths (NFR-SEC-Epic6-1)."""
@@ -320,14 +425,10 @@ class MultiParent:
         for child_metadata in call_graph.child_workflows.values():
             assert child_metadata.source_file.is_absolute()
 
-    def test_empty_workflow_hierarchy(self) -> None:
+    def test_empty_workflow_hierarchy(self, graphs: dict[str, WorkflowCallGraph]) -> None:
         """Test workflow with no child calls returns single workflow."""
-        context = GraphBuildingContext(max_expansion_depth=2)
-        analyzer = WorkflowCallGraphAnalyzer(context)
-
         # SimpleChildWorkflow has no child calls
-        child_file = Path("tests/fixtures/parent_child_workflows/simple_child.py")
-        call_graph = analyzer.analyze(child_file)
+        call_graph = graphs["empty"]
 
         # Should only contain root workflow
         assert call_graph.total_workflows == 1
@@ -348,34 +449,13 @@ class TestWorkflowCallGraphAnalyzerEdgeCases:
         with pytest.raises(Exception):  # Should raise FileNotFoundError or WorkflowParseError
             analyzer.analyze(nonexistent_file)
 
-    def test_malformed_workflow_file(self) -> None:
+    def test_malformed_workflow_file(self, malformed_file: Path) -> None:
         """Test error when workflow file has syntax errors."""
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
-            f.write("this is not valid python syntax {{{")
-            temp_file = Path(f.name)
-
-        try:
-            context = GraphBuildingContext(max_expansion_depth=2)
-            analyzer = WorkflowCallGraphAnalyzer(context)
-
-            with pytest.raises(Exception):  # Should raise WorkflowParseError
-                analyzer.analyze(temp_file)
-        finally:
-            temp_file.unlink()
-
-    def test_deep_nesting_respects_limit(self) -> None:
-        """Test that very deep nesting respects max_expansion_depth limit."""
-        context = GraphBuildingContext(max_expansion_depth=1)
+        context = GraphBuildingContext(max_expansion_depth=2)
         analyzer = WorkflowCallGraphAnalyzer(context)
 
-        parent_file = Path("tests/fixtures/parent_child_workflows/nested_grandchild.py")
-        call_graph = analyzer.analyze(parent_file)
-
-        # With depth=1, grandchild should not be analyzed
-        assert "GrandchildWorkflow" not in call_graph.child_workflows
-        # But child should be analyzed
-        assert "ChildWithGrandchildWorkflow" in call_graph.child_workflows
+        with pytest.raises(Exception):  # Should raise WorkflowParseError
+            analyzer.analyze(malformed_file)
 
 
 class TestImportResolution:
@@ -395,6 +475,10 @@ class TestImportResolution:
         assert "SimpleChildWorkflow" in import_map
         assert "parent_child_workflows.simple_child" in import_map["SimpleChildWorkflow"]
 
+        # Map is memoized per file, including for an equivalent absolute path
+        assert analyzer._build_import_map(parent_file) is import_map
+        assert analyzer._build_import_map(parent_file.resolve()) is import_map
+
     def test_same_file_resolution_priority(self) -> None:
         """Test that same-file resolution has priority over imports."""
         context = GraphBuildingContext(max_expansion_depth=2)
@@ -411,3 +495,104 @@ class TestImportResolution:
         )
 
         assert resolved == parent_file.resolve()
+
+    def test_parse_file_reuses_cached_ast(self) -> None:
+        """Test that each workflow file is parsed once per analyzer instance."""
+        context = GraphBuildingContext(max_expansion_depth=2)
+        analyzer = WorkflowCallGraphAnalyzer(context)
+
+        parent_file = Path("tests/fixtures/parent_child_workflows/same_file_parent_child.py")
+        first = analyzer._parse_file(parent_file)
+
+        assert analyzer._parse_file(parent_file.resolve()) is first
+        assert analyzer._ast_cache == {parent_file.resolve(): first}
+
+    def test_parse_file_shares_trees_across_analyzers(self) -> None:
+        """Test that a file parsed by one analyzer is not re-parsed by another."""
+        parent_file = Path("tests/fixtures/parent_child_workflows/same_file_parent_child.py")
+        context = GraphBuildingContext(max_expansion_depth=2)
+
+        WorkflowAnalyzer().analyze(parent_file, context)
+        first = WorkflowCallGraphAnalyzer(context)._parse_file(parent_file)
+
+        assert WorkflowCallGraphAnalyzer(context)._parse_file(parent_file) is first
+
+    def test_search_path_listing_is_reused(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that each search path is listed once and reused across lookups."""
+        context = GraphBuildingContext(max_expansion_depth=2)
+        analyzer = WorkflowCallGraphAnalyzer(context)
+        search_path = Path("tests/fixtures/parent_child_workflows")
+
+        first = analyzer._scan_search_path("SimpleChildWorkflow", search_path)
+        assert first is not None
+        assert list(analyzer._search_path_files) == [search_path.resolve()]
+
+        # A second lookup must not walk the directory again
+        def fail_rglob(self: Path, pattern: str) -> Any:
+            raise AssertionError(f"unexpected directory walk of {self}")
+
+        monkeypatch.setattr(Path, "rglob", fail_rglob)
+        second = analyzer._scan_search_path("GrandchildWorkflow", search_path)
+
+        assert second is not None
+        assert second.name == "nested_grandchild.py"
+
+    def test_reused_analyzer_sees_edited_child(self, tmp_path: Path) -> None:
+        """Test that a reused analyzer re-reads files edited between analyze() calls."""
+        child_file = tmp_path / "child.py"
+        child_file.write_text(
+            "from temporalio import workflow\n\n"
+            "@workflow.defn\nclass EditedChild:\n    @workflow.run\n    async def run(self):\n"
+            "        await workflow.execute_activity(a1)\n"
+        )
+        parent_file = tmp_path / "parent.py"
+        parent_file.write_text(
+            "from temporalio import workflow\nfrom child import EditedChild\n\n"
+            + _workflow_class_src("EditedParent", ["EditedChild"])
+        )
+        analyzer = WorkflowCallGraphAnalyzer(GraphBuildingContext(max_expansion_depth=1))
+
+        first = analyzer.analyze(parent_file)
+        assert [a.name for a in first.child_workflows["EditedChild"].activities] == ["a1"]
+
+        with child_file.open("a") as f:
+            f.write("        await workflow.execute_activity(a2)\n")
+        second = analyzer.analyze(parent_file)
+
+        assert [a.name for a in second.child_workflows["EditedChild"].activities] == ["a1", "a2"]
+
+    def test_reused_analyzer_finds_added_child_file(self, tmp_path: Path) -> None:
+        """Test that a reused analyzer re-lists search paths on each analyze() call."""
+        parent_file = tmp_path / "parent.py"
+        parent_file.write_text(
+            "from temporalio import workflow\n\n" + _workflow_class_src("LateParent", ["LateChild"])
+        )
+        analyzer = WorkflowCallGraphAnalyzer(GraphBuildingContext(max_expansion_depth=1))
+
+        with pytest.raises(ChildWorkflowNotFoundError):
+            analyzer.analyze(parent_file)
+
+        (tmp_path / "late_child.py").write_text(
+            "from temporalio import workflow\n\n" + _workflow_class_src("LateChild", [])
+        )
+        call_graph = analyzer.analyze(parent_file)
+
+        assert set(call_graph.child_workflows) == {"LateChild"}
+
+    def test_multi_workflow_file_analyzed_in_memory(self, tmp_path: Path) -> None:
+        """Test multi-workflow files are analyzed without touching the filesystem."""
+        context = GraphBuildingContext(max_expansion_depth=1)
+        analyzer = WorkflowCallGraphAnalyzer(context)
+
+        # The file never exists on disk; its tree is served from the AST cache
+        virtual_file = tmp_path / "virtual" / "multi_parent.py"
+        analyzer._ast_cache[virtual_file.resolve()] = _MULTI_PARENT_AST
+
+        call_graph = analyzer.analyze(virtual_file, search_paths=[])
+
+        assert call_graph.root_workflow.workflow_class == "MultiParent"
+        assert set(call_graph.child_workflows) == {"ChildA", "ChildB"}
+        assert not virtual_file.parent.exists()
+        # Line numbers refer to the original source, not a re-serialized copy
+        child_a = call_graph.child_workflows["ChildA"]
+        assert child_a.child_workflow_calls[0].call_site_line == 9
@@ -122,28 +122,28 @@ class TestGraphPathChildWorkflowIntegration:
 class TestMermaidRendererChildWorkflowNodes:
     """Test MermaidRenderer handles child workflow nodes correctly."""
 
-    def test_child_workflow_in_linear_path(self):
+    def test_child_workflow_in_linear_path(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test child workflow renders correctly in linear path."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path = GraphPath(path_id="path_0")
         path.add_activity("ValidateInput")
         path.add_child_workflow("PaymentWorkflow", 45)
         path.add_activity("SendConfirmation")
 
-        result = renderer.to_mermaid([path], context)
+        result = renderer.to_mermaid([path], default_context)
 
         # Check for child workflow node with double brackets (word splitting enabled by default)
         assert "child_paymentworkflow_45[[Payment Workflow]]" in result
 
         # Check for correct edge connections
-        assert "ValidateInput --> child_paymentworkflow_45" in result or "Validate Input --> child_paymentworkflow_45" in result
-        assert "child_paymentworkflow_45 --> SendConfirmation" in result or "child_paymentworkflow_45 --> Send Confirmation" in result
+        # Edges reference node IDs, which are never word-split
+        assert "ValidateInput --> child_paymentworkflow_45" in result
+        assert "child_paymentworkflow_45 --> SendConfirmation" in result
 
-    def test_child_workflow_with_word_splitting(self):
+    def test_child_workflow_with_word_splitting(self, renderer: MermaidRenderer):
         """Test child workflow names respect word splitting setting."""
-        renderer = MermaidRenderer()
         context = GraphBuildingContext(split_names_by_words=True)
 
         path = GraphPath(path_id="path_0")
@@ -154,9 +154,8 @@ class TestMermaidRendererChildWorkflowNodes:
         # Display name should be word-split
         assert "child_processorderworkflow_50[[Process Order Workflow]]" in result
 
-    def test_child_workflow_without_word_splitting(self):
+    def test_child_workflow_without_word_splitting(self, renderer: MermaidRenderer):
         """Test child workflow names with word splitting disabled."""
-        renderer = MermaidRenderer()
         context = GraphBuildingContext(split_names_by_words=False)
 
         path = GraphPath(path_id="path_0")
@@ -167,9 +166,8 @@ class TestMermaidRendererChildWorkflowNodes:
         # Display name should NOT be word-split
         assert "child_processorderworkflow_50[[ProcessOrderWorkflow]]" in result
 
-    def test_multiple_child_workflows_in_same_path(self):
+    def test_multiple_child_workflows_in_same_path(self, renderer: MermaidRenderer):
         """Test multiple child workflows render with unique IDs."""
-        renderer = MermaidRenderer()
         context = GraphBuildingContext(split_names_by_words=False)
 
         path = GraphPath(path_id="path_0")
@@ -188,9 +186,8 @@ class TestMermaidRendererChildWorkflowNodes:
         assert "child_workflowa_10 --> child_workflowb_20" in result
         assert "child_workflowb_20 --> child_workflowc_30" in result
 
-    def test_child_workflow_mixed_with_activities(self):
+    def test_child_workflow_mixed_with_activities(self, renderer: MermaidRenderer):
         """Test child workflows and activities together in path."""
-        renderer = MermaidRenderer()
         context = GraphBuildingContext(split_names_by_words=False)
 
         path = GraphPath(path_id="path_0")
@@ -211,9 +208,8 @@ class TestMermaidRendererChildWorkflowNodes:
         assert "Activity1 --> child_childworkflow_50" in result
         assert "child_childworkflow_50 --> Activity2" in result
 
-    def test_child_workflow_node_deduplication_across_paths(self):
+    def test_child_workflow_node_deduplication_across_paths(self, renderer: MermaidRenderer):
         """Test same child workflow on different paths is deduplicated."""
-        renderer = MermaidRenderer()
         context = GraphBuildingContext(split_names_by_words=False)
 
         # Two paths calling the same child workflow at the same line
@@ -225,27 +221,49 @@ class TestMermaidRendererChildWorkflowNodes:
         path2.add_activity("Activity2")
         path2.add_child_workflow("SharedWorkflow", 45)
 
-        result = renderer.to_mermaid([path1, path2], context)
+        result, stats = renderer.to_mermaid([path1, path2], context, return_stats=True)
 
-        # Child workflow node should appear only once
-        count = result.count("child_sharedworkflow_45[[SharedWorkflow]]")
-        assert count == 1
+        # Child workflow node should appear only once:
+        # Start, Activity1, Activity2, the shared child workflow, End
+        assert stats.n_nodes == 5
+        assert stats.n_paths == 2
+        assert "child_sharedworkflow_45[[SharedWorkflow]]" in result
 
         # Both paths should reference it
         assert "Activity1 --> child_sharedworkflow_45" in result
         assert "Activity2 --> child_sharedworkflow_45" in result
 
-    def test_child_workflow_valid_mermaid_syntax(self):
+    def test_child_workflow_deduplication_wide_fan_in(self, renderer: MermaidRenderer):
+        """Test many paths converging on one child workflow emit it and its edges once."""
+        context = GraphBuildingContext(split_names_by_words=False)
+        fan_in = 200
+
+        paths = []
+        for i in range(fan_in):
+            path = GraphPath(path_id=f"path_{i}")
+            path.add_activity(f"Activity{i}")
+            path.add_child_workflow("SharedWorkflow", 45)
+            path.add_activity("Finalize")
+            paths.append(path)
+
+        lines = renderer.to_mermaid(paths, context).splitlines()
+
+        assert lines.count("child_sharedworkflow_45[[SharedWorkflow]]") == 1
+        assert lines.count("child_sharedworkflow_45 --> Finalize") == 1
+        assert lines.count("Finalize --> e") == 1
+        assert sum(line.endswith("--> child_sharedworkflow_45") for line in lines) == fan_in
+
+    def test_child_workflow_valid_mermaid_syntax(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test generated Mermaid with child workflow is syntactically valid."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path = GraphPath(path_id="path_0")
         path.add_activity("StartActivity")
         path.add_child_workflow("MyChildWorkflow", 100)
         path.add_activity("EndActivity")
 
-        result = renderer.to_mermaid([path], context)
+        result = renderer.to_mermaid([path], default_context)
 
         # Basic Mermaid structure checks
         assert "```mermaid" in result
@@ -263,10 +281,10 @@ class TestMermaidRendererChildWorkflowNodes:
 class TestChildWorkflowWithDecisions:
     """Test child workflow nodes in paths with decisions."""
 
-    def test_child_workflow_after_decision(self):
+    def test_child_workflow_after_decision(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test child workflow called after a decision point."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path1 = GraphPath(path_id="path_0b0")
         path1.add_decision("d0", True, "NeedProcessing")
@@ -276,7 +294,7 @@ class TestChildWorkflowWithDecisions:
         path2.add_decision("d0", False, "NeedProcessing")
         path2.add_activity("SkipProcessing")
 
-        result = renderer.to_mermaid([path1, path2], context)
+        result = renderer.to_mermaid([path1, path2], default_context)
 
         # Child workflow should appear on true branch
         assert "d0 -- yes --> child_processingworkflow_50" in result
@@ -284,10 +302,10 @@ class TestChildWorkflowWithDecisions:
         # Activity should appear on false branch
         assert "d0 -- no --> SkipProcessing" in result
 
-    def test_child_workflow_in_conditional_branch(self):
+    def test_child_workflow_in_conditional_branch(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test child workflow only in specific decision branch."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         # Path with decision followed by child workflow
         path = GraphPath(path_id="path_0b1")
@@ -296,20 +314,21 @@ class TestChildWorkflowWithDecisions:
         path.add_child_workflow("SubWorkflow", 60)
         path.add_activity("Finalize")
 
-        result = renderer.to_mermaid([path], context)
+        result = renderer.to_mermaid([path], default_context)
 
-        # Check decision edge to child workflow
-        assert "d0{RequiresSubWorkflow}" in result or "d0{Requires Sub Workflow}" in result
-        assert "child_subworkflow_60[[SubWorkflow]]" in result or "child_subworkflow_60[[Sub Workflow]]" in result
+        # Check decision edge to child workflow (default context splits names)
+        assert "d0{Requires Sub Workflow}" in result
+        assert "child_subworkflow_60[[Sub Workflow]]" in result
+        assert "d0 -- yes --> child_subworkflow_60" in result
 
 
 class TestChildWorkflowEdgeCases:
     """Test edge cases for child workflow rendering."""
 
-    def test_child_workflow_missing_line_number_raises_error(self):
+    def test_child_workflow_missing_line_number_raises_error(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test rendering fails gracefully if line_number is missing."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path = GraphPath(path_id="path_0")
         # Manually create a malformed step without line_number
@@ -318,36 +337,37 @@ class TestChildWorkflowEdgeCases:
         path.steps.append(bad_step)
 
         with pytest.raises(ValueError, match="missing line_number"):
-            renderer.to_mermaid([path], context)
+            renderer.to_mermaid([path], default_context)
 
-    def test_child_workflow_with_special_characters_in_name(self):
+    def test_child_workflow_with_special_characters_in_name(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test child workflow names with special characters."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path = GraphPath(path_id="path_0")
         path.add_child_workflow("Workflow_V2", 70)
 
-        result = renderer.to_mermaid([path], context)
+        result = renderer.to_mermaid([path], default_context)
 
-        # Should handle underscores in workflow name
-        assert "child_workflow_v2_70[[Workflow_V2]]" in result or "child_workflow_v2_70[[Workflow V2]]" in result
+        # Should handle underscores in workflow name; "_V" is not a camelCase
+        # boundary, so word splitting leaves the name unchanged
+        assert "child_workflow_v2_70[[Workflow_V2]]" in result
 
-    def test_child_workflow_same_name_different_lines(self):
+    def test_child_workflow_same_name_different_lines(
+        self, renderer: MermaidRenderer, default_context: GraphBuildingContext
+    ):
         """Test same workflow called multiple times has unique IDs."""
-        renderer = MermaidRenderer()
-        context = GraphBuildingContext()
 
         path = GraphPath(path_id="path_0")
         path.add_child_workflow("ReusableWorkflow", 10)
         path.add_activity("Intermediate")
         path.add_child_workflow("ReusableWorkflow", 20)
 
-        result = renderer.to_mermaid([path], context)
+        result = renderer.to_mermaid([path], default_context)
 
         # Both calls should be present with different IDs
-        assert "child_reusableworkflow_10[[ReusableWorkflow]]" in result or "child_reusableworkflow_10[[Reusable Workflow]]" in result
-        assert "child_reusableworkflow_20[[ReusableWorkflow]]" in result or "child_reusableworkflow_20[[Reusable Workflow]]" in result
+        assert "child_reusableworkflow_10[[Reusable Workflow]]" in result
+        assert "child_reusableworkflow_20[[Reusable Workflow]]" in result
 
         # Sequential edges
         assert "child_reusableworkflow_10 --> Intermediate" in result
@@ -7,16 +7,31 @@ Tests that all configuration options defined in GraphBuildingContext are:
 4. Are documented (AC 13)
 """
 
-import tempfile
+import dataclasses
+import re
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
-from temporalio_graphs import GraphBuildingContext, analyze_workflow
+from temporalio_graphs import GraphBuildingContext, _write_output, analyze_workflow
 from temporalio_graphs.exceptions import GraphGenerationError
 from temporalio_graphs.path import GraphPath
 from temporalio_graphs.renderer import MermaidRenderer
 
+SINGLE_ACTIVITY_WORKFLOW = Path("tests/fixtures/sample_workflows/single_activity_workflow.py")
+
+# Every token test_multiple_options_combined_basic looks for, matched in one pass
+_COMBINED_OPTIONS_TOKENS = re.compile(
+    r"s\(\(BEGIN\)\)|e\(\(FINISH\)\)|validateInput|processData|Validate Input|Process Data"
+)
+
+
+@pytest.fixture(scope="module")
+def single_activity_result() -> str:
+    """Analyze the single-activity fixture once for the whole module."""
+    return analyze_workflow(SINGLE_ACTIVITY_WORKFLOW, context=GraphBuildingContext())
+
 
 # ============================================================================
 # AC 10: Configuration Validation Tests
@@ -76,28 +91,32 @@ class TestConfigurationValidation:
 class TestSplitNamesByWords:
     """Tests for split_names_by_words configuration option."""
 
-    def test_split_names_by_words_enabled(self) -> None:
+    def test_split_names_by_words_enabled(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """When split_names_by_words=True, camelCase names are split."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("withdrawFunds")
         path.add_activity("depositMoney")
 
-        context = GraphBuildingContext(split_names_by_words=True)
+        context = make_context(split_names_by_words=True)
         result = renderer.to_mermaid([path], context)
 
         # camelCase should be split with spaces (lowercase preserved)
         assert "withdraw Funds" in result
         assert "deposit Money" in result
 
-    def test_split_names_by_words_disabled(self) -> None:
+    def test_split_names_by_words_disabled(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """When split_names_by_words=False, names are unchanged."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("withdrawFunds")
         path.add_activity("depositMoney")
 
-        context = GraphBuildingContext(split_names_by_words=False)
+        context = make_context(split_names_by_words=False)
         result = renderer.to_mermaid([path], context)
 
         # camelCase should NOT be split
@@ -106,7 +125,9 @@ class TestSplitNamesByWords:
         assert "Withdraw Funds" not in result
         assert "Deposit Money" not in result
 
-    def test_split_names_by_words_multiple_transitions(self) -> None:
+    def test_split_names_by_words_multiple_transitions(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Word splitting works with multiple camelCase transitions."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
@@ -114,7 +135,7 @@ class TestSplitNamesByWords:
         path.add_activity("processTransaction")
         path.add_activity("sendConfirmation")
 
-        context = GraphBuildingContext(split_names_by_words=True)
+        context = make_context(split_names_by_words=True)
         result = renderer.to_mermaid([path], context)
 
         assert "validate Payment" in result
@@ -130,36 +151,42 @@ class TestSplitNamesByWords:
 class TestStartNodeLabel:
     """Tests for start_node_label configuration option."""
 
-    def test_start_node_label_default(self) -> None:
+    def test_start_node_label_default(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Default start_node_label is 'Start'."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(start_node_label="Start")
+        context = make_context(start_node_label="Start")
         result = renderer.to_mermaid([path], context)
 
         assert "s((Start))" in result
 
-    def test_start_node_label_custom(self) -> None:
+    def test_start_node_label_custom(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Custom start_node_label is rendered correctly."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(start_node_label="BEGIN")
+        context = make_context(start_node_label="BEGIN")
         result = renderer.to_mermaid([path], context)
 
         assert "s((BEGIN))" in result
         assert "s((Start))" not in result
 
-    def test_start_node_label_multiword(self) -> None:
+    def test_start_node_label_multiword(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Custom start_node_label with multiple words."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(start_node_label="Workflow Begin")
+        context = make_context(start_node_label="Workflow Begin")
         result = renderer.to_mermaid([path], context)
 
         assert "s((Workflow Begin))" in result
@@ -173,36 +200,42 @@ class TestStartNodeLabel:
 class TestEndNodeLabel:
     """Tests for end_node_label configuration option."""
 
-    def test_end_node_label_default(self) -> None:
+    def test_end_node_label_default(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Default end_node_label is 'End'."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(end_node_label="End")
+        context = make_context(end_node_label="End")
         result = renderer.to_mermaid([path], context)
 
         assert "e((End))" in result
 
-    def test_end_node_label_custom(self) -> None:
+    def test_end_node_label_custom(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Custom end_node_label is rendered correctly."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(end_node_label="FINISH")
+        context = make_context(end_node_label="FINISH")
         result = renderer.to_mermaid([path], context)
 
         assert "e((FINISH))" in result
         assert "e((End))" not in result
 
-    def test_end_node_label_multiword(self) -> None:
+    def test_end_node_label_multiword(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Custom end_node_label with multiple words."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("Work")
 
-        context = GraphBuildingContext(end_node_label="Workflow Complete")
+        context = make_context(end_node_label="Workflow Complete")
         result = renderer.to_mermaid([path], context)
 
         assert "e((Workflow Complete))" in result
@@ -327,6 +360,36 @@ class LongActivityWorkflow:
             assert "is very long" in str(w[0].message)
             assert "150 chars" in str(w[0].message)
 
+    def test_long_activity_name_warning_emitted_once_per_name(
+        self, tmp_path: Path
+    ) -> None:
+        """An activity with a long name called twice is reported once."""
+        import warnings
+
+        long_activity_workflow = tmp_path / "repeated_long_activity_workflow.py"
+        long_activity_name = "c" * 150
+        long_activity_workflow.write_text(
+            f"""
+from temporalio import workflow
+
+@workflow.defn
+class RepeatedLongActivityWorkflow:
+    @workflow.run
+    async def run(self) -> str:
+        await workflow.execute_activity("{long_activity_name}", schedule_to_close_timeout=60)
+        await workflow.execute_activity("{long_activity_name}", schedule_to_close_timeout=60)
+        return "done"
+"""
+        )
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            from temporalio_graphs import analyze_workflow
+
+            analyze_workflow(long_activity_workflow, GraphBuildingContext())
+
+            assert [str(warning.message).count("is very long") for warning in w] == [1]
+
     def test_long_activity_name_warning_suppressed(self, tmp_path: Path) -> None:
         """Very long activity names do NOT emit warning when suppress_validation=True."""
         import warnings
@@ -387,6 +450,8 @@ class TestMaxDecisionPointsLimit:
 # ============================================================================
 
 
+# Keep these on one xdist worker so single_activity_result is computed once
+@pytest.mark.xdist_group("graph_output_file")
 class TestGraphOutputFile:
     """Tests for graph_output_file configuration option."""
 
@@ -395,74 +460,63 @@ class TestGraphOutputFile:
         ctx = GraphBuildingContext()
         assert ctx.graph_output_file is None
 
-    def test_graph_output_file_writes_to_disk(self) -> None:
-        """graph_output_file writes output to file."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
-
-            result = analyze_workflow(
-                Path("tests/fixtures/sample_workflows/single_activity_workflow.py"),
-                context=GraphBuildingContext(graph_output_file=output_path),
-            )
-
-            # File should be created
-            assert output_path.exists()
-
-            # File content should match returned string
-            file_content = output_path.read_text()
-            assert file_content == result
-
-    def test_graph_output_file_creates_parent_directories(self) -> None:
-        """graph_output_file creates parent directories if needed."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "subdir" / "nested" / "output.md"
-
-            result = analyze_workflow(
-                Path("tests/fixtures/sample_workflows/single_activity_workflow.py"),
-                context=GraphBuildingContext(graph_output_file=output_path),
-            )
-
-            # Parent directories should be created
-            assert output_path.parent.exists()
-            assert output_path.exists()
-
-            # Content should match
-            assert output_path.read_text() == result
+    @pytest.mark.parametrize(
+        "scenario", ["basic", "nested_parents", "overwrite_existing", "returns_string"]
+    )
+    def test_graph_output_file(
+        self, scenario: str, tmp_path: Path, single_activity_result: str
+    ) -> None:
+        """graph_output_file writes, creates parents for, and overwrites the output file.
 
-    def test_graph_output_file_overwrites_existing(self) -> None:
-        """graph_output_file overwrites existing files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
+        Only the basic scenario runs analyze_workflow end to end; the others
+        reuse the module-level result and exercise the file-writing step alone.
+        """
+        if scenario == "nested_parents":
+            output_path = tmp_path / "subdir" / "nested" / "output.md"
+        else:
+            output_path = tmp_path / "output.md"
 
+        if scenario == "overwrite_existing":
             # Write initial content
             output_path.write_text("old content")
-            old_size = output_path.stat().st_size
 
-            # Analyze workflow and write to same file
+        if scenario == "basic":
             result = analyze_workflow(
-                Path("tests/fixtures/sample_workflows/single_activity_workflow.py"),
+                SINGLE_ACTIVITY_WORKFLOW,
                 context=GraphBuildingContext(graph_output_file=output_path),
             )
+            # Writing to a file does not change what is rendered
+            assert result == single_activity_result
+        else:
+            result = single_activity_result
+            _write_output(result, output_path)
 
-            # File should contain new content, not old
-            new_content = output_path.read_text()
-            assert new_content == result
-            assert new_content != "old content"
+        if scenario == "returns_string":
+            assert isinstance(result, str)
+            assert "```mermaid" in result
+            return
 
-    def test_graph_output_file_returns_result(self) -> None:
-        """analyze_workflow returns result even with file output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.md"
+        if scenario == "nested_parents":
+            # Parent directories should be created
+            assert output_path.parent.is_dir()
+
+        # File should hold exactly the rendered result; read_bytes raises if the
+        # file was never created, so no separate exists() check is needed
+        file_content = output_path.read_bytes()
+        assert file_content == result.encode("utf-8")
+        if scenario == "overwrite_existing":
+            assert file_content != b"old content"
+
+    def test_graph_output_file_large_output_written_verbatim(self, tmp_path: Path) -> None:
+        """Multi-buffer outputs are written byte-for-byte, with no newline translation."""
+        output_path = tmp_path / "large.md"
+        result = "\n".join(
+            f"    {i}[Activity {i}] --> {i + 1}[Activity {i + 1}]" for i in range(5000)
+        )
 
-            result = analyze_workflow(
-                Path("tests/fixtures/sample_workflows/single_activity_workflow.py"),
-                context=GraphBuildingContext(graph_output_file=output_path),
-            )
+        _write_output(result, output_path)
 
-            # Result should be returned
-            assert result is not None
-            assert isinstance(result, str)
-            assert "```mermaid" in result
+        assert output_path.read_bytes() == result.encode("utf-8")
 
 
 # ============================================================================
@@ -498,14 +552,16 @@ class TestConfigurationPipelineIntegration:
 class TestMultipleOptionsCombined:
     """Tests that multiple configuration options work together."""
 
-    def test_multiple_options_combined_basic(self) -> None:
+    def test_multiple_options_combined_basic(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Multiple configuration options work together."""
         renderer = MermaidRenderer()
         path = GraphPath(path_id="path_0")
         path.add_activity("validateInput")
         path.add_activity("processData")
 
-        context = GraphBuildingContext(
+        context = make_context(
             split_names_by_words=False,
             start_node_label="BEGIN",
             end_node_label="FINISH",
@@ -514,40 +570,39 @@ class TestMultipleOptionsCombined:
 
         result = renderer.to_mermaid([path], context)
 
-        # All customizations should be present
-        assert "s((BEGIN))" in result
-        assert "e((FINISH))" in result
-        assert "validateInput" in result  # Not split
-        assert "processData" in result  # Not split
-        assert "Validate Input" not in result  # Should not be split
-        assert "Process Data" not in result  # Should not be split
+        found = set(_COMBINED_OPTIONS_TOKENS.findall(result))
+
+        # All customizations should be present, and names should not be split
+        assert {"s((BEGIN))", "e((FINISH))", "validateInput", "processData"} <= found
+        assert not found & {"Validate Input", "Process Data"}
 
-    def test_multiple_options_combined_with_file_output(self) -> None:
+    def test_multiple_options_combined_with_file_output(self, tmp_path: Path) -> None:
         """Multiple options work together with file output."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "workflow_diagram.md"
+        output_path = tmp_path / "workflow_diagram.md"
 
-            result = analyze_workflow(
-                Path("tests/fixtures/sample_workflows/multi_activity_workflow.py"),
-                context=GraphBuildingContext(
-                    split_names_by_words=True,
-                    start_node_label="START",
-                    end_node_label="END",
-                    max_decision_points=10,
-                    graph_output_file=output_path,
-                ),
-            )
+        result = analyze_workflow(
+            Path("tests/fixtures/sample_workflows/multi_activity_workflow.py"),
+            context=GraphBuildingContext(
+                split_names_by_words=True,
+                start_node_label="START",
+                end_node_label="END",
+                max_decision_points=10,
+                graph_output_file=output_path,
+            ),
+        )
 
-            # Verify file was created
-            assert output_path.exists()
+        # Verify file was created
+        assert output_path.exists()
 
-            # Verify customizations are in output
-            assert "s((START))" in result
-            assert "e((END))" in result
+        # Verify customizations are in output
+        assert "s((START))" in result
+        assert "e((END))" in result
 
-    def test_multiple_options_immutable_not_modified(self) -> None:
+    def test_multiple_options_immutable_not_modified(
+        self, make_context: Callable[..., GraphBuildingContext]
+    ) -> None:
         """Configuration object is never modified during processing."""
-        context = GraphBuildingContext(
+        context = make_context(
             split_names_by_words=True,
             start_node_label="BEGIN",
             end_node_label="FINISH",
@@ -556,12 +611,7 @@ class TestMultipleOptionsCombined:
             max_paths=1024,
         )
 
-        original_split = context.split_names_by_words
-        original_start = context.start_node_label
-        original_end = context.end_node_label
-        original_suppress = context.suppress_validation
-        original_max_decisions = context.max_decision_points
-        original_max_paths = context.max_paths
+        snapshot = dataclasses.replace(context)
 
         # Process workflow
         analyze_workflow(
@@ -569,13 +619,10 @@ class TestMultipleOptionsCombined:
             context=context,
         )
 
-        # Verify configuration was not modified
-        assert context.split_names_by_words == original_split
-        assert context.start_node_label == original_start
-        assert context.end_node_label == original_end
-        assert context.suppress_validation == original_suppress
-        assert context.max_decision_points == original_max_decisions
-        assert context.max_paths == original_max_paths
+        # Verify configuration was not modified (covers every field, including
+        # ones added later)
+        assert context == snapshot
+        assert hash(context) == hash(snapshot)
 
 
 # ============================================================================
@@ -7,6 +7,27 @@ import pytest
 
 from temporalio_graphs.context import GraphBuildingContext
 
+_EXPECTED_TYPED_FIELDS = frozenset(
+    {
+        "is_building_graph",
+        "exit_after_building_graph",
+        "graph_output_file",
+        "split_names_by_words",
+        "suppress_validation",
+        "start_node_label",
+        "end_node_label",
+        "max_decision_points",
+        "max_paths",
+        "decision_true_label",
+        "decision_false_label",
+        "signal_success_label",
+        "signal_timeout_label",
+    }
+)
+
+# Resolved once at import; get_type_hints walks the MRO and evaluates annotations
+_CONTEXT_HINTS = get_type_hints(GraphBuildingContext)
+
 
 def test_default_configuration() -> None:
     """Verify GraphBuildingContext creates instance with all default values."""
@@ -74,6 +95,14 @@ def test_immutability_frozen() -> None:
         ctx.is_building_graph = False  # type: ignore[misc]
 
 
+def test_context_uses_slots_and_is_hashable() -> None:
+    """Context carries no per-instance __dict__ and equal contexts hash equal."""
+    ctx = GraphBuildingContext(max_paths=64)
+
+    assert not hasattr(ctx, "__dict__")
+    assert hash(ctx) == hash(GraphBuildingContext(max_paths=64))
+
+
 def test_all_fields_have_defaults() -> None:
     """Instantiate with no arguments, verify no TypeError."""
     # This should not raise TypeError for missing required arguments
@@ -83,29 +112,11 @@ def test_all_fields_have_defaults() -> None:
 
 def test_type_hints_present() -> None:
     """Use typing.get_type_hints to verify all fields have type annotations."""
-    hints = get_type_hints(GraphBuildingContext)
-
     # Verify all 13 fields have type hints
-    expected_fields = {
-        "is_building_graph",
-        "exit_after_building_graph",
-        "graph_output_file",
-        "split_names_by_words",
-        "suppress_validation",
-        "start_node_label",
-        "end_node_label",
-        "max_decision_points",
-        "max_paths",
-        "decision_true_label",
-        "decision_false_label",
-        "signal_success_label",
-        "signal_timeout_label",
-    }
-
-    actual_fields = set(hints.keys())
-    assert expected_fields.issubset(actual_fields), f"Missing type hints: {expected_fields - actual_fields}"
+    missing = _EXPECTED_TYPED_FIELDS - _CONTEXT_HINTS.keys()
+    assert not missing, f"Missing type hints: {missing}"
 
     # Verify specific types
-    assert hints["is_building_graph"] == bool
-    assert hints["max_decision_points"] == int
-    assert hints["start_node_label"] == str
+    assert _CONTEXT_HINTS["is_building_graph"] is bool
+    assert _CONTEXT_HINTS["max_decision_points"] is int
+    assert _CONTEXT_HINTS["start_node_label"] is str
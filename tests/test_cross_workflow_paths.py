@@ -20,8 +20,26 @@ from temporalio_graphs.context import GraphBuildingContext
 from temporalio_graphs.exceptions import GraphGenerationError
 from temporalio_graphs.generator import PathPermutationGenerator
 
+_PARENT_FILE = Path("parent.py")
+_CHILD_FILE = Path("child.py")
 
-@pytest.fixture
+# Activity steps of linear_child_metadata; none may appear in a reference-mode path
+_LINEAR_CHILD_STEPS = frozenset({"ChildActivity1", "ChildActivity2"})
+
+# Five decisions each (2^5 = 32 paths) for the explosion-testing fixtures
+_PARENT_DECISIONS = tuple(
+    DecisionPoint(f"d{i}", f"Decision{i}", 20 + i * 5, 20 + i * 5, "yes", "no") for i in range(5)
+)
+_CHILD_DECISIONS = tuple(
+    DecisionPoint(f"d{i}", f"ChildDecision{i}", 20 + i * 5, 20 + i * 5, "yes", "no")
+    for i in range(5)
+)
+
+# Metadata fixtures are module-scoped and shared between tests: generation only
+# reads them, and no test may mutate the returned objects.
+
+
+@pytest.fixture(scope="module")
 def linear_parent_metadata():
     """Parent workflow with 2 activities, no decisions, calls 1 child."""
     return WorkflowMetadata(
@@ -33,7 +51,7 @@ def linear_parent_metadata():
         ],
         decision_points=[],
         signal_points=[],
-        source_file=Path("parent.py"),
+        source_file=_PARENT_FILE,
         total_paths=1,
         child_workflow_calls=[
             ChildWorkflowCall("ChildWorkflow", 20, "child_childworkflow_20", "ParentWorkflow")
@@ -41,7 +59,7 @@ def linear_parent_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def linear_child_metadata():
     """Child workflow with 2 activities, no decisions."""
     return WorkflowMetadata(
@@ -53,13 +71,13 @@ def linear_child_metadata():
         ],
         decision_points=[],
         signal_points=[],
-        source_file=Path("child.py"),
+        source_file=_CHILD_FILE,
         total_paths=1,
         child_workflow_calls=[],
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parent_with_decision_metadata():
     """Parent workflow with 1 decision (2 paths), calls 1 child."""
     return WorkflowMetadata(
@@ -73,7 +91,7 @@ def parent_with_decision_metadata():
             DecisionPoint("d0", "ParentDecision", 15, 15, "yes", "no"),
         ],
         signal_points=[],
-        source_file=Path("parent.py"),
+        source_file=_PARENT_FILE,
         total_paths=2,
         child_workflow_calls=[
             ChildWorkflowCall("ChildWorkflow", 30, "child_childworkflow_30", "ParentWorkflow")
@@ -81,7 +99,7 @@ def parent_with_decision_metadata():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def child_with_decision_metadata():
     """Child workflow with 1 decision (2 paths)."""
     return WorkflowMetadata(
@@ -95,25 +113,22 @@ def child_with_decision_metadata():
             DecisionPoint("d0", "ChildDecision", 20, 20, "yes", "no"),
         ],
         signal_points=[],
-        source_file=Path("child.py"),
+        source_file=_CHILD_FILE,
         total_paths=2,
         child_workflow_calls=[],
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parent_with_multiple_decisions():
     """Parent workflow with 5 decisions (32 paths) for explosion testing."""
     return WorkflowMetadata(
         workflow_class="ParentWorkflow",
         workflow_run_method="run",
         activities=[Activity("Activity1", 10)],
-        decision_points=[
-            DecisionPoint(f"d{i}", f"Decision{i}", 20 + i * 5, 20 + i * 5, "yes", "no")
-            for i in range(5)
-        ],
+        decision_points=list(_PARENT_DECISIONS),
         signal_points=[],
-        source_file=Path("parent.py"),
+        source_file=_PARENT_FILE,
         total_paths=32,
         child_workflow_calls=[
             ChildWorkflowCall("ChildWorkflow", 50, "child_childworkflow_50", "ParentWorkflow")
@@ -121,51 +136,102 @@ def parent_with_multiple_decisions():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def child_with_multiple_decisions():
     """Child workflow with 5 decisions (32 paths) for explosion testing."""
     return WorkflowMetadata(
         workflow_class="ChildWorkflow",
         workflow_run_method="run",
         activities=[Activity("ChildActivity1", 10)],
-        decision_points=[
-            DecisionPoint(f"d{i}", f"ChildDecision{i}", 20 + i * 5, 20 + i * 5, "yes", "no")
-            for i in range(5)
-        ],
+        decision_points=list(_CHILD_DECISIONS),
         signal_points=[],
-        source_file=Path("child.py"),
+        source_file=_CHILD_FILE,
         total_paths=32,
         child_workflow_calls=[],
     )
 
 
-class TestReferenceMode:
-    """Tests for reference mode (default, safest mode)."""
+@pytest.fixture(scope="module")
+def generator():
+    """Generator shared by the module; it keeps no state between calls."""
+    return PathPermutationGenerator()
 
-    def test_reference_mode_linear_workflows(self, linear_parent_metadata, linear_child_metadata):
-        """Reference mode with linear parent and child generates 1 parent path."""
-        call_graph = WorkflowCallGraph(
-            root_workflow=linear_parent_metadata,
-            child_workflows={"ChildWorkflow": linear_child_metadata},
-            call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=linear_parent_metadata.child_workflow_calls,
-            total_workflows=2,
-        )
 
-        context = GraphBuildingContext(child_workflow_expansion="reference")
-        generator = PathPermutationGenerator()
-        mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
+@pytest.fixture(scope="module")
+def linear_call_graph(linear_parent_metadata, linear_child_metadata):
+    """Call graph of the linear parent calling the linear child once."""
+    return WorkflowCallGraph(
+        root_workflow=linear_parent_metadata,
+        child_workflows={"ChildWorkflow": linear_child_metadata},
+        call_relationships=[("ParentWorkflow", "ChildWorkflow")],
+        all_child_calls=linear_parent_metadata.child_workflow_calls,
+        total_workflows=2,
+    )
+
 
-        # Reference mode should generate 1 path (linear parent, child not expanded)
+@pytest.fixture(scope="module")
+def explosion_call_graph(parent_with_multiple_decisions, child_with_multiple_decisions):
+    """Call graph of the 32-path parent calling the 32-path child (32 × 32 = 1024)."""
+    call_graph = WorkflowCallGraph(
+        root_workflow=parent_with_multiple_decisions,
+        child_workflows={"ChildWorkflow": child_with_multiple_decisions},
+        call_relationships=[("ParentWorkflow", "ChildWorkflow")],
+        all_child_calls=parent_with_multiple_decisions.child_workflow_calls,
+        total_workflows=2,
+    )
+    assert call_graph.total_workflows == 2
+    return call_graph
+
+
+# Expected single path for linear_call_graph per expansion mode. Subgraph mode
+# generates the same paths as reference mode; only rendering differs.
+_REFERENCE_LINEAR_PATH = {
+    "workflows": ["ParentWorkflow"],
+    "steps": ["ParentActivity1", "ChildWorkflow", "ParentActivity2"],
+    # No transitions in reference mode
+    "workflow_transitions": [],
+}
+_LINEAR_EXPECTED = {
+    "reference": _REFERENCE_LINEAR_PATH,
+    "subgraph": _REFERENCE_LINEAR_PATH,
+    "inline": {
+        "workflows": ["ParentWorkflow", "ChildWorkflow"],
+        # Child workflow steps injected between parent steps
+        "steps": ["ParentActivity1", "ChildActivity1", "ChildActivity2", "ParentActivity2"],
+        # Parent→Child after the first parent step, Child→Parent after the child's two steps
+        "workflow_transitions": [
+            (1, "ParentWorkflow", "ChildWorkflow"),
+            (3, "ChildWorkflow", "ParentWorkflow"),
+        ],
+    },
+}
+
+
+class TestLinearWorkflowsAcrossModes:
+    """Linear parent and child produce exactly one path in every expansion mode."""
+
+    @pytest.mark.parametrize("mode", ["reference", "inline", "subgraph"])
+    def test_linear_workflows(self, generator, linear_call_graph, mode):
+        """Each mode generates one path with the mode's steps and transitions."""
+        context = GraphBuildingContext(child_workflow_expansion=mode)
+        mw_paths = generator.generate_cross_workflow_paths(linear_call_graph, context)
+
+        expected = _LINEAR_EXPECTED[mode]
         assert len(mw_paths) == 1
-        assert mw_paths[0].path_id == "mwpath_0"
-        assert mw_paths[0].workflows == ["ParentWorkflow"]
-        assert mw_paths[0].steps == ["ParentActivity1", "ChildWorkflow", "ParentActivity2"]
-        assert mw_paths[0].workflow_transitions == []  # No transitions in reference mode
-        assert mw_paths[0].total_decisions == 0
+        mw_path = mw_paths[0]
+        assert mw_path.path_id == "mwpath_0"
+        assert mw_path.workflows == expected["workflows"]
+        assert mw_path.steps == expected["steps"]
+        assert mw_path.workflow_transitions == expected["workflow_transitions"]
+        assert mw_path.total_decisions == 0
+
+
+class TestReferenceMode:
+    """Tests for reference mode (default, safest mode)."""
 
     def test_reference_mode_parent_with_decisions(
         self,
+        generator,
         parent_with_decision_metadata,
         linear_child_metadata,
     ):
@@ -179,75 +245,42 @@ class TestReferenceMode:
         )
 
         context = GraphBuildingContext(child_workflow_expansion="reference")
-        generator = PathPermutationGenerator()
         mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
 
         # Reference mode should generate 2 paths (parent has 1 decision = 2^1 = 2 paths)
         assert len(mw_paths) == 2
         for mw_path in mw_paths:
+            steps_set = set(mw_path.steps)
             assert mw_path.workflows == ["ParentWorkflow"]
-            assert "ChildWorkflow" in mw_path.steps  # Child appears as atomic step
+            assert "ChildWorkflow" in steps_set  # Child appears as atomic step
+            assert steps_set.isdisjoint(_LINEAR_CHILD_STEPS)  # ...and is not expanded
             assert mw_path.workflow_transitions == []  # No transitions in reference mode
             assert mw_path.total_decisions == 1  # Only parent decision counted
 
-    def test_reference_mode_no_path_explosion(
-        self, parent_with_multiple_decisions, child_with_multiple_decisions
-    ):
+    def test_reference_mode_no_path_explosion(self, generator, explosion_call_graph):
         """Reference mode with high-decision workflows (32 × 32) has no path explosion."""
-        call_graph = WorkflowCallGraph(
-            root_workflow=parent_with_multiple_decisions,
-            child_workflows={"ChildWorkflow": child_with_multiple_decisions},
-            call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=parent_with_multiple_decisions.child_workflow_calls,
-            total_workflows=2,
-        )
-
         context = GraphBuildingContext(child_workflow_expansion="reference")
-        generator = PathPermutationGenerator()
-        mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
+        mw_paths = generator.generate_cross_workflow_paths(explosion_call_graph, context)
 
         # Reference mode should generate 32 paths (only parent, 2^5 = 32)
         # Child's 32 paths are NOT expanded
+        # Each check reduces over all paths in one assertion; a failure shows
+        # the set of distinct offending values rather than stopping at one path.
         assert len(mw_paths) == 32
-        for mw_path in mw_paths:
-            assert mw_path.workflows == ["ParentWorkflow"]
-            assert "ChildWorkflow" in mw_path.steps
-            assert mw_path.total_decisions == 5  # Only parent decisions
+        steps_sets = [set(mw_path.steps) for mw_path in mw_paths]
+        assert {tuple(mw_path.workflows) for mw_path in mw_paths} == {("ParentWorkflow",)}
+        assert all("ChildWorkflow" in steps for steps in steps_sets)
+        assert not any("ChildActivity1" in steps for steps in steps_sets)
+        # Only parent decisions
+        assert {mw_path.total_decisions for mw_path in mw_paths} == {5}
 
 
 class TestInlineMode:
     """Tests for inline mode (full path expansion)."""
 
-    def test_inline_mode_linear_workflows(self, linear_parent_metadata, linear_child_metadata):
-        """Inline mode with linear parent and child generates 1 end-to-end path."""
-        call_graph = WorkflowCallGraph(
-            root_workflow=linear_parent_metadata,
-            child_workflows={"ChildWorkflow": linear_child_metadata},
-            call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=linear_parent_metadata.child_workflow_calls,
-            total_workflows=2,
-        )
-
-        context = GraphBuildingContext(child_workflow_expansion="inline")
-        generator = PathPermutationGenerator()
-        mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
-
-        # Inline mode should generate 1 end-to-end path (1 × 1 = 1)
-        assert len(mw_paths) == 1
-        mw_path = mw_paths[0]
-        assert mw_path.path_id == "mwpath_0"
-        assert mw_path.workflows == ["ParentWorkflow", "ChildWorkflow"]
-        # Child workflow steps injected between parent steps
-        assert "ChildActivity1" in mw_path.steps
-        assert "ChildActivity2" in mw_path.steps
-        assert "ParentActivity1" in mw_path.steps
-        assert "ParentActivity2" in mw_path.steps
-        # Workflow transitions recorded
-        assert len(mw_path.workflow_transitions) == 2  # Parent→Child, Child→Parent
-        assert mw_path.total_decisions == 0
-
     def test_inline_mode_path_expansion(
         self,
+        generator,
         parent_with_decision_metadata,
         child_with_decision_metadata,
     ):
@@ -261,66 +294,73 @@ class TestInlineMode:
         )
 
         context = GraphBuildingContext(child_workflow_expansion="inline")
-        generator = PathPermutationGenerator()
         mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
 
         # Inline mode should generate 4 paths (2 × 2 = 4)
         assert len(mw_paths) == 4
-        for mw_path in mw_paths:
-            assert mw_path.workflows == ["ParentWorkflow", "ChildWorkflow"]
-            assert mw_path.total_decisions == 2  # 1 parent + 1 child
-            assert len(mw_path.workflow_transitions) == 2  # Parent→Child, Child→Parent
-
-    def test_inline_mode_workflow_transitions(self, linear_parent_metadata, linear_child_metadata):
-        """Inline mode records workflow transitions at correct step indices."""
+        assert {tuple(mw_path.workflows) for mw_path in mw_paths} == {
+            ("ParentWorkflow", "ChildWorkflow")
+        }
+        # 1 parent + 1 child decision
+        assert {mw_path.total_decisions for mw_path in mw_paths} == {2}
+        # Parent→Child, Child→Parent
+        assert {len(mw_path.workflow_transitions) for mw_path in mw_paths} == {2}
+
+    def test_inline_mode_generates_each_workflow_once(
+        self, parent_with_decision_metadata, child_with_decision_metadata, monkeypatch
+    ):
+        """Inline mode generates parent and child paths once each, not per use."""
         call_graph = WorkflowCallGraph(
-            root_workflow=linear_parent_metadata,
-            child_workflows={"ChildWorkflow": linear_child_metadata},
+            root_workflow=parent_with_decision_metadata,
+            child_workflows={"ChildWorkflow": child_with_decision_metadata},
             call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=linear_parent_metadata.child_workflow_calls,
+            all_child_calls=parent_with_decision_metadata.child_workflow_calls,
             total_workflows=2,
         )
-
-        context = GraphBuildingContext(child_workflow_expansion="inline")
         generator = PathPermutationGenerator()
-        mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
+        generated = []
+        original = generator.generate_paths
 
-        mw_path = mw_paths[0]
-        transitions = mw_path.workflow_transitions
+        def counting_generate_paths(metadata, context):
+            generated.append(metadata.workflow_class)
+            return original(metadata, context)
 
-        # Should have 2 transitions: Parent→Child, Child→Parent
-        assert len(transitions) == 2
-        assert transitions[0][1] == "ParentWorkflow"
-        assert transitions[0][2] == "ChildWorkflow"
-        assert transitions[1][1] == "ChildWorkflow"
-        assert transitions[1][2] == "ParentWorkflow"
+        monkeypatch.setattr(generator, "generate_paths", counting_generate_paths)
 
-    def test_inline_mode_path_explosion_error(
-        self, parent_with_multiple_decisions, child_with_multiple_decisions
-    ):
-        """Inline mode raises error when 32 × 32 = 1024 paths exceeds max_paths."""
-        call_graph = WorkflowCallGraph(
-            root_workflow=parent_with_multiple_decisions,
-            child_workflows={"ChildWorkflow": child_with_multiple_decisions},
-            call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=parent_with_multiple_decisions.child_workflow_calls,
-            total_workflows=2,
-        )
+        context = GraphBuildingContext(child_workflow_expansion="inline")
+        assert len(generator.generate_cross_workflow_paths(call_graph, context)) == 4
+        assert generated == ["ParentWorkflow", "ChildWorkflow"]
 
+    def test_inline_mode_path_explosion_error(self, generator, explosion_call_graph):
+        """Inline mode raises error when 32 × 32 = 1024 paths exceeds max_paths."""
         # Set max_paths to 1023 so that 32 × 32 = 1024 exceeds the limit
         context = GraphBuildingContext(child_workflow_expansion="inline", max_paths=1023)
-        generator = PathPermutationGenerator()
 
         # Should raise error because 32 × 32 = 1024 paths exceeds limit of 1023
         with pytest.raises(GraphGenerationError) as exc_info:
-            generator.generate_cross_workflow_paths(call_graph, context)
+            generator.generate_cross_workflow_paths(explosion_call_graph, context)
 
         error_msg = str(exc_info.value)
         assert "Cross-workflow path explosion" in error_msg
         assert "1024" in error_msg  # Total paths
         assert "ParentWorkflow" in error_msg or "Parent" in error_msg
 
-    def test_inline_mode_no_children(self, linear_parent_metadata):
+    def test_inline_mode_path_explosion_rejected_before_generation(
+        self, explosion_call_graph, monkeypatch
+    ):
+        """The explosion check uses metadata counts and enumerates no paths."""
+        generator = PathPermutationGenerator()
+
+        def fail_generate_paths(metadata, context):
+            raise AssertionError("paths generated before the explosion check")
+
+        monkeypatch.setattr(generator, "generate_paths", fail_generate_paths)
+
+        context = GraphBuildingContext(child_workflow_expansion="inline", max_paths=1023)
+        with pytest.raises(GraphGenerationError, match="32 paths.*= 1024 total paths"):
+            generator.generate_cross_workflow_paths(explosion_call_graph, context)
+
+    def test_inline_mode_no_children(self, generator, linear_parent_metadata):
         """Inline mode with no child workflows behaves like reference mode."""
         # Create call graph with no children
         parent_no_children = WorkflowMetadata(
@@ -329,7 +369,7 @@ class TestInlineMode:
             activities=[Activity("Activity1", 10)],
             decision_points=[],
             signal_points=[],
-            source_file=Path("parent.py"),
+            source_file=_PARENT_FILE,
             total_paths=1,
             child_workflow_calls=[],  # No children
         )
@@ -343,7 +383,6 @@ class TestInlineMode:
         )
 
         context = GraphBuildingContext(child_workflow_expansion="inline")
-        generator = PathPermutationGenerator()
         mw_paths = generator.generate_cross_workflow_paths(call_graph, context)
 
         # Should generate 1 path, same as reference mode
@@ -352,36 +391,6 @@ class TestInlineMode:
         assert mw_paths[0].workflow_transitions == []
 
 
-class TestSubgraphMode:
-    """Tests for subgraph mode (Mermaid subgraph rendering)."""
-
-    def test_subgraph_mode_generates_reference_paths(
-        self,
-        linear_parent_metadata,
-        linear_child_metadata,
-    ):
-        """Subgraph mode generates same paths as reference mode."""
-        call_graph = WorkflowCallGraph(
-            root_workflow=linear_parent_metadata,
-            child_workflows={"ChildWorkflow": linear_child_metadata},
-            call_relationships=[("ParentWorkflow", "ChildWorkflow")],
-            all_child_calls=linear_parent_metadata.child_workflow_calls,
-            total_workflows=2,
-        )
-
-        context_reference = GraphBuildingContext(child_workflow_expansion="reference")
-        context_subgraph = GraphBuildingContext(child_workflow_expansion="subgraph")
-        generator = PathPermutationGenerator()
-
-        mw_paths_reference = generator.generate_cross_workflow_paths(call_graph, context_reference)
-        mw_paths_subgraph = generator.generate_cross_workflow_paths(call_graph, context_subgraph)
-
-        # Subgraph mode should generate same paths as reference mode
-        assert len(mw_paths_subgraph) == len(mw_paths_reference)
-        assert mw_paths_subgraph[0].steps == mw_paths_reference[0].steps
-        assert mw_paths_subgraph[0].workflows == mw_paths_reference[0].workflows
-
-
 class TestContextFieldValidation:
     """Tests for GraphBuildingContext.child_workflow_expansion field."""
 
@@ -400,7 +409,7 @@ class TestContextFieldValidation:
         assert context_inline.child_workflow_expansion == "inline"
         assert context_subgraph.child_workflow_expansion == "subgraph"
 
-    def test_invalid_child_workflow_expansion_raises_error(self):
+    def test_invalid_child_workflow_expansion_raises_error(self, generator):
         """Invalid child_workflow_expansion mode should raise error during path generation."""
         # Create metadata with invalid mode (mypy won't catch this at runtime)
         linear_parent = WorkflowMetadata(
@@ -409,7 +418,7 @@ class TestContextFieldValidation:
             activities=[Activity("Activity1", 10)],
             decision_points=[],
             signal_points=[],
-            source_file=Path("parent.py"),
+            source_file=_PARENT_FILE,
             total_paths=1,
             child_workflow_calls=[],
         )
@@ -426,7 +435,6 @@ class TestContextFieldValidation:
         context = GraphBuildingContext()
         object.__setattr__(context, "child_workflow_expansion", "invalid_mode")
 
-        generator = PathPermutationGenerator()
         with pytest.raises(ValueError) as exc_info:
             generator.generate_cross_workflow_paths(call_graph, context)
 
@@ -464,3 +472,15 @@ class TestMultiWorkflowPathDataModel:
 
         with pytest.raises(AttributeError):
             mw_path.path_id = "mwpath_1"  # Should raise error
+
+    def test_multiworkflow_path_uses_slots(self):
+        """MultiWorkflowPath should keep no per-instance __dict__."""
+        mw_path = MultiWorkflowPath(
+            path_id="mwpath_0",
+            workflows=["ParentWorkflow"],
+            steps=["Activity1"],
+            workflow_transitions=[],
+            total_decisions=0,
+        )
+
+        assert not hasattr(mw_path, "__dict__")
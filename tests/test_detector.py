@@ -16,6 +16,8 @@ Test coverage includes:
 """
 
 import ast
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 import pytest
@@ -23,12 +25,11 @@ import pytest
 from temporalio_graphs._internal.graph_models import (
     ChildWorkflowCall,
     DecisionPoint,
-    ExternalSignalCall,
     SignalHandler,
-    SignalPoint,
 )
 from temporalio_graphs.detector import (
     ChildWorkflowDetector,
+    CompositeDetector,
     DecisionDetector,
     ExternalSignalDetector,
     SignalDetector,
@@ -36,24 +37,237 @@ from temporalio_graphs.detector import (
 )
 from temporalio_graphs.exceptions import InvalidSignalError, WorkflowParseError
 
+SAMPLE_WORKFLOWS_DIR = Path(__file__).parent / "fixtures" / "sample_workflows"
+SINGLE_DECISION_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "single_decision_workflow.py"
+MULTIPLE_DECISION_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "multiple_decision_workflow.py"
+ELIF_CHAIN_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "elif_chain_workflow.py"
+SIGNAL_SIMPLE_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "signal_simple.py"
+SIGNAL_MULTIPLE_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "signal_multiple.py"
+SIGNAL_WITH_DECISION_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "signal_with_decision.py"
+SIGNAL_DYNAMIC_NAME_WORKFLOW = SAMPLE_WORKFLOWS_DIR / "signal_dynamic_name.py"
+
+
+# Single-expression snippets use mode="eval": it parses as fast as mode="single"
+# (both skip exec's module wrapping) and detectors visit the Expression root directly.
+# No optimize argument is passed: ast.parse already returns the unoptimized tree, and
+# detectors must see literals exactly as written (not constant-folded).
+@lru_cache(maxsize=512)
+def _parse(source: str, mode: str = "exec") -> ast.AST:
+    """Parse a test snippet once; detectors only read the tree, so it can be shared."""
+    return ast.parse(source, mode=mode)
+
+
+# Source snippets shared by several detector tests; each is parsed once via _parse
+_SNIPPETS = {
+    "child_call_no_args": "workflow.execute_child_workflow()",
+    "child_call_int_arg": "workflow.execute_child_workflow(123)",
+    "external_signal_test_123": """
+handle = workflow.get_external_workflow_handle("test-123")
+await handle.signal("test_signal", data)
+""",
+    "shipping_ship_order_handler": """
+from temporalio import workflow
 
-class TestDecisionDetectorBasic:
-    """Basic decision detection tests."""
+@workflow.defn
+class ShippingWorkflow:
+    @workflow.signal
+    async def ship_order(self, order_id: str) -> None:
+        self.should_ship = True
+""",
+    "test_workflow_handler": """
+from temporalio import workflow
 
-    def test_single_decision_detection(self) -> None:
-        """Test detection of a single to_decision() call."""
-        source = """
-if await to_decision(amount > 1000, "HighValue"):
-    pass
-"""
-        tree = ast.parse(source)
-        detector = DecisionDetector()
-        detector.visit(tree)
+@workflow.defn
+class TestWorkflow:
+    @workflow.signal
+    async def handler(self, data: str) -> None:
+        pass
+""",
+    "test_workflow_ship_order_handler": """
+from temporalio import workflow
+
+@workflow.defn
+class TestWorkflow:
+    @workflow.signal
+    async def ship_order(self, order_id: str) -> None:
+        pass
+""",
+}
+
+
+# (source, expected signal name, parse mode) for snippets with exactly one signal
+_SINGLE_SIGNAL_CASES = [
+    pytest.param(
+        "result = await wait_condition("
+        'lambda: self.approved, timedelta(hours=24), "WaitForApproval")\n',
+        "WaitForApproval",
+        "exec",
+        id="awaited_helper",
+    ),
+    pytest.param(
+        "result = await workflow.wait_condition("
+        'lambda: self.ready, timedelta(hours=1), "AttributeSignal")\n',
+        "AttributeSignal",
+        "exec",
+        id="attribute_access",
+    ),
+    pytest.param(
+        'wait_condition(condition, timeout, "MySignal")',
+        "MySignal",
+        "eval",
+        id="string_literal_name",
+    ),
+    pytest.param(
+        'signal_name = "Dynamic"\nwait_condition(condition, timeout, signal_name)\n',
+        "UnnamedSignal",
+        "exec",
+        id="dynamic_name_fallback",
+    ),
+]
+
+# (source, expected child workflow name, parse mode) for snippets with exactly one child call
+_SINGLE_CHILD_CASES = [
+    pytest.param(
+        "workflow.execute_child_workflow(MyChildWorkflow)",
+        "MyChildWorkflow",
+        "eval",
+        id="class_reference",
+    ),
+    pytest.param(
+        'workflow.execute_child_workflow("MyChildWorkflow")',
+        "MyChildWorkflow",
+        "eval",
+        id="string_literal",
+    ),
+    pytest.param(
+        "if condition:\n    result = await workflow.execute_child_workflow(ChildWorkflow)\n",
+        "ChildWorkflow",
+        "exec",
+        id="if_block",
+    ),
+    pytest.param(
+        "if condition:\n    pass\n"
+        "else:\n    result = await workflow.execute_child_workflow(ChildWorkflow)\n",
+        "ChildWorkflow",
+        "exec",
+        id="else_block",
+    ),
+    pytest.param(
+        "for item in items:\n    result = await workflow.execute_child_workflow(ChildWorkflow)\n",
+        "ChildWorkflow",
+        "exec",
+        id="for_loop",
+    ),
+    pytest.param(
+        "if outer:\n"
+        "    if inner1:\n"
+        "        if inner2:\n"
+        "            result = await workflow.execute_child_workflow(DeepChild)\n",
+        "DeepChild",
+        "exec",
+        id="deeply_nested",
+    ),
+]
+
+
+@pytest.fixture
+def detector() -> Iterator[DecisionDetector]:
+    """A DecisionDetector for the current test, cleared once the test finishes."""
+    decision_detector = DecisionDetector()
+    yield decision_detector
+    decision_detector.clear()
+
+
+@pytest.fixture
+def signal_detector() -> Iterator[SignalDetector]:
+    """A SignalDetector for the current test, cleared once the test finishes."""
+    detector = SignalDetector()
+    yield detector
+    detector.clear()
+
+
+@pytest.fixture
+def child_detector() -> Iterator[ChildWorkflowDetector]:
+    """A ChildWorkflowDetector for the current test, cleared once the test finishes."""
+    detector = ChildWorkflowDetector()
+    yield detector
+    detector.clear()
+
+
+# (source, expected decision name, parse mode) for snippets containing exactly
+# one to_decision() call, covering argument forms, expressions and filtering.
+_SINGLE_DECISION_CASES = [
+    pytest.param(
+        'if await to_decision(amount > 1000, "HighValue"):\n    pass\n',
+        "HighValue",
+        "exec",
+        id="if_statement",
+    ),
+    pytest.param(
+        'to_decision(condition, "MyDecision")',
+        "MyDecision",
+        "eval",
+        id="positional_name",
+    ),
+    pytest.param(
+        'to_decision(condition, name="KeywordDecision")',
+        "KeywordDecision",
+        "eval",
+        id="keyword_name",
+    ),
+    pytest.param(
+        'to_decision(amount > 1000, "Test")',
+        "Test",
+        "eval",
+        id="simple_expression",
+    ),
+    pytest.param(
+        'to_decision((a > 100) and (b < 50), "Complex")',
+        "Complex",
+        "eval",
+        id="complex_expression",
+    ),
+    pytest.param(
+        'to_decision(x if condition else y, "Ternary")',
+        "Ternary",
+        "eval",
+        id="ternary_expression",
+    ),
+    pytest.param(
+        'to_decision(a if cond else b, "TernaryChoice")',
+        "TernaryChoice",
+        "eval",
+        id="ternary_in_decision",
+    ),
+    pytest.param(
+        'to_decision(x if (a if b else c) else y, "NestedTernary")',
+        "NestedTernary",
+        "eval",
+        id="nested_ternary",
+    ),
+    pytest.param(
+        'result = other_function(condition, "NotDecision")\n'
+        'result = to_warning(condition, "Warning")\n'
+        'result = to_decision(condition, "RealDecision")\n',
+        "RealDecision",
+        "exec",
+        id="ignore_other_functions",
+    ),
+    pytest.param(
+        'to_decision_something(cond, "NotMatch")\n'
+        'to_decision(cond, "Match")\n'
+        'something_to_decision(cond, "NotMatch2")\n',
+        "Match",
+        "exec",
+        id="exact_name_only",
+    ),
+]
 
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "HighValue"
 
-    def test_multiple_decisions_detection(self) -> None:
+class TestDecisionDetectorBasic:
+    """Basic decision detection tests."""
+
+    def test_multiple_decisions_detection(self, detector: DecisionDetector) -> None:
         """Test detection of multiple to_decision() calls."""
         source = """
 if await to_decision(amount > 1000, "HighValue"):
@@ -62,15 +276,14 @@ if await to_decision(amount > 1000, "HighValue"):
 if await to_decision(is_international, "InternationalOrder"):
     pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 2
         assert detector.decisions[0].name == "HighValue"
         assert detector.decisions[1].name == "InternationalOrder"
 
-    def test_nested_decisions(self) -> None:
+    def test_nested_decisions(self, detector: DecisionDetector) -> None:
         """Test detection of decisions nested in if/else blocks."""
         source = """
 if condition:
@@ -80,43 +293,53 @@ else:
     if await to_decision(y < 5, "NestedElse"):
         pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 2
         assert detector.decisions[0].name == "Nested"
         assert detector.decisions[1].name == "NestedElse"
 
+    def test_nested_decisions_reported_in_source_order(self, detector: DecisionDetector) -> None:
+        """Test decisions inside a branch precede later sibling decisions."""
+        source = """
+if await to_decision(a, "Outer"):
+    if await to_decision(b, "Inner"):
+        await workflow.execute_activity(inner_activity)
+if await to_decision(c, "Later"):
+    pass
+"""
+        tree = _parse(source)
+        detector.visit(tree)
 
-class TestDecisionNameExtraction:
-    """Tests for decision name extraction from arguments."""
+        assert detector.names == ["Outer", "Inner", "Later"]
+        assert detector.ids == ["d0", "d1", "d2"]
+        assert detector.decisions[0].true_branch_activities == (4,)
+        assert detector.decisions[1].true_branch_activities == (4,)
 
-    def test_positional_argument_name_extraction(self) -> None:
-        """Test extraction of name from positional argument."""
-        source = 'to_decision(condition, "MyDecision")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
 
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "MyDecision"
+class TestDecisionNameExtraction:
+    """Tests for decision name extraction from arguments."""
 
-    def test_keyword_argument_name_extraction(self) -> None:
-        """Test extraction of name from keyword argument."""
-        source = 'to_decision(condition, name="KeywordDecision")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+    @pytest.mark.parametrize(("source", "expected", "mode"), _SINGLE_DECISION_CASES)
+    def test_single_decision_name(
+        self,
+        source: str,
+        expected: str,
+        mode: str,
+        detector: DecisionDetector,
+    ) -> None:
+        """Test that exactly one decision is detected with the expected name."""
+        tree = _parse(source, mode=mode)
         detector.visit(tree)
 
         assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "KeywordDecision"
+        assert detector.decisions[0].name == expected
 
-    def test_missing_name_argument_error(self) -> None:
+    def test_missing_name_argument_error(self, detector: DecisionDetector) -> None:
         """Test error when name argument is missing."""
         source = "to_decision(amount > 1000)"
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
@@ -124,22 +347,20 @@ class TestDecisionNameExtraction:
         assert "name argument" in str(exc_info.value).lower()
         assert "2 arguments" in str(exc_info.value)
 
-    def test_non_string_name_error(self) -> None:
+    def test_non_string_name_error(self, detector: DecisionDetector) -> None:
         """Test error when name is not a string."""
         source = "to_decision(amount > 1000, 123)"
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
 
         assert "string" in str(exc_info.value).lower()
 
-    def test_no_arguments_error(self) -> None:
+    def test_no_arguments_error(self, detector: DecisionDetector) -> None:
         """Test error when no arguments provided."""
         source = "to_decision()"
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
@@ -148,58 +369,23 @@ class TestDecisionNameExtraction:
         assert "argument" in error_msg
 
 
-class TestExpressionExtraction:
-    """Tests for boolean expression extraction."""
-
-    def test_simple_expression_extraction(self) -> None:
-        """Test extraction of simple boolean expression."""
-        source = 'to_decision(amount > 1000, "Test")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        # Expression extracted and stored implicitly (validated during detection)
-
-    def test_complex_expression_extraction(self) -> None:
-        """Test extraction of complex boolean expression."""
-        source = 'to_decision((a > 100) and (b < 50), "Complex")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "Complex"
-
-    def test_ternary_expression_in_decision(self) -> None:
-        """Test extraction of ternary operator in decision."""
-        source = 'to_decision(x if condition else y, "Ternary")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "Ternary"
-
-
 class TestLineNumberTracking:
     """Tests for source line number tracking."""
 
-    def test_line_number_accuracy(self) -> None:
+    def test_line_number_accuracy(self, detector: DecisionDetector) -> None:
         """Test that line numbers match source locations."""
         source = """# Line 1
 # Line 2
 if await to_decision(condition, "Decision"):  # Line 3
     pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 1
         assert detector.decisions[0].line_number == 3
 
-    def test_multiple_decisions_line_numbers(self) -> None:
+    def test_multiple_decisions_line_numbers(self, detector: DecisionDetector) -> None:
         """Test line numbers for multiple decisions."""
         source = """if await to_decision(cond1, "D1"):  # Line 1
     pass
@@ -208,19 +394,16 @@ if await to_decision(cond2, "D2"):  # Line 4
     pass
 """
         lines = source.strip().split("\n")
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
-        assert len(detector.decisions) == 2
-        assert detector.decisions[0].line_number == 1
-        assert detector.decisions[1].line_number == 4
+        assert detector.line_numbers == [1, 4]
 
 
 class TestElifChainDetection:
     """Tests for elif chain detection."""
 
-    def test_two_elif_chain(self) -> None:
+    def test_two_elif_chain(self, detector: DecisionDetector) -> None:
         """Test detection of two-branch elif chain."""
         source = """
 if await to_decision(x < 100, "Low"):
@@ -230,15 +413,14 @@ elif await to_decision(x < 500, "Medium"):
 else:
     pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 2
         assert detector.decisions[0].name == "Low"
         assert detector.decisions[1].name == "Medium"
 
-    def test_three_elif_chain(self) -> None:
+    def test_three_elif_chain(self, detector: DecisionDetector) -> None:
         """Test detection of three-branch elif chain."""
         source = """
 if await to_decision(x < 100, "Low"):
@@ -250,8 +432,7 @@ elif await to_decision(x < 1000, "High"):
 else:
     pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 3
@@ -259,7 +440,7 @@ else:
         assert detector.decisions[1].name == "Medium"
         assert detector.decisions[2].name == "High"
 
-    def test_elif_chain_separate_entries(self) -> None:
+    def test_elif_chain_separate_entries(self, detector: DecisionDetector) -> None:
         """Test that each elif creates separate DecisionPoint."""
         source = """
 if await to_decision(cond1, "D1"):
@@ -267,8 +448,7 @@ if await to_decision(cond1, "D1"):
 elif await to_decision(cond2, "D2"):
     pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 2
@@ -278,70 +458,13 @@ elif await to_decision(cond2, "D2"):
         assert detector.decisions[1].name == "D2"
 
 
-class TestTernaryOperatorDetection:
-    """Tests for ternary operator detection."""
-
-    def test_ternary_in_decision(self) -> None:
-        """Test detection of ternary operator wrapped in to_decision()."""
-        source = 'to_decision(a if cond else b, "TernaryChoice")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "TernaryChoice"
-
-    def test_nested_ternary_in_decision(self) -> None:
-        """Test detection of nested ternary in decision."""
-        source = 'to_decision(x if (a if b else c) else y, "NestedTernary")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "NestedTernary"
-
-
-class TestFunctionFiltering:
-    """Tests for filtering non-decision function calls."""
-
-    def test_ignore_other_functions(self) -> None:
-        """Test that non-to_decision functions are ignored."""
-        source = """
-result = other_function(condition, "NotDecision")
-result = to_warning(condition, "Warning")
-result = to_decision(condition, "RealDecision")
-"""
-        tree = ast.parse(source)
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "RealDecision"
-
-    def test_to_decision_name_filtering(self) -> None:
-        """Test that only exact to_decision matches are detected."""
-        source = """
-to_decision_something(cond, "NotMatch")
-to_decision(cond, "Match")
-something_to_decision(cond, "NotMatch2")
-"""
-        tree = ast.parse(source)
-        detector = DecisionDetector()
-        detector.visit(tree)
-
-        assert len(detector.decisions) == 1
-        assert detector.decisions[0].name == "Match"
-
-
 class TestDecisionMetadata:
     """Tests for decision metadata storage."""
 
-    def test_decision_metadata_fields(self) -> None:
+    def test_decision_metadata_fields(self, detector: DecisionDetector) -> None:
         """Test that all decision metadata fields are populated."""
         source = 'if await to_decision(amount > 1000, "HighValue"): pass'
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         decision = detector.decisions[0]
@@ -361,45 +484,39 @@ class TestDecisionMetadata:
         with pytest.raises(AttributeError):
             decision.name = "Modified"  # type: ignore
 
-    def test_unique_decision_ids(self) -> None:
+    def test_unique_decision_ids(self, detector: DecisionDetector) -> None:
         """Test that each decision gets a unique ID."""
         source = """
 to_decision(cond1, "D1")
 to_decision(cond2, "D2")
 to_decision(cond3, "D3")
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
-        assert len(detector.decisions) == 3
-        ids = [d.id for d in detector.decisions]
-        assert len(set(ids)) == 3  # All unique
-        assert ids == ["d0", "d1", "d2"]
+        assert detector.ids == ["d0", "d1", "d2"]  # Sequential, hence unique
 
 
 class TestErrorMessages:
     """Tests for error message quality."""
 
-    def test_error_includes_line_number(self) -> None:
+    def test_error_includes_line_number(self, detector: DecisionDetector) -> None:
         """Test that error messages include line number."""
         source = """# Line 1
 # Line 2
 to_decision(condition)  # Line 3 - missing name arg
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
 
         assert "Line 3" in str(exc_info.value)
 
-    def test_error_includes_suggestion(self) -> None:
+    def test_error_includes_suggestion(self, detector: DecisionDetector) -> None:
         """Test that error messages include helpful suggestions."""
         source = "to_decision(condition)"
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
@@ -408,11 +525,10 @@ to_decision(condition)  # Line 3 - missing name arg
         assert "to_decision" in error_msg
         assert "2 arguments" in error_msg or "name" in error_msg
 
-    def test_error_for_wrong_argument_type(self) -> None:
+    def test_error_for_wrong_argument_type(self, detector: DecisionDetector) -> None:
         """Test error message for wrong argument type."""
         source = "to_decision(condition, 123)"
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
@@ -424,88 +540,145 @@ to_decision(condition)  # Line 3 - missing name arg
 class TestWorkflowFiles:
     """Integration tests using real workflow files."""
 
-    def test_single_decision_workflow_file(self) -> None:
+    def test_single_decision_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        detector: DecisionDetector,
+    ) -> None:
         """Test detection in single decision workflow file."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "single_decision_workflow.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = DecisionDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[SINGLE_DECISION_WORKFLOW]
+        detector.visit(tree)
 
-            assert len(detector.decisions) == 1
-            assert detector.decisions[0].name == "HighValue"
+        assert len(detector.decisions) == 1
+        assert detector.decisions[0].name == "HighValue"
 
-    def test_multiple_decision_workflow_file(self) -> None:
+    def test_multiple_decision_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        detector: DecisionDetector,
+    ) -> None:
         """Test detection in multiple decision workflow file."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "multiple_decision_workflow.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = DecisionDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[MULTIPLE_DECISION_WORKFLOW]
+        detector.visit(tree)
 
-            assert len(detector.decisions) == 2
+        assert len(detector.decisions) == 2
 
-    def test_elif_chain_workflow_file(self) -> None:
+    def test_elif_chain_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        detector: DecisionDetector,
+    ) -> None:
         """Test detection in elif chain workflow file."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "elif_chain_workflow.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = DecisionDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[ELIF_CHAIN_WORKFLOW]
+        detector.visit(tree)
 
-            assert len(detector.decisions) == 3
+        assert len(detector.decisions) == 3
 
 
 class TestDetectorProperty:
     """Tests for DecisionDetector property."""
 
-    def test_decisions_property_returns_list(self) -> None:
+    def test_decisions_property_returns_list(self, detector: DecisionDetector) -> None:
         """Test that decisions property returns list."""
-        detector = DecisionDetector()
         assert isinstance(detector.decisions, list)
         assert len(detector.decisions) == 0
 
-    def test_decisions_property_read_only(self) -> None:
+    def test_column_properties_parallel_decisions(self, detector: DecisionDetector) -> None:
+        """Test that names, ids and line_numbers line up with decisions."""
+        source = 'to_decision(a, "First")\nto_decision(b, "Second")\n'
+        detector.visit(_parse(source))
+
+        assert detector.names == ["First", "Second"]
+        assert detector.ids == ["d0", "d1"]
+        assert detector.line_numbers == [1, 2]
+
+    def test_decisions_property_read_only(self, detector: DecisionDetector) -> None:
         """Test that decisions property cannot be reassigned."""
-        detector = DecisionDetector()
         with pytest.raises(AttributeError):
             detector.decisions = []  # type: ignore
 
 
+class TestDetectFromSource:
+    """Tests for DecisionDetector.detect_from_source()."""
+
+    def test_source_without_marker_is_not_parsed(self, detector: DecisionDetector) -> None:
+        """Test that source never mentioning to_decision skips parsing entirely."""
+        # Invalid syntax would raise SyntaxError if the source reached ast.parse
+        source = 'result = other_function(condition, "NotDecision"\n'
+
+        assert detector.detect_from_source(source) == []
+
+    @pytest.mark.parametrize(("source", "expected", "mode"), _SINGLE_DECISION_CASES)
+    def test_matches_visit(self, source: str, expected: str, mode: str) -> None:
+        """Test that detecting from source finds the same decision as visit()."""
+        decisions = DecisionDetector().detect_from_source(source)
+
+        assert [d.name for d in decisions] == [expected]
+
+    def test_marker_in_other_name_still_parsed(self) -> None:
+        """Test that a substring hit falls through to full detection."""
+        source = 'obj.to_decision_v2(condition, "Test2")\n'
+
+        assert DecisionDetector().detect_from_source(source) == []
+
+
+class TestQuickReject:
+    """Tests for the detectors' substring pre-screen."""
+
+    @pytest.mark.parametrize(
+        ("detector_cls", "matching_source"),
+        [
+            pytest.param(DecisionDetector, 'to_decision(cond, "Name")', id="decision"),
+            pytest.param(
+                SignalDetector,
+                'await wait_condition(lambda: ok, timeout, "Name")',
+                id="signal",
+            ),
+            pytest.param(
+                ChildWorkflowDetector,
+                "await workflow.execute_child_workflow(Child)",
+                id="child",
+            ),
+        ],
+    )
+    def test_rejects_only_sources_without_marker(
+        self,
+        detector_cls: type,
+        matching_source: str,
+    ) -> None:
+        """Test that sources lacking the marker are rejected and others are kept."""
+        assert detector_cls.quick_reject('result = await workflow.execute_activity(step, "x")')
+        assert not detector_cls.quick_reject(matching_source)
+
+
 class TestEdgeCases:
     """Tests for edge cases and corner cases."""
 
-    def test_attribute_access_function_not_matched(self) -> None:
+    def test_attribute_access_function_not_matched(self, detector: DecisionDetector) -> None:
         """Test that attribute access to non-to_decision functions not matched."""
         source = """
 obj.some_method(condition, "Test")
 obj.to_decision_v2(condition, "Test2")
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 0
 
-    def test_error_missing_expression_argument(self) -> None:
+    def test_error_missing_expression_argument(self, detector: DecisionDetector) -> None:
         """Test error when expression argument is completely missing."""
         source = 'to_decision(name="OnlyName")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
 
         assert "at least 1 argument" in str(exc_info.value).lower()
 
-    def test_keyword_argument_wrong_type_error(self) -> None:
+    def test_keyword_argument_wrong_type_error(self, detector: DecisionDetector) -> None:
         """Test error when keyword argument name has wrong type."""
         source = 'to_decision(condition, name=123)'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(WorkflowParseError) as exc_info:
             detector.visit(tree)
@@ -513,42 +686,65 @@ obj.to_decision_v2(condition, "Test2")
         error_msg = str(exc_info.value)
         assert "string" in error_msg.lower() or "name argument" in error_msg.lower()
 
-    def test_multiple_decisions_with_errors(self) -> None:
+    def test_multiple_decisions_with_errors(self, detector: DecisionDetector) -> None:
         """Test that first valid decision is detected before error."""
         source = """
 to_decision(cond1, "Valid")
 to_decision(cond2)  # Missing name - error
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
 
         # First to_decision should be detected successfully
         detector.visit(tree.body[0])
         assert len(detector.decisions) == 1
         assert detector.decisions[0].name == "Valid"
 
-    def test_detector_reuse_after_clear(self) -> None:
+    def test_error_stops_traversal_immediately(self, detector: DecisionDetector) -> None:
+        """Test that a malformed call aborts the walk before later decisions."""
+        source = """
+to_decision(cond1, "Valid")
+to_decision(cond2)  # Missing name - error
+to_decision(cond3, "NeverReached")
+"""
+        with pytest.raises(WorkflowParseError):
+            detector.visit(_parse(source))
+
+        assert detector.names == ["Valid"]
+
+    def test_deep_expression_does_not_exhaust_stack(self, detector: DecisionDetector) -> None:
+        """Test that traversal depth is not bounded by the recursion limit."""
+        # A left-nested BinOp chain far deeper than a recursive visitor can follow
+        deep_expr = " + ".join(["a"] * 800)
+        source = (
+            f'if await to_decision({deep_expr}, "Deep"):\n'
+            f"    total = {deep_expr}\n"
+            "    await workflow.execute_activity(process)\n"
+        )
+        detector.visit(_parse(source))
+
+        assert detector.names == ["Deep"]
+        assert detector.decisions[0].true_branch_activities == (3,)
+
+    def test_detector_reuse_after_clear(self, detector: DecisionDetector) -> None:
         """Test detector can be reused with fresh state."""
         source1 = 'to_decision(cond1, "First")'
         source2 = 'to_decision(cond2, "Second")'
 
-        tree1 = ast.parse(source1, mode="eval")
-        tree2 = ast.parse(source2, mode="eval")
-
-        detector = DecisionDetector()
+        tree1 = _parse(source1, mode="eval")
+        tree2 = _parse(source2, mode="eval")
 
         # First analysis
         detector.visit(tree1)
         assert len(detector.decisions) == 1
         assert detector.decisions[0].name == "First"
 
-        # Create new detector for second analysis (fresh state)
-        detector2 = DecisionDetector()
-        detector2.visit(tree2)
-        assert len(detector2.decisions) == 1
-        assert detector2.decisions[0].name == "Second"
+        # Reset in place for second analysis (fresh state, IDs restart)
+        detector.clear()
+        detector.visit(tree2)
+        assert detector.names == ["Second"]
+        assert detector.ids == ["d0"]
 
-    def test_deeply_nested_decisions(self) -> None:
+    def test_deeply_nested_decisions(self, detector: DecisionDetector) -> None:
         """Test detection in deeply nested code structures."""
         source = """
 if condition:
@@ -557,41 +753,46 @@ if condition:
             if await to_decision(deep_cond, "DeepDecision"):
                 pass
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         assert len(detector.decisions) == 1
         assert detector.decisions[0].name == "DeepDecision"
 
-    def test_decision_in_function_call_as_argument(self) -> None:
+    def test_decision_in_function_call_as_argument(self, detector: DecisionDetector) -> None:
         """Test detection when to_decision is inside another function call."""
         source = 'some_function(to_decision(cond, "Nested"))'
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         # Should detect the nested to_decision call
         assert len(detector.decisions) == 1
         assert detector.decisions[0].name == "Nested"
 
-    def test_non_name_non_attribute_callable(self) -> None:
+    def test_decision_arguments_not_descended(self, detector: DecisionDetector) -> None:
+        """Test that a to_decision() used as another decision's condition is not reported."""
+        source = 'to_decision(to_decision(cond, "Inner"), "Outer")\nto_decision(other, "Next")\n'
+        tree = _parse(source)
+        detector.visit(tree)
+
+        assert detector.names == ["Outer", "Next"]
+        assert detector.ids == ["d0", "d1"]
+
+    def test_non_name_non_attribute_callable(self, detector: DecisionDetector) -> None:
         """Test that non-Name/Attribute callables are ignored."""
         source = """
 (lambda x: x)(condition, "Test")
 """
-        tree = ast.parse(source)
-        detector = DecisionDetector()
+        tree = _parse(source)
         detector.visit(tree)
 
         # Lambda call should not match to_decision
         assert len(detector.decisions) == 0
 
-    def test_keyword_argument_no_positional_name(self) -> None:
+    def test_keyword_argument_no_positional_name(self, detector: DecisionDetector) -> None:
         """Test keyword argument name extraction without positional second arg."""
         source = 'to_decision(condition, name="KeywordOnly")'
-        tree = ast.parse(source, mode="eval")
-        detector = DecisionDetector()
+        tree = _parse(source, mode="eval")
         detector.visit(tree)
 
         assert len(detector.decisions) == 1
@@ -606,106 +807,78 @@ if condition:
 class TestSignalDetectorBasic:
     """Basic signal detection tests."""
 
-    def test_single_signal_detection(self) -> None:
-        """Test detection of a single wait_condition() call."""
-        source = """
-result = await wait_condition(lambda: self.approved, timedelta(hours=24), "WaitForApproval")
-"""
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+    @pytest.mark.parametrize(("source", "expected", "mode"), _SINGLE_SIGNAL_CASES)
+    def test_single_signal_name(
+        self, signal_detector: SignalDetector, source: str, expected: str, mode: str
+    ) -> None:
+        """Test that exactly one signal is detected with the expected name."""
+        signal_detector.visit(_parse(source, mode=mode))
 
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "WaitForApproval"
+        assert [signal.name for signal in signal_detector.signals] == [expected]
 
-    def test_multiple_signals_detection(self) -> None:
+    def test_multiple_signals_detection(self, signal_detector: SignalDetector) -> None:
         """Test detection of multiple wait_condition() calls."""
         source = """
 first = await wait_condition(lambda: self.first, timedelta(hours=12), "FirstSignal")
 second = await wait_condition(lambda: self.second, timedelta(hours=24), "SecondSignal")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 2
-        assert detector.signals[0].name == "FirstSignal"
-        assert detector.signals[1].name == "SecondSignal"
+        assert len(signal_detector.signals) == 2
+        assert signal_detector.signals[0].name == "FirstSignal"
+        assert signal_detector.signals[1].name == "SecondSignal"
+        assert SignalDetector.count_candidates(source) == 2
 
-    def test_ignore_non_wait_condition_calls(self) -> None:
-        """Test that non-wait_condition function calls are ignored."""
+    def test_count_candidates_is_upper_bound(self, signal_detector: SignalDetector) -> None:
+        """Test the regex count includes built-in wait_condition calls visit() ignores."""
         source = """
-some_function(lambda: x, timedelta(hours=1), "NotASignal")
-other_call(condition, timeout, "AlsoNotASignal")
+await workflow.wait_condition(lambda: self.ready)
+approved = await wait_condition(lambda: self.ok, timedelta(hours=1), "Approval")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        signal_detector.visit(_parse(source))
 
-        assert len(detector.signals) == 0
+        assert len(signal_detector.signals) == 1
+        assert SignalDetector.count_candidates(source) == 2
+        assert SignalDetector.count_candidates("await workflow.execute_activity(step)") == 0
 
-    def test_attribute_access_wait_condition(self) -> None:
-        """Test detection of workflow.wait_condition() attribute access."""
+    def test_ignore_non_wait_condition_calls(self, signal_detector: SignalDetector) -> None:
+        """Test that non-wait_condition function calls are ignored."""
         source = """
-result = await workflow.wait_condition(lambda: self.ready, timedelta(hours=1), "AttributeSignal")
+some_function(lambda: x, timedelta(hours=1), "NotASignal")
+other_call(condition, timeout, "AlsoNotASignal")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        assert SignalDetector.quick_reject(source)
 
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "AttributeSignal"
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
+        assert len(signal_detector.signals) == 0
 
 class TestSignalNameExtraction:
     """Tests for signal name extraction from arguments."""
 
-    def test_extract_signal_name_from_literal(self) -> None:
-        """Test extraction of signal name from string literal."""
-        source = 'wait_condition(condition, timeout, "MySignal")'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
-        detector.visit(tree)
-
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "MySignal"
-
-    def test_dynamic_signal_name_uses_unnamed(self) -> None:
-        """Test that dynamic signal name (variable) uses 'UnnamedSignal'."""
-        source = """
-signal_name = "Dynamic"
-wait_condition(condition, timeout, signal_name)
-"""
-        tree = ast.parse(source)
-        detector = SignalDetector()
-
-        # Should not raise error, but use fallback
-        detector.visit(tree)
-
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "UnnamedSignal"
-
-    def test_missing_signal_name_raises_error(self) -> None:
+    def test_missing_signal_name_raises_error(self, signal_detector: SignalDetector) -> None:
         """Test that missing signal name argument raises InvalidSignalError."""
         source = 'wait_condition(condition, timeout)'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(InvalidSignalError) as exc_info:
-            detector.visit(tree)
+            signal_detector.visit(tree)
 
         error_msg = str(exc_info.value)
         assert "3 arguments" in error_msg
         assert "got 2" in error_msg
 
-    def test_completely_missing_arguments_raises_error(self) -> None:
+    def test_completely_missing_arguments_raises_error(
+        self, signal_detector: SignalDetector
+    ) -> None:
         """Test that wait_condition with no arguments raises error."""
         source = 'wait_condition()'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
+        tree = _parse(source, mode="eval")
 
         with pytest.raises(InvalidSignalError) as exc_info:
-            detector.visit(tree)
+            signal_detector.visit(tree)
 
         error_msg = str(exc_info.value)
         assert "3 arguments" in error_msg
@@ -715,29 +888,40 @@ wait_condition(condition, timeout, signal_name)
 class TestSignalMetadataExtraction:
     """Tests for signal metadata extraction (condition, timeout, line number)."""
 
-    def test_condition_expression_extracted(self) -> None:
+    def test_condition_expression_extracted(self, signal_detector: SignalDetector) -> None:
         """Test that condition expression is extracted correctly."""
         source = 'wait_condition(lambda: self.approved, timedelta(hours=24), "Test")'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        assert "lambda" in detector.signals[0].condition_expr
-        assert "approved" in detector.signals[0].condition_expr
+        assert len(signal_detector.signals) == 1
+        assert "lambda" in signal_detector.signals[0].condition_expr
+        assert "approved" in signal_detector.signals[0].condition_expr
 
-    def test_timeout_expression_extracted(self) -> None:
+    def test_expressions_rendered_afresh_after_mutation(self) -> None:
+        """Test that rendered expressions are not reused across visits of a mutated tree."""
+        tree = ast.parse('wait_condition(lambda: self.a, t, "Mutated")', mode="eval")
+        first = SignalDetector()
+        first.visit(tree)
+        assert first.signals[0].condition_expr == "lambda: self.a"
+
+        tree.body.args[0].body.attr = "b"  # type: ignore[attr-defined]
+        second = SignalDetector()
+        second.visit(tree)
+
+        assert second.signals[0].condition_expr == "lambda: self.b"
+
+    def test_timeout_expression_extracted(self, signal_detector: SignalDetector) -> None:
         """Test that timeout expression is extracted correctly."""
         source = 'wait_condition(lambda: x, timedelta(hours=24), "Test")'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        assert "timedelta" in detector.signals[0].timeout_expr
-        assert "24" in detector.signals[0].timeout_expr
+        assert len(signal_detector.signals) == 1
+        assert "timedelta" in signal_detector.signals[0].timeout_expr
+        assert "24" in signal_detector.signals[0].timeout_expr
 
-    def test_source_line_numbers_correct(self) -> None:
+    def test_source_line_numbers_correct(self, signal_detector: SignalDetector) -> None:
         """Test that source line numbers are recorded correctly."""
         source = """
 
@@ -746,163 +930,215 @@ result = await wait_condition(lambda: x, timedelta(hours=1), "Line3")
 
 second = await wait_condition(lambda: y, timedelta(hours=2), "Line6")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 2
-        assert detector.signals[0].source_line == 3
-        assert detector.signals[1].source_line == 6
+        assert len(signal_detector.signals) == 2
+        assert signal_detector.signals[0].source_line == 3
+        assert signal_detector.signals[1].source_line == 6
 
-    def test_node_id_generation_deterministic(self) -> None:
+    def test_node_id_generation_deterministic(self, signal_detector: SignalDetector) -> None:
         """Test that node IDs are deterministic based on name and line."""
         source = """
 await wait_condition(lambda: x, timedelta(hours=1), "MySignal")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        signal = detector.signals[0]
+        assert len(signal_detector.signals) == 1
+        signal = signal_detector.signals[0]
         assert signal.node_id == f"sig_mysignal_{signal.source_line}"
 
-    def test_node_id_handles_spaces(self) -> None:
+    def test_node_id_is_interned(self, signal_detector: SignalDetector) -> None:
+        """Test that repeated detections of one signal share a single node ID object."""
+        tree = _parse('wait_condition(lambda: x, timedelta(hours=1), "MySignal")', mode="eval")
+        signal_detector.visit(tree)
+        first = signal_detector.signals[0].node_id
+        signal_detector.clear()
+        signal_detector.visit(tree)
+        assert signal_detector.signals[0].node_id is first
+
+    def test_node_id_handles_spaces(self, signal_detector: SignalDetector) -> None:
         """Test that node IDs handle signal names with spaces."""
         source = 'wait_condition(lambda: x, timedelta(hours=1), "Wait For Approval")'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        assert "wait_for_approval" in detector.signals[0].node_id
+        assert len(signal_detector.signals) == 1
+        assert "wait_for_approval" in signal_detector.signals[0].node_id
 
 
 class TestSignalWorkflowFiles:
     """Integration tests using signal workflow fixture files."""
 
-    def test_signal_simple_workflow_file(self) -> None:
+    def test_signal_simple_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        signal_detector: SignalDetector,
+    ) -> None:
         """Test detection in simple signal workflow file."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "signal_simple.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = SignalDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[SIGNAL_SIMPLE_WORKFLOW]
+        signal_detector.visit(tree)
 
-            assert len(detector.signals) == 1
-            assert detector.signals[0].name == "WaitForApproval"
+        assert len(signal_detector.signals) == 1
+        assert signal_detector.signals[0].name == "WaitForApproval"
 
-    def test_signal_multiple_workflow_file(self) -> None:
+    def test_signal_multiple_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        signal_detector: SignalDetector,
+    ) -> None:
         """Test detection in multiple signal workflow file."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "signal_multiple.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = SignalDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[SIGNAL_MULTIPLE_WORKFLOW]
+        signal_detector.visit(tree)
 
-            assert len(detector.signals) == 2
-            assert detector.signals[0].name == "WaitForFirstApproval"
-            assert detector.signals[1].name == "WaitForSecondApproval"
+        assert len(signal_detector.signals) == 2
+        assert signal_detector.signals[0].name == "WaitForFirstApproval"
+        assert signal_detector.signals[1].name == "WaitForSecondApproval"
 
-    def test_signal_with_decision_workflow_file(self) -> None:
+    def test_signal_with_decision_workflow_file(
+        self, sample_workflow_asts: dict[Path, ast.Module]
+    ) -> None:
         """Test signal detection in workflow with both signals and decisions."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "signal_with_decision.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-
-            # Test signals
-            signal_detector = SignalDetector()
-            signal_detector.visit(tree)
-            assert len(signal_detector.signals) == 1
-            assert signal_detector.signals[0].name == "WaitForApproval"
+        tree = sample_workflow_asts[SIGNAL_WITH_DECISION_WORKFLOW]
+
+        # One traversal detects both signals and decisions
+        composite = CompositeDetector()
+        composite.visit(tree)
+        assert len(composite.signals) == 1
+        assert composite.signals[0].name == "WaitForApproval"
+        assert len(composite.decisions) == 1
+        assert composite.decisions[0].name == "HighValue"
+
+    def test_composite_matches_separate_detectors(
+        self, sample_workflow_asts: dict[Path, ast.Module]
+    ) -> None:
+        """Test single-pass composite detection equals running each detector alone."""
+        for tree in sample_workflow_asts.values():
+            composite = CompositeDetector()
+            composite.set_parent_workflow("Parent")
+            composite.visit(tree)
 
-            # Test decisions also detected
             decision_detector = DecisionDetector()
             decision_detector.visit(tree)
-            assert len(decision_detector.decisions) == 1
-            assert decision_detector.decisions[0].name == "HighValue"
-
-    def test_signal_dynamic_name_workflow_file(self) -> None:
+            signal_detector = SignalDetector()
+            signal_detector.visit(tree)
+            child_detector = ChildWorkflowDetector()
+            child_detector.set_parent_workflow("Parent")
+            child_detector.visit(tree)
+
+            assert composite.decisions == decision_detector.decisions
+            assert composite.signals == signal_detector.signals
+            assert composite.child_calls == child_detector.child_calls
+
+    def test_composite_finds_signal_inside_decision_arguments(self) -> None:
+        """Test calls nested in pruned to_decision() arguments are still visited."""
+        tree = ast.parse('await to_decision(await wait_condition(lambda: ok, t, "Inner"), "Outer")')
+        composite = CompositeDetector()
+        composite.visit(tree)
+        assert [d.name for d in composite.decisions] == ["Outer"]
+        assert [s.name for s in composite.signals] == ["Inner"]
+
+    def test_composite_detector_uses_slots(self) -> None:
+        """Test CompositeDetector instances carry no per-instance __dict__."""
+        assert not hasattr(CompositeDetector(), "__dict__")
+
+    def test_signal_dynamic_name_workflow_file(
+        self,
+        sample_workflow_asts: dict[Path, ast.Module],
+        signal_detector: SignalDetector,
+    ) -> None:
         """Test detection in workflow with dynamic signal name."""
-        workflow_file = Path(__file__).parent / "fixtures" / "sample_workflows" / "signal_dynamic_name.py"
-        if workflow_file.exists():
-            source = workflow_file.read_text()
-            tree = ast.parse(source)
-            detector = SignalDetector()
-            detector.visit(tree)
+        tree = sample_workflow_asts[SIGNAL_DYNAMIC_NAME_WORKFLOW]
+        signal_detector.visit(tree)
 
-            # Should detect signal but use UnnamedSignal fallback
-            assert len(detector.signals) == 1
-            assert detector.signals[0].name == "UnnamedSignal"
+        # Should detect signal but use UnnamedSignal fallback
+        assert len(signal_detector.signals) == 1
+        assert signal_detector.signals[0].name == "UnnamedSignal"
 
 
 class TestSignalDetectorProperty:
     """Tests for SignalDetector property."""
 
-    def test_signals_property_returns_list(self) -> None:
+    def test_signals_property_returns_list(self, signal_detector: SignalDetector) -> None:
         """Test that signals property returns list."""
-        detector = SignalDetector()
-        assert isinstance(detector.signals, list)
-        assert len(detector.signals) == 0
+        assert isinstance(signal_detector.signals, list)
+        assert len(signal_detector.signals) == 0
 
-    def test_signals_property_read_only(self) -> None:
+    def test_signals_property_read_only(self, signal_detector: SignalDetector) -> None:
         """Test that signals property cannot be reassigned."""
-        detector = SignalDetector()
         with pytest.raises(AttributeError):
-            detector.signals = []  # type: ignore
+            signal_detector.signals = []  # type: ignore
+
+    def test_clear_resets_detected_signals(self, signal_detector: SignalDetector) -> None:
+        """Test that clear() empties signals so the detector can be reused."""
+        tree = _parse('await wait_condition(lambda: ok, timedelta(hours=1), "First")\n')
+        signal_detector.visit(tree)
+        assert len(signal_detector.signals) == 1
+
+        signal_detector.clear()
+        assert signal_detector.signals == []
+        signal_detector.visit(tree)
+        assert [s.name for s in signal_detector.signals] == ["First"]
 
 
 class TestSignalEdgeCases:
     """Tests for signal detection edge cases."""
 
-    def test_nested_signal_calls(self) -> None:
+    def test_deep_tree_does_not_exhaust_stack(self, signal_detector: SignalDetector) -> None:
+        """Test that signals are found in trees deeper than the recursion limit."""
+        deep_expr = " + ".join(["a"] * 800)
+        source = (
+            'if await wait_condition(lambda: self.ok, timedelta(hours=1), "Deep"):\n'
+            f"    total = {deep_expr}\n"
+            "    await workflow.execute_activity(ship)\n"
+        )
+        signal_detector.visit(_parse(source))
+
+        assert [signal.name for signal in signal_detector.signals] == ["Deep"]
+        assert signal_detector.signals[0].signaled_branch_activities == (3,)
+
+    def test_nested_signal_calls(self, signal_detector: SignalDetector) -> None:
         """Test detection of signals in nested code structures."""
         source = """
 if condition:
     if nested:
         result = await wait_condition(lambda: x, timedelta(hours=1), "NestedSignal")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "NestedSignal"
+        assert len(signal_detector.signals) == 1
+        assert signal_detector.signals[0].name == "NestedSignal"
 
-    def test_signal_in_function_call_as_argument(self) -> None:
+    def test_signal_in_function_call_as_argument(self, signal_detector: SignalDetector) -> None:
         """Test detection when wait_condition is inside another function call."""
         source = 'some_function(wait_condition(cond, timeout, "Nested"))'
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        assert detector.signals[0].name == "Nested"
+        assert len(signal_detector.signals) == 1
+        assert signal_detector.signals[0].name == "Nested"
 
-    def test_attribute_access_function_not_matched(self) -> None:
+    def test_attribute_access_function_not_matched(self, signal_detector: SignalDetector) -> None:
         """Test that attribute access to non-wait_condition functions not matched."""
         source = """
 obj.some_method(condition, timeout, "Test")
 obj.wait_condition_v2(condition, timeout, "Test2")
 """
-        tree = ast.parse(source)
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source)
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 0
+        assert len(signal_detector.signals) == 0
 
-    def test_signal_point_dataclass_fields(self) -> None:
+    def test_signal_point_dataclass_fields(self, signal_detector: SignalDetector) -> None:
         """Test that SignalPoint has all required fields."""
         source = 'wait_condition(lambda: x, timedelta(hours=1), "TestSignal")'
-        tree = ast.parse(source, mode="eval")
-        detector = SignalDetector()
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        signal_detector.visit(tree)
 
-        assert len(detector.signals) == 1
-        signal = detector.signals[0]
+        assert len(signal_detector.signals) == 1
+        signal = signal_detector.signals[0]
 
         # Verify all fields exist and have correct types
         assert isinstance(signal.name, str)
@@ -923,8 +1159,8 @@ obj.wait_condition_v2(condition, timeout, "Test2")
         source1 = 'wait_condition(c1, t1, "First")'
         source2 = 'wait_condition(c2, t2, "Second")'
 
-        tree1 = ast.parse(source1, mode="eval")
-        tree2 = ast.parse(source2, mode="eval")
+        tree1 = _parse(source1, mode="eval")
+        tree2 = _parse(source2, mode="eval")
 
         detector1 = SignalDetector()
         detector1.visit(tree1)
@@ -950,113 +1186,104 @@ obj.wait_condition_v2(condition, timeout, "Test2")
 class TestChildWorkflowDetectorBasic:
     """Basic child workflow detection tests."""
 
-    def test_single_child_workflow_class_reference(self) -> None:
+    def test_single_child_workflow_class_reference(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test detection of single execute_child_workflow with class reference."""
         source = """
 result = await workflow.execute_child_workflow(ChildWorkflow, args={"param": value})
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("ParentWorkflow")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("ParentWorkflow")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "ChildWorkflow"
-        assert detector.child_calls[0].parent_workflow == "ParentWorkflow"
+        assert len(child_detector.child_calls) == 1
+        assert child_detector.child_calls[0].workflow_name == "ChildWorkflow"
+        assert child_detector.child_calls[0].parent_workflow == "ParentWorkflow"
 
-    def test_single_child_workflow_string_literal(self) -> None:
+    def test_single_child_workflow_string_literal(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test detection of single execute_child_workflow with string literal."""
         source = """
 result = await workflow.execute_child_workflow("ChildWorkflowName", args={"param": value})
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("ParentWorkflow")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("ParentWorkflow")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "ChildWorkflowName"
-        assert detector.child_calls[0].parent_workflow == "ParentWorkflow"
+        assert len(child_detector.child_calls) == 1
+        assert child_detector.child_calls[0].workflow_name == "ChildWorkflowName"
+        assert child_detector.child_calls[0].parent_workflow == "ParentWorkflow"
 
-    def test_multiple_child_workflow_calls(self) -> None:
+    def test_multiple_child_workflow_calls(self, child_detector: ChildWorkflowDetector) -> None:
         """Test detection of multiple child workflow calls."""
         source = """
 result1 = await workflow.execute_child_workflow(FirstChild, args={})
 result2 = await workflow.execute_child_workflow("SecondChild", args={})
 result3 = await workflow.execute_child_workflow(ThirdChild, args={})
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("ParentWorkflow")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("ParentWorkflow")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 3
-        assert detector.child_calls[0].workflow_name == "FirstChild"
-        assert detector.child_calls[1].workflow_name == "SecondChild"
-        assert detector.child_calls[2].workflow_name == "ThirdChild"
+        assert len(child_detector.child_calls) == 3
+        assert child_detector.child_calls[0].workflow_name == "FirstChild"
+        assert child_detector.child_calls[1].workflow_name == "SecondChild"
+        assert child_detector.child_calls[2].workflow_name == "ThirdChild"
 
-    def test_ignore_non_child_workflow_calls(self) -> None:
+    def test_ignore_non_child_workflow_calls(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that non-execute_child_workflow calls are ignored."""
         source = """
 result = await workflow.execute_activity(my_activity, args={})
 result = await workflow.start_child_workflow(Child, args={})
 result = await other.execute_child_workflow(Child, args={})
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("ParentWorkflow")
-        detector.visit(tree)
+        # The substring is present, so the source must go through full detection
+        assert not ChildWorkflowDetector.quick_reject(source)
+
+        tree = _parse(source)
+        child_detector.set_parent_workflow("ParentWorkflow")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 0
+        assert len(child_detector.child_calls) == 0
 
 
 class TestChildWorkflowNameExtraction:
     """Tests for child workflow name extraction."""
 
-    def test_class_reference_extraction(self) -> None:
-        """Test extraction of workflow name from class reference."""
-        source = "workflow.execute_child_workflow(MyChildWorkflow)"
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
-
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "MyChildWorkflow"
-
-    def test_string_literal_extraction(self) -> None:
-        """Test extraction of workflow name from string literal."""
-        source = 'workflow.execute_child_workflow("MyChildWorkflow")'
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+    @pytest.mark.parametrize(("source", "expected", "mode"), _SINGLE_CHILD_CASES)
+    def test_single_child_workflow_name(
+        self, child_detector: ChildWorkflowDetector, source: str, expected: str, mode: str
+    ) -> None:
+        """Test that exactly one child call is detected, wherever it is nested."""
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(_parse(source, mode=mode))
 
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "MyChildWorkflow"
+        assert [call.workflow_name for call in child_detector.child_calls] == [expected]
 
-    def test_missing_workflow_argument_error(self) -> None:
+    def test_missing_workflow_argument_error(self, child_detector: ChildWorkflowDetector) -> None:
         """Test error when workflow argument is missing."""
-        source = "workflow.execute_child_workflow()"
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
+        source = _SNIPPETS["child_call_no_args"]
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
 
         with pytest.raises(WorkflowParseError) as exc_info:
-            detector.visit(tree)
+            child_detector.visit(tree)
 
         error_msg = str(exc_info.value)
         assert "at least 1 argument" in error_msg.lower()
 
-    def test_invalid_workflow_argument_type_error(self) -> None:
+    def test_invalid_workflow_argument_type_error(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test error when workflow argument is not class or string."""
-        source = "workflow.execute_child_workflow(123)"
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
+        source = _SNIPPETS["child_call_int_arg"]
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
 
         with pytest.raises(WorkflowParseError) as exc_info:
-            detector.visit(tree)
+            child_detector.visit(tree)
 
         error_msg = str(exc_info.value)
         assert "class reference or string" in error_msg.lower()
@@ -1065,7 +1292,7 @@ class TestChildWorkflowNameExtraction:
 class TestChildWorkflowMetadata:
     """Tests for child workflow call metadata."""
 
-    def test_call_site_line_number(self) -> None:
+    def test_call_site_line_number(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that call site line numbers are recorded correctly."""
         source = """
 
@@ -1074,65 +1301,62 @@ result1 = await workflow.execute_child_workflow(Child1)
 
 result2 = await workflow.execute_child_workflow(Child2)
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 2
-        assert detector.child_calls[0].call_site_line == 3
-        assert detector.child_calls[1].call_site_line == 6
+        assert len(child_detector.child_calls) == 2
+        assert child_detector.child_calls[0].call_site_line == 3
+        assert child_detector.child_calls[1].call_site_line == 6
 
-    def test_call_id_generation_deterministic(self) -> None:
+    def test_call_id_generation_deterministic(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that call IDs are deterministic based on name and line."""
         source = """
 await workflow.execute_child_workflow(MyChild)
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 1
-        call = detector.child_calls[0]
+        assert len(child_detector.child_calls) == 1
+        call = child_detector.child_calls[0]
         assert call.call_id == f"child_mychild_{call.call_site_line}"
 
-    def test_call_id_handles_spaces(self) -> None:
+    def test_call_id_handles_spaces(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that call IDs handle workflow names with spaces."""
         source = 'workflow.execute_child_workflow("My Child Workflow")'
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 1
-        assert "my_child_workflow" in detector.child_calls[0].call_id
+        assert len(child_detector.child_calls) == 1
+        assert "my_child_workflow" in child_detector.child_calls[0].call_id
 
-    def test_parent_workflow_recorded(self) -> None:
+    def test_parent_workflow_recorded(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that parent workflow name is recorded in each call."""
         source = """
 result1 = await workflow.execute_child_workflow(Child1)
 result2 = await workflow.execute_child_workflow(Child2)
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("ParentWorkflowName")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("ParentWorkflowName")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 2
-        assert detector.child_calls[0].parent_workflow == "ParentWorkflowName"
-        assert detector.child_calls[1].parent_workflow == "ParentWorkflowName"
+        assert len(child_detector.child_calls) == 2
+        assert child_detector.child_calls[0].parent_workflow == "ParentWorkflowName"
+        assert child_detector.child_calls[1].parent_workflow == "ParentWorkflowName"
 
-    def test_child_workflow_call_dataclass_fields(self) -> None:
+    def test_child_workflow_call_dataclass_fields(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test that ChildWorkflowCall has all required fields."""
         source = 'workflow.execute_child_workflow(TestChild)'
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 1
-        call = detector.child_calls[0]
+        assert len(child_detector.child_calls) == 1
+        call = child_detector.child_calls[0]
 
         # Verify all fields exist and have correct types
         assert isinstance(call.workflow_name, str)
@@ -1150,67 +1374,18 @@ result2 = await workflow.execute_child_workflow(Child2)
 class TestChildWorkflowNestedDetection:
     """Tests for child workflow detection in nested code structures."""
 
-    def test_child_workflow_in_if_block(self) -> None:
-        """Test detection of child workflow call inside if block."""
-        source = """
-if condition:
-    result = await workflow.execute_child_workflow(ChildWorkflow)
-"""
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
-
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "ChildWorkflow"
-
-    def test_child_workflow_in_else_block(self) -> None:
-        """Test detection of child workflow call inside else block."""
-        source = """
-if condition:
-    pass
-else:
-    result = await workflow.execute_child_workflow(ChildWorkflow)
-"""
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
-
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "ChildWorkflow"
-
-    def test_child_workflow_in_for_loop(self) -> None:
-        """Test detection of child workflow call inside for loop."""
-        source = """
-for item in items:
-    result = await workflow.execute_child_workflow(ChildWorkflow)
-"""
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
-
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "ChildWorkflow"
-
-    def test_deeply_nested_child_workflow(self) -> None:
-        """Test detection of child workflow in deeply nested structure."""
-        source = """
-if outer:
-    if inner1:
-        if inner2:
-            result = await workflow.execute_child_workflow(DeepChild)
-"""
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+    def test_deep_tree_does_not_exhaust_stack(self, child_detector: ChildWorkflowDetector) -> None:
+        """Test that child calls are found in trees deeper than the recursion limit."""
+        deep_expr = " + ".join(["a"] * 800)
+        source = f"total = {deep_expr}\nresult = await workflow.execute_child_workflow(DeepChild)\n"
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(_parse(source))
 
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "DeepChild"
+        assert [call.workflow_name for call in child_detector.child_calls] == ["DeepChild"]
 
-    def test_multiple_child_workflows_different_blocks(self) -> None:
+    def test_multiple_child_workflows_different_blocks(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test detection of multiple child workflows in different blocks."""
         source = """
 if condition1:
@@ -1221,31 +1396,28 @@ else:
 for item in items:
     result3 = await workflow.execute_child_workflow(Child3)
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
-        assert len(detector.child_calls) == 3
-        assert detector.child_calls[0].workflow_name == "Child1"
-        assert detector.child_calls[1].workflow_name == "Child2"
-        assert detector.child_calls[2].workflow_name == "Child3"
+        assert len(child_detector.child_calls) == 3
+        assert child_detector.child_calls[0].workflow_name == "Child1"
+        assert child_detector.child_calls[1].workflow_name == "Child2"
+        assert child_detector.child_calls[2].workflow_name == "Child3"
 
 
 class TestChildWorkflowDetectorProperty:
     """Tests for ChildWorkflowDetector property."""
 
-    def test_child_calls_property_returns_list(self) -> None:
+    def test_child_calls_property_returns_list(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that child_calls property returns list."""
-        detector = ChildWorkflowDetector()
-        assert isinstance(detector.child_calls, list)
-        assert len(detector.child_calls) == 0
+        assert isinstance(child_detector.child_calls, list)
+        assert len(child_detector.child_calls) == 0
 
-    def test_child_calls_property_read_only(self) -> None:
+    def test_child_calls_property_read_only(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that child_calls property cannot be reassigned."""
-        detector = ChildWorkflowDetector()
         with pytest.raises(AttributeError):
-            detector.child_calls = []  # type: ignore
+            child_detector.child_calls = []  # type: ignore
 
 
 class TestChildWorkflowEdgeCases:
@@ -1269,8 +1441,8 @@ class TestChildWorkflowEdgeCases:
         source1 = "workflow.execute_child_workflow(Child1)"
         source2 = "workflow.execute_child_workflow(Child2)"
 
-        tree1 = ast.parse(source1, mode="eval")
-        tree2 = ast.parse(source2, mode="eval")
+        tree1 = _parse(source1, mode="eval")
+        tree2 = _parse(source2, mode="eval")
 
         detector1 = ChildWorkflowDetector()
         detector1.set_parent_workflow("Parent1")
@@ -1290,87 +1462,87 @@ class TestChildWorkflowEdgeCases:
         assert detector1.child_calls[0].workflow_name == "Child1"
         assert detector1.child_calls[0].parent_workflow == "Parent1"
 
-    def test_set_parent_workflow_updates_context(self) -> None:
+    def test_set_parent_workflow_updates_context(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test that set_parent_workflow updates parent context."""
         source = "workflow.execute_child_workflow(Child)"
-        tree = ast.parse(source, mode="eval")
+        tree = _parse(source, mode="eval")
 
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("FirstParent")
-        detector.visit(tree)
+        child_detector.set_parent_workflow("FirstParent")
+        child_detector.visit(tree)
 
-        assert detector.child_calls[0].parent_workflow == "FirstParent"
+        assert child_detector.child_calls[0].parent_workflow == "FirstParent"
 
-    def test_attribute_access_non_workflow_object(self) -> None:
+    def test_attribute_access_non_workflow_object(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test that execute_child_workflow on non-workflow object is ignored."""
         source = """
 other_object.execute_child_workflow(Child)
 obj.execute_child_workflow(Child)
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
         # Should not detect any child workflow calls
-        assert len(detector.child_calls) == 0
+        assert len(child_detector.child_calls) == 0
 
-    def test_child_workflow_in_function_call_argument(self) -> None:
+    def test_child_workflow_in_function_call_argument(
+        self, child_detector: ChildWorkflowDetector
+    ) -> None:
         """Test detection when execute_child_workflow is nested in another call."""
         source = """
 some_function(await workflow.execute_child_workflow(Child))
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
-        detector.visit(tree)
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
+        child_detector.visit(tree)
 
         # Should detect the nested execute_child_workflow call
-        assert len(detector.child_calls) == 1
-        assert detector.child_calls[0].workflow_name == "Child"
+        assert len(child_detector.child_calls) == 1
+        assert child_detector.child_calls[0].workflow_name == "Child"
 
 
 class TestChildWorkflowErrorMessages:
     """Tests for child workflow detection error messages."""
 
-    def test_error_includes_line_number(self) -> None:
+    def test_error_includes_line_number(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that error messages include line number."""
         source = """# Line 1
 # Line 2
 workflow.execute_child_workflow()  # Line 3 - missing workflow arg
 """
-        tree = ast.parse(source)
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
+        tree = _parse(source)
+        child_detector.set_parent_workflow("Parent")
 
         with pytest.raises(WorkflowParseError) as exc_info:
-            detector.visit(tree)
+            child_detector.visit(tree)
 
         assert "Line 3" in str(exc_info.value)
 
-    def test_error_includes_suggestion(self) -> None:
+    def test_error_includes_suggestion(self, child_detector: ChildWorkflowDetector) -> None:
         """Test that error messages include helpful suggestions."""
-        source = "workflow.execute_child_workflow()"
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
+        source = _SNIPPETS["child_call_no_args"]
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
 
         with pytest.raises(WorkflowParseError) as exc_info:
-            detector.visit(tree)
+            child_detector.visit(tree)
 
         error_msg = str(exc_info.value).lower()
         assert "execute_child_workflow" in error_msg
         assert "at least 1 argument" in error_msg
 
-    def test_error_for_wrong_argument_type(self) -> None:
+    def test_error_for_wrong_argument_type(self, child_detector: ChildWorkflowDetector) -> None:
         """Test error message for wrong argument type."""
-        source = "workflow.execute_child_workflow(123)"
-        tree = ast.parse(source, mode="eval")
-        detector = ChildWorkflowDetector()
-        detector.set_parent_workflow("Parent")
+        source = _SNIPPETS["child_call_int_arg"]
+        tree = _parse(source, mode="eval")
+        child_detector.set_parent_workflow("Parent")
 
         with pytest.raises(WorkflowParseError) as exc_info:
-            detector.visit(tree)
+            child_detector.visit(tree)
 
         error_msg = str(exc_info.value).lower()
         assert "class reference or string" in error_msg
@@ -1396,7 +1568,7 @@ class OrderWorkflow:
         handle = workflow.get_external_workflow_handle("shipping-123")
         await handle.signal("ship_order", order_data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1415,7 +1587,7 @@ class OrderWorkflow:
         source = """
 handle = await workflow.get_external_workflow_handle("inventory-456").signal("check_stock", product_id)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("CheckoutWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1437,7 +1609,7 @@ await handle1.signal("ship_order", order_data)
 handle2 = workflow.get_external_workflow_handle("payment-456")
 await handle2.signal("process_payment", payment_data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1457,7 +1629,7 @@ handle = workflow.get_external_workflow_handle("shipping-123")
 await handle.signal("ship_order", order_data)
 await handle.signal("update_tracking", tracking_data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1480,7 +1652,7 @@ class TestExternalSignalDetectorPatternExtraction:
 handle = workflow.get_external_workflow_handle(f"shipping-{order_id}")
 await handle.signal("ship_order", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1496,7 +1668,7 @@ await handle.signal("ship_order", data)
 handle = workflow.get_external_workflow_handle(f"ship-{region}-{order_id}")
 await handle.signal("ship", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1512,7 +1684,7 @@ await handle.signal("ship", data)
 handle = workflow.get_external_workflow_handle(workflow_id)
 await handle.signal("notify", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1528,7 +1700,7 @@ await handle.signal("notify", data)
 handle = workflow.get_external_workflow_handle(compute_workflow_id())
 await handle.signal("notify", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1546,7 +1718,7 @@ await handle.signal("notify", data)
 handle = workflow.get_external_workflow_handle(prefix + suffix)
 await handle.signal("notify", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1568,7 +1740,7 @@ if condition:
     handle = workflow.get_external_workflow_handle("shipping-123")
     await handle.signal("ship_order", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1585,7 +1757,7 @@ for item in items:
     handle = workflow.get_external_workflow_handle(f"process-{item}")
     await handle.signal("process", item)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("BatchWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1598,11 +1770,8 @@ for item in items:
 
     def test_external_signals_property_returns_list(self) -> None:
         """Test external_signals property returns list."""
-        source = """
-handle = workflow.get_external_workflow_handle("test-123")
-await handle.signal("test_signal", data)
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["external_signal_test_123"]
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("TestWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1614,11 +1783,8 @@ await handle.signal("test_signal", data)
 
     def test_external_signals_property_immutable(self) -> None:
         """Test modifying returned list doesn't affect detector internal state."""
-        source = """
-handle = workflow.get_external_workflow_handle("test-123")
-await handle.signal("test_signal", data)
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["external_signal_test_123"]
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("TestWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1631,11 +1797,8 @@ await handle.signal("test_signal", data)
 
     def test_detector_reuse_creates_fresh_state(self) -> None:
         """Test creating two detector instances have independent state."""
-        source = """
-handle = workflow.get_external_workflow_handle("test-123")
-await handle.signal("test_signal", data)
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["external_signal_test_123"]
+        tree = _parse(source)
 
         detector1 = ExternalSignalDetector()
         detector1.set_source_workflow("Workflow1")
@@ -1662,7 +1825,7 @@ class TestExternalSignalDetectorNodeIdFormat:
 handle = workflow.get_external_workflow_handle("test-123")
 await handle.signal("ship_order", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1678,7 +1841,7 @@ await handle.signal("ship_order", data)
 handle = workflow.get_external_workflow_handle("test-123")
 await handle.signal("Ship Order Now", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1694,7 +1857,7 @@ await handle.signal("Ship Order Now", data)
 handle = workflow.get_external_workflow_handle("test-123")
 await handle.signal("ShipOrder", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1710,11 +1873,8 @@ class TestExternalSignalDetectorSourceWorkflowContext:
 
     def test_source_workflow_context_stored(self) -> None:
         """Test source workflow is stored in ExternalSignalCall."""
-        source = """
-handle = workflow.get_external_workflow_handle("test-123")
-await handle.signal("test_signal", data)
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["external_signal_test_123"]
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("WorkflowA")
         detector.set_file_path(Path("workflow.py"))
@@ -1734,7 +1894,7 @@ class TestExternalSignalDetectorErrorHandling:
 handle = workflow.get_external_workflow_handle("test-123")
 await handle.signal()
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1753,7 +1913,7 @@ await handle.signal()
 handle = workflow.get_external_workflow_handle("test-123")
 await handle.signal(123, data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1771,7 +1931,7 @@ await handle.signal(123, data)
 other_var = some_object()
 await other_var.signal("test", data)
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = ExternalSignalDetector()
         detector.set_source_workflow("OrderWorkflow")
         detector.set_file_path(Path("workflow.py"))
@@ -1791,16 +1951,8 @@ class TestSignalHandlerDetectorBasic:
 
     def test_detect_async_signal_handler(self) -> None:
         """Test detection of @workflow.signal decorated async method."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class ShippingWorkflow:
-    @workflow.signal
-    async def ship_order(self, order_id: str) -> None:
-        self.should_ship = True
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["shipping_ship_order_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("ShippingWorkflow")
         detector.visit(tree)
@@ -1823,7 +1975,7 @@ class ShippingWorkflow:
     def ship_order(self, order_id: str) -> None:
         self.should_ship = True
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("ShippingWorkflow")
         detector.visit(tree)
@@ -1852,7 +2004,7 @@ class OrderWorkflow:
     def update_status(self, status: str) -> None:
         self.status = status
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("OrderWorkflow")
         detector.visit(tree)
@@ -1881,7 +2033,7 @@ class MyWorkflow:
     async def helper_method(self) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("MyWorkflow")
         detector.visit(tree)
@@ -1904,7 +2056,7 @@ class ShippingWorkflow:
     async def handler(self, data: str) -> None:
         self.data = data
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("ShippingWorkflow")
         detector.visit(tree)
@@ -1916,16 +2068,8 @@ class ShippingWorkflow:
 
     def test_detect_method_name_as_signal_name(self) -> None:
         """Test method name used as signal name when no explicit name provided."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class ShippingWorkflow:
-    @workflow.signal
-    async def ship_order(self, order_id: str) -> None:
-        self.should_ship = True
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["shipping_ship_order_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("ShippingWorkflow")
         detector.visit(tree)
@@ -1946,7 +2090,7 @@ class TestWorkflow:
     async def receive_data(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -1966,7 +2110,7 @@ class TestWorkflow:
     async def receive_data(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -1990,7 +2134,7 @@ class TestWorkflow:
     async def handler2(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2017,7 +2161,7 @@ class MyWorkflow:
     async def receive_data(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("MyWorkflow")
         detector.visit(tree)
@@ -2028,16 +2172,8 @@ class MyWorkflow:
 
     def test_source_line_recorded(self) -> None:
         """Test that source line number is recorded correctly."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def handler(self, data: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2048,16 +2184,8 @@ class TestWorkflow:
 
     def test_node_id_format(self) -> None:
         """Test node ID format: sig_handler_{signal_name}_{line}."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def ship_order(self, order_id: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_ship_order_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2077,7 +2205,7 @@ class TestWorkflow:
     async def handler(self, order_id: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2098,7 +2226,7 @@ class TestWorkflow:
     async def handler(self, order_id: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2109,16 +2237,8 @@ class TestWorkflow:
 
     def test_signal_handler_dataclass_fields(self) -> None:
         """Test that SignalHandler has all required fields."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def ship_order(self, order_id: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_ship_order_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2153,16 +2273,8 @@ class TestSignalHandlerProperty:
 
     def test_handlers_property_immutable(self) -> None:
         """Test modifying returned list doesn't affect internal state."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def handler(self, data: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_handler"]
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2201,7 +2313,7 @@ class TestWorkflow:
     async def handler(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2221,7 +2333,7 @@ class OuterWorkflow:
     async def outer_handler(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("OuterWorkflow")
         detector.visit(tree)
@@ -2246,7 +2358,7 @@ class TestWorkflow:
     ) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("TestWorkflow")
         detector.visit(tree)
@@ -2275,8 +2387,8 @@ class Workflow2:
     async def handler2(self, data: str) -> None:
         pass
 """
-        tree1 = ast.parse(source1)
-        tree2 = ast.parse(source2)
+        tree1 = _parse(source1)
+        tree2 = _parse(source2)
 
         detector1 = SignalHandlerDetector()
         detector1.set_workflow_class("Workflow1")
@@ -2311,16 +2423,8 @@ class Workflow2:
 
     def test_set_workflow_class_updates_context(self) -> None:
         """Test that set_workflow_class updates workflow context."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def handler(self, data: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_handler"]
+        tree = _parse(source)
 
         detector = SignalHandlerDetector()
         detector.set_workflow_class("FirstWorkflow")
@@ -2330,16 +2434,8 @@ class TestWorkflow:
 
     def test_empty_workflow_class_context(self) -> None:
         """Test detection works with empty workflow class context."""
-        source = """
-from temporalio import workflow
-
-@workflow.defn
-class TestWorkflow:
-    @workflow.signal
-    async def handler(self, data: str) -> None:
-        pass
-"""
-        tree = ast.parse(source)
+        source = _SNIPPETS["test_workflow_handler"]
+        tree = _parse(source)
 
         detector = SignalHandlerDetector()
         # Not calling set_workflow_class
@@ -2358,7 +2454,7 @@ from temporalio import workflow
 async def standalone_handler(data: str) -> None:
     pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
         detector = SignalHandlerDetector()
         detector.set_workflow_class("")
         detector.visit(tree)
@@ -2385,7 +2481,7 @@ class WorkflowB:
     async def handler_b(self, data: str) -> None:
         pass
 """
-        tree = ast.parse(source)
+        tree = _parse(source)
 
         # Single detector finds all handlers (workflow class context set externally)
         detector = SignalHandlerDetector()
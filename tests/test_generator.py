@@ -25,12 +25,6 @@ def generator() -> PathPermutationGenerator:
     return PathPermutationGenerator()
 
 
-@pytest.fixture
-def default_context() -> GraphBuildingContext:
-    """Create a GraphBuildingContext with default settings."""
-    return GraphBuildingContext()
-
-
 @pytest.fixture
 def custom_context() -> GraphBuildingContext:
     """Create a GraphBuildingContext with custom labels."""
@@ -1079,3 +1073,63 @@ def test_signal_permutation_performance() -> None:
     
     assert len(paths) == 32, "5 signals should generate 32 paths"
     assert elapsed < 1.0, f"Path generation should complete in <1s, took {elapsed:.3f}s"
+
+
+def test_branch_activities_filtered_per_permutation() -> None:
+    """Verify activities inside decision/signal branches only appear on matching paths.
+
+    Branch membership is precomputed once per workflow, so each permutation must
+    still include exactly the activities whose enclosing branches it took.
+    """
+    from temporalio_graphs._internal.graph_models import SignalPoint
+
+    metadata = WorkflowMetadata(
+        workflow_class="TestWorkflow",
+        workflow_run_method="run",
+        activities=[
+            Activity("Always", 10),
+            Activity("OnYes", 21),
+            Activity("OnNo", 22),
+            Activity("OnSignaled", 31),
+            Activity("OnTimeout", 32),
+            Activity("Finally", 40),
+        ],
+        decision_points=[
+            DecisionPoint(
+                id="d0",
+                name="NeedApproval",
+                line_number=20,
+                line_num=20,
+                true_label="yes",
+                false_label="no",
+                true_branch_activities=(21,),
+                false_branch_activities=(22,),
+            )
+        ],
+        signal_points=[
+            SignalPoint(
+                name="WaitApproval",
+                condition_expr="lambda: approved",
+                timeout_expr="timedelta(hours=24)",
+                source_line=30,
+                node_id="sig_waitapproval_30",
+                signaled_branch_activities=(31,),
+                timeout_branch_activities=(32,),
+            )
+        ],
+        source_file=Path("workflow.py"),
+        total_paths=4,
+    )
+
+    paths = PathPermutationGenerator().generate_paths(metadata, GraphBuildingContext())
+
+    activities_by_path = {
+        path.path_id: [step.name for step in path.steps if step.node_type == "activity"]
+        for path in paths
+    }
+    assert activities_by_path == {
+        "path_0b00": ["Always", "OnNo", "OnTimeout", "Finally"],
+        "path_0b01": ["Always", "OnNo", "OnSignaled", "Finally"],
+        "path_0b10": ["Always", "OnYes", "OnTimeout", "Finally"],
+        "path_0b11": ["Always", "OnYes", "OnSignaled", "Finally"],
+    }
@@ -1,11 +1,15 @@
 """Unit tests for internal graph models."""
 
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, fields
 from pathlib import Path
 
 import pytest
 
 from temporalio_graphs._internal.graph_models import (
+    _NODE_BRACKETS,
+    Activity,
+    ChildWorkflowCall,
+    DecisionPoint,
     ExternalSignalCall,
     GraphEdge,
     GraphNode,
@@ -13,7 +17,9 @@ from temporalio_graphs._internal.graph_models import (
     PeerSignalGraph,
     SignalConnection,
     SignalHandler,
+    SignalPoint,
     WorkflowMetadata,
+    _render_node,
 )
 
 
@@ -68,6 +74,22 @@ def test_graph_node_to_mermaid_external_signal() -> None:
     assert node.to_mermaid() == "ext_sig_ship_order_50[/Signal 'ship_order'\\]"
 
 
+def test_graph_node_brackets_cover_every_node_type() -> None:
+    """Every NodeType has a bracket pair, so to_mermaid never falls through."""
+    assert set(_NODE_BRACKETS) == set(NodeType)
+
+
+def test_graph_node_render_is_memoized() -> None:
+    """Equal nodes share one rendered fragment instead of re-formatting it."""
+    node = GraphNode("1", NodeType.ACTIVITY, "Validate Input")
+    _render_node.cache_clear()
+    first = node.to_mermaid()
+    second = GraphNode("1", NodeType.ACTIVITY, "Validate Input", source_line=42).to_mermaid()
+    assert first == "1[Validate Input]"
+    assert second is first
+    assert _render_node.cache_info().hits == 1
+
+
 def test_graph_edge_to_mermaid_no_label() -> None:
     """GraphEdge without label renders as simple arrow."""
     edge = GraphEdge("s", "1", None)
@@ -221,6 +243,65 @@ def test_workflow_metadata_signal_handlers_immutable() -> None:
     assert not hasattr(metadata.signal_handlers, "append")
 
 
+@pytest.mark.parametrize(
+    "instance",
+    [
+        Activity(name="withdraw_funds", line_num=35),
+        DecisionPoint(
+            id="d0",
+            name="HighValue",
+            line_number=42,
+            line_num=42,
+            true_label="yes",
+            false_label="no",
+        ),
+        SignalPoint(
+            name="WaitForApproval",
+            condition_expr="lambda: self.approved",
+            timeout_expr="timedelta(hours=24)",
+            source_line=67,
+            node_id="sig_waitforapproval_67",
+        ),
+        ChildWorkflowCall(
+            workflow_name="ChildWorkflow",
+            call_site_line=45,
+            call_id="child_childworkflow_45",
+            parent_workflow="ParentWorkflow",
+        ),
+        ExternalSignalCall(
+            signal_name="ship_order",
+            target_workflow_pattern="shipping-{*}",
+            source_line=56,
+            node_id="ext_sig_ship_order_56",
+            source_workflow="OrderWorkflow",
+        ),
+        SignalConnection(
+            sender_workflow="OrderWorkflow",
+            receiver_workflow="ShippingWorkflow",
+            signal_name="ship_order",
+            sender_line=56,
+            receiver_line=67,
+            sender_node_id="ext_sig_ship_order_56",
+            receiver_node_id="sig_handler_ship_order_67",
+        ),
+        SignalHandler(
+            signal_name="process",
+            method_name="process",
+            workflow_class="TestWorkflow",
+            source_line=10,
+            node_id="sig_handler_process_10",
+        ),
+    ],
+    ids=lambda instance: type(instance).__name__,
+)
+def test_detected_elements_use_slots(instance: object) -> None:
+    """Per-element metadata carries no per-instance __dict__ and stays frozen."""
+    assert not hasattr(instance, "__dict__")
+    first_field = fields(instance)[0].name  # type: ignore[arg-type]
+    with pytest.raises(FrozenInstanceError):
+        setattr(instance, first_field, None)
+
+
 # =============================================================================
 # SignalConnection Tests
 # =============================================================================
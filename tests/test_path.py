@@ -2,7 +2,7 @@
 
 import pytest
 
-from temporalio_graphs.path import GraphPath, PathStep
+from temporalio_graphs.path import GraphPath, PathStep, child_workflow_node_id
 
 
 def test_add_activity() -> None:
@@ -90,3 +90,40 @@ def test_path_steps_tracking() -> None:
     assert path.steps[1].name == "CurrencyConvert"
     assert path.steps[2].name == "Deposit"
     assert all(step.node_type == 'activity' for step in path.steps)
+
+
+def test_path_step_frozen_and_hashable() -> None:
+    """PathStep is immutable, slotted, and usable as a dict/set key."""
+    step = PathStep('child_workflow', 'PaymentWorkflow', line_number=45)
+
+    with pytest.raises(AttributeError):
+        step.name = "Other"  # type: ignore[misc]
+
+    assert not hasattr(step, "__dict__")
+    assert {step, PathStep('child_workflow', 'PaymentWorkflow', line_number=45)} == {step}
+
+
+def test_deterministic_node_ids_are_interned() -> None:
+    """Child workflow and external signal IDs share one object across paths."""
+    path_a = GraphPath(path_id="path_0")
+    path_b = GraphPath(path_id="path_1")
+
+    assert path_a.add_child_workflow("PaymentWorkflow", 45) is path_b.add_child_workflow(
+        "PaymentWorkflow", 45
+    )
+    assert path_a.add_external_signal("ship_order", "shipping-{*}", 50) is (
+        path_b.add_external_signal("ship_order", "shipping-{*}", 50)
+    )
+
+
+def test_child_workflow_node_id_memoized() -> None:
+    """Child workflow IDs are lowercased once per (name, line) and reused."""
+    child_workflow_node_id.cache_clear()
+
+    first = child_workflow_node_id("WorkflowA", 10)
+    second = child_workflow_node_id("WorkflowA", 10)
+
+    assert first == "child_workflowa_10"
+    assert first is second
+    assert child_workflow_node_id("WorkflowA", 30) == "child_workflowa_30"
+    assert child_workflow_node_id.cache_info().hits == 1
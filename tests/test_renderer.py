@@ -13,19 +13,12 @@ import pytest
 
 from temporalio_graphs.context import GraphBuildingContext
 from temporalio_graphs.path import GraphPath
-from temporalio_graphs.renderer import MermaidRenderer
-
-
-@pytest.fixture
-def renderer() -> MermaidRenderer:
-    """Create a MermaidRenderer instance for testing."""
-    return MermaidRenderer()
-
-
-@pytest.fixture
-def default_context() -> GraphBuildingContext:
-    """Create a GraphBuildingContext with default settings."""
-    return GraphBuildingContext()
+from temporalio_graphs.renderer import (
+    MermaidRenderer,
+    RenderStats,
+    _render_cached,
+    _split_words,
+)
 
 
 @pytest.fixture
@@ -294,6 +287,50 @@ def test_to_mermaid_edge_deduplication(
     assert two_to_e == 1, "Edge 2 --> e should appear exactly once"
 
 
+def test_to_mermaid_memoizes_identical_inputs(
+    renderer: MermaidRenderer, default_context: GraphBuildingContext
+) -> None:
+    """Verify repeat renders of equal (paths, context) inputs hit the render cache."""
+    _render_cached.cache_clear()
+
+    def build_path() -> GraphPath:
+        path = GraphPath(path_id="path_0")
+        path.add_activity("Activity1")
+        path.add_decision("d0", True, "HighValue")
+        path.add_activity("Activity2")
+        return path
+
+    first = renderer.to_mermaid([build_path()], default_context)
+    second = MermaidRenderer().to_mermaid([build_path()], GraphBuildingContext())
+
+    assert first == second
+    info = _render_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    # A context option that changes output must not reuse the cached entry
+    relabeled = renderer.to_mermaid(
+        [build_path()], GraphBuildingContext(decision_true_label="Y")
+    )
+    assert "-- Y -->" in relabeled
+    assert _render_cached.cache_info().misses == 2
+
+
+def test_to_mermaid_dispatches_to_subclass_render(default_context: GraphBuildingContext) -> None:
+    """Verify subclasses overriding _render_paths bypass the shared render cache."""
+
+    class CustomRenderer(MermaidRenderer):
+        def _render_paths(
+            self, paths: list[GraphPath], context: GraphBuildingContext
+        ) -> tuple[str, RenderStats]:
+            return "X", RenderStats(0, 0, len(paths))
+
+    path = GraphPath(path_id="path_0")
+    path.add_activity("Activity1")
+    MermaidRenderer().to_mermaid([path], default_context)
+
+    assert CustomRenderer().to_mermaid([path], default_context) == "X"
+
+
 # Test AC7: Word splitting for camelCase names
 def test_to_mermaid_word_splitting_enabled(
     renderer: MermaidRenderer, split_context: GraphBuildingContext
@@ -351,6 +388,48 @@ def test_to_mermaid_word_splitting_edge_cases(
     assert "CamelCase[Camel Case]" in result  # camelCase split
 
 
+def test_to_mermaid_return_stats(
+    renderer: MermaidRenderer, default_context: GraphBuildingContext
+) -> None:
+    """Verify return_stats reports unique node, edge, and path counts."""
+    paths = []
+    for value in (True, False):
+        path = GraphPath(path_id=f"path_{int(value)}")
+        path.add_activity("Withdraw")
+        path.add_decision("d0", value, "HighValue")
+        path.add_activity("Deposit")
+        paths.append(path)
+
+    text, stats = renderer.to_mermaid(paths, default_context, return_stats=True)
+
+    assert text == renderer.to_mermaid(paths, default_context)
+    # s, Withdraw, d0, Deposit, e
+    assert stats.n_nodes == 5
+    # s->Withdraw, Withdraw->d0, d0-yes->Deposit, d0-no->Deposit, Deposit->e
+    assert stats.n_edges == 5
+    assert stats.n_paths == 2
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("withdrawFunds", "withdraw Funds"),
+        ("ProcessOrderWorkflow", "Process Order Workflow"),
+        ("aBcD", "a Bc D"),
+        ("HTTPRequest", "HTTPRequest"),
+        ("Activity1", "Activity1"),
+        ("BEGIN", "BEGIN"),
+        ("withdraw_funds", "withdraw_funds"),
+        ("", ""),
+    ],
+)
+def test_split_words_matches_camel_case_boundaries(name: str, expected: str) -> None:
+    """Verify the memoized splitter inserts spaces only at lower-to-upper transitions."""
+    assert _split_words(name) == expected
+    # Second call is served from the cache and must agree
+    assert _split_words(name) == expected
+
+
 # Test AC8: Path iteration and node sequence extraction
 def test_to_mermaid_empty_workflow(
     renderer: MermaidRenderer, default_context: GraphBuildingContext
@@ -1174,8 +1253,7 @@ def test_external_signal_with_decisions(
     result = renderer.to_mermaid([path], default_context)
 
     # Verify decision node appears
-    assert "d0{InStock}" in result or "d0{In Stock}" in result, \
-        "Decision node should render"
+    assert "d0{In Stock}" in result, "Decision node should render"
 
     # Verify external signal appears
     assert "ext_sig_notify_warehouse_75" in result, \
@@ -2132,3 +2210,20 @@ def test_render_signal_graph_no_unresolved(
     # Connection should still render
     assert "ext_sig_ship_order_56_OrderWorkflow -.ship_order.-> sig_handler_ship_order_67" in result, \
         "Connection should still render even without unresolved signals"
+
+
+def test_to_mermaid_stream_writes_same_diagram(
+    renderer: MermaidRenderer, default_context: GraphBuildingContext, tmp_path: Path
+) -> None:
+    """Verify streamed output matches to_mermaid() and reports matching stats."""
+    path = GraphPath(path_id="path_0")
+    path.add_activity("Withdraw")
+    path.add_child_workflow("PaymentWorkflow", 45)
+    path.add_activity("Deposit")
+    output_file = tmp_path / "nested" / "diagram.md"
+
+    stats = renderer.to_mermaid_stream([path], default_context, output_file)
+
+    text, expected_stats = renderer.to_mermaid([path], default_context, return_stats=True)
+    assert output_file.read_bytes() == (text + "\n").encode("utf-8")
+    assert stats == expected_stats